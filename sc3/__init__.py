@@ -46,12 +46,20 @@ def _init_logger(verbosity, blocking=False):
 
 _libsc3_initialized = False
 
+# Set for spawned worker processes, they import __main__ before running
+# their initializer so a top level init() call must not start RtMain.
+_NRT_WORKER_ENV = 'SC3_NRT_WORKER'
+
 def init(mode='rt', verbosity='INFO'):
     global _libsc3_initialized
 
     if _libsc3_initialized:
         return
 
+    import os
+    if os.environ.get(_NRT_WORKER_ENV):
+        mode, verbosity = 'nrt', 'WARNING'
+
     mode = mode.lower()
     _init_logger(verbosity, True if mode == 'nrt' else False)
 
@@ -66,3 +74,26 @@ def init(mode='rt', verbosity='INFO'):
 
     sc3.base.main.main._init()
     _libsc3_initialized = True
+
+
+### Worker processes ###
+
+def _init_worker():
+    init('nrt', 'WARNING')
+
+def _nrt_pool(processes):
+    # Spawned workers don't inherit the threads and sockets of this
+    # process, each one initializes the library in non real time mode.
+    import os
+    import multiprocessing
+
+    ctx = multiprocessing.get_context('spawn')
+    previous = os.environ.get(_NRT_WORKER_ENV)
+    os.environ[_NRT_WORKER_ENV] = '1'
+    try:
+        return ctx.Pool(processes, _init_worker)
+    finally:
+        if previous is None:
+            del os.environ[_NRT_WORKER_ENV]
+        else:
+            os.environ[_NRT_WORKER_ENV] = previous
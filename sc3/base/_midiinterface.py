@@ -1,5 +1,9 @@
 
 from abc import ABC, abstractmethod
+import collections.abc
+import heapq
+import itertools
+import logging
 import threading
 import pprint
 
@@ -13,7 +17,141 @@ from . import _hooks as hks
 mido = hks.import_optional_module('mido')
 
 
-__all__ = ['MidiRtInterface', 'MidiNrtInterface']
+_logger = logging.getLogger(__name__)
+
+
+__all__ = ['MidiRtInterface', 'MidiNrtInterface', 'MidiData']
+
+
+### Decoding ###
+
+# Status byte (without channel) -> (type, first field, second field).
+_CHANNEL_MSGS = {
+    0x80: ('note_off', 'note', 'velocity'),
+    0x90: ('note_on', 'note', 'velocity'),
+    0xA0: ('polytouch', 'note', 'value'),
+    0xB0: ('control_change', 'control', 'value'),
+    0xC0: ('program_change', 'program', None),
+    0xD0: ('aftertouch', 'value', None),
+    0xE0: ('pitchwheel', 'pitch', None),
+}
+
+_SYSTEM_MSGS = {
+    0xF0: ('sysex', 'data', None),
+    0xF1: ('quarter_frame', 'frame_type', 'frame_value'),
+    0xF2: ('songpos', 'pos', None),
+    0xF3: ('song_select', 'song', None),
+    0xF6: ('tune_request', None, None),
+    0xF8: ('clock', None, None),
+    0xFA: ('start', None, None),
+    0xFB: ('continue', None, None),
+    0xFC: ('stop', None, None),
+    0xFE: ('active_sensing', None, None),
+    0xFF: ('reset', None, None),
+}
+
+_FIELDS = {
+    type: (a, b) for type, a, b in (
+        *_CHANNEL_MSGS.values(), *_SYSTEM_MSGS.values())}
+
+_CHANNEL_TYPES = {type for type, _, _ in _CHANNEL_MSGS.values()}
+
+# Types indexed by (type, channel, number) in MidiFunc dispatch.
+_NUMBER_FIELDS = {
+    'note_off': 'note', 'note_on': 'note', 'polytouch': 'note',
+    'control_change': 'control', 'program_change': 'program'}
+
+
+class MidiData(collections.abc.Mapping):
+    '''Compact incoming MIDI message.
+
+    Values can be read as attributes or as a read only dict with the
+    same keys as mido's ``Message.dict()``, e.g. ``data.note`` or
+    ``data['note']``. The time value is the elapsed time of arrival.
+
+    '''
+
+    __slots__ = ('type', 'channel', '_a', '_b', 'time')
+
+    def __init__(self, type, channel=None, a=None, b=None, time=0.0):
+        self.type = type
+        self.channel = channel
+        self._a = a
+        self._b = b
+        self.time = time
+
+    @property
+    def number(self):
+        '''Note, control or program number, `None` for other types.'''
+        return self._a if self.type in _NUMBER_FIELDS else None
+
+    def __getitem__(self, key):
+        if key == 'type':
+            return self.type
+        if key == 'time':
+            return self.time
+        if key == 'channel' and self.channel is not None:
+            return self.channel
+        a, b = _FIELDS[self.type]
+        if key == a and a is not None:
+            return self._a
+        if key == b and b is not None:
+            return self._b
+        raise KeyError(key)
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self):
+        yield 'type'
+        if self.channel is not None:
+            yield 'channel'
+        for key in _FIELDS[self.type]:
+            if key is not None:
+                yield key
+        yield 'time'
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        args = ', '.join(f'{k}={self[k]!r}' for k in self)
+        return f'{type(self).__name__}({args})'
+
+
+def decode_message(data, time=0.0):
+    '''Return a MidiData object from raw bytes or None if invalid.'''
+    if not data:
+        return None
+    status = data[0]
+    if status < 0xF0:
+        try:
+            type, _, b = _CHANNEL_MSGS[status & 0xF0]
+        except KeyError:
+            return None  # Running status is resolved by the backends.
+        if type == 'pitchwheel':
+            return MidiData(
+                type, status & 0x0F, (data[1] | data[2] << 7) - 8192,
+                None, time)
+        return MidiData(
+            type, status & 0x0F, data[1], data[2] if b else None, time)
+    try:
+        type, a, _ = _SYSTEM_MSGS[status]
+    except KeyError:
+        return None
+    if a is None:
+        return MidiData(type, None, None, None, time)
+    if type == 'sysex':
+        end = -1 if data[-1] == 0xF7 else len(data)
+        return MidiData(type, None, tuple(data[1:end]), None, time)
+    if type == 'quarter_frame':
+        return MidiData(type, None, data[1] >> 4, data[1] & 15, time)
+    if type == 'songpos':
+        return MidiData(type, None, data[1] | data[2] << 7, None, time)
+    return MidiData(type, None, data[1], None, time)
 
 
 class MidiInterface(ABC):
@@ -45,6 +183,10 @@ class MidiInterface(ABC):
     def send_msg(self, port, msg, **kwargs):
         pass
 
+    @abstractmethod
+    def sched_msgs(self, port, msgs):
+        pass
+
     def sources(self):
         return None
 
@@ -59,6 +201,7 @@ class MidiRtInterface(MidiInterface):
         self._input_ports = dict()
         self._output_ports = dict()
         self._threads = dict()
+        self._output_queue = _OutputQueue()
 
     def add_recv_func(self, func):  # override
         self._recv_functions.add(func)
@@ -78,6 +221,7 @@ class MidiRtInterface(MidiInterface):
         self._running = False
         for name, port in self._input_ports.copy().items():
             self.close_input_port(name, port)
+        self._output_queue.stop()
         for name, port in self._output_ports.copy().items():
             self.close_output_port(name, port)
         _libsc3.main._atexitq.remove(self.stop)
@@ -89,13 +233,16 @@ class MidiRtInterface(MidiInterface):
             return self._input_ports[name]
         port = mido.open_input(name, virtual)
         self._input_ports[name] = port
-        thread = threading.Thread(
-            target=self._run,
-            name='MIDI ' + str(port),
-            args=(self, name, virtual, port))
-        thread.daemon = True
-        thread.start()
-        self._threads[name] = thread
+        midi_in = mdi.MidiIn(name, virtual)  # MidiFunc port argument object.
+        queue = _InputQueue(self, midi_in)
+        if not self._set_callback(port, queue):
+            thread = threading.Thread(
+                target=self._run,
+                name='MIDI ' + str(port),
+                args=(self, port, queue))
+            thread.daemon = True
+            thread.start()
+            self._threads[name] = thread
         return port
 
     def open_output_port(self, name, virtual):  # override
@@ -106,45 +253,85 @@ class MidiRtInterface(MidiInterface):
         return port
 
     def close_input_port(self, name, port):  # override
+        if self._has_rt_callback(port):
+            port._rt.cancel_callback()
+        elif self._has_callback(port):
+            port.callback = None
         port.close()
-        if type(port) is mido.backends.rtmidi.Input:
+        if name in self._threads:
             port._queue.put(None)  # HACK: Is not raising IOError on Linux.
+            del self._threads[name]
         del self._input_ports[name]
 
     def close_output_port(self, name, port):  # override
         port.close()
         del self._output_ports[name]
 
+    @classmethod
+    def _set_callback(cls, port, queue):
+        # Return False if the port has to be read by a thread. The port of
+        # the rtmidi backend has a private _rt object, not part of mido's
+        # API, whose callback receives the raw bytes without mido parsing.
+        # If it's missing, or changes, the public callback of mido's ports
+        # is used, it receives parsed messages.
+        if cls._has_rt_callback(port):
+            port._rt.set_callback(lambda event, _: queue.put(event[0]))
+        elif cls._has_callback(port):
+            port.callback = lambda msg: queue.put(msg.bytes())
+        else:
+            return False
+        return True
+
     @staticmethod
-    def _run(iface, name, virtual, port):
-        midi_in = mdi.MidiIn(name, virtual)  # MidiFunc port argument object.
+    def _has_rt_callback(port):
+        rt = getattr(port, '_rt', None)
+        return callable(getattr(rt, 'set_callback', None))\
+            and callable(getattr(rt, 'cancel_callback', None))
+
+    @staticmethod
+    def _has_callback(port):
+        # Backends that support callbacks define it as a property.
+        return isinstance(getattr(type(port), 'callback', None), property)
+
+    @staticmethod
+    def _run(iface, port, queue):
         while iface._running and not port.closed:
             try:
                 msg = port.receive()
                 if msg is None:
                     return  # HACK: See close_port.
-                data = msg.dict()
-                # *** TODO: is_cc, is_meta, is_realtime to keys?
-                # *** TODO: data['time'] = _libsc3.main.elapsed_time()  # Or pop('time')
-                iface._msg_dispatch(data, midi_in)
+                queue.put(msg.bytes())
+                for msg in port.iter_pending():
+                    queue.put(msg.bytes())
             except IOError as e:
                 if port.closed:
                     return
                 else:
                     raise e
 
-    def _msg_dispatch(self, data, midi_in):
-        def sched_func():
-            for func in self._recv_functions.copy():
-                func(data, midi_in)
-
-        clk.SystemClock.sched(0, sched_func)
+    def _msg_dispatch(self, messages, midi_in):
+        funcs = tuple(self._recv_functions)
+        for data in messages:
+            for func in funcs:
+                try:
+                    func(data, midi_in)
+                except Exception:
+                    # Errors of one responder don't drop the batch.
+                    _logger.exception(
+                        'Exception happened during dispatch of %s from %s',
+                        data.type, midi_in)
 
     def send_msg(self, port, msg, **kwargs):  # override
         if port.closed:  # Prevents segfault.
             return
         port.send(mido.Message(msg, **kwargs))
 
+    def sched_msgs(self, port, msgs):  # override
+        now = _libsc3.main.current_tt._seconds
+        self._output_queue.add(
+            (now + delta, port, mido.Message(msg, **kwargs))
+            for delta, msg, kwargs in msgs)
+
     def sources(self):  # override
         return mido.get_input_names()
 
@@ -152,6 +339,106 @@ class MidiRtInterface(MidiInterface):
         return mido.get_output_names()
 
 
+class _InputQueue():
+    # Messages are decoded in the receiving thread and dispatched in
+    # batches, a single clock task drains all the pending ones.
+
+    def __init__(self, iface, midi_in):
+        self._iface = iface
+        self._midi_in = midi_in
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def put(self, data, time=None):
+        '''Add a message as raw bytes, time is the elapsed time of
+        arrival if not given.'''
+        if time is None:
+            time = _libsc3.main.elapsed_time()
+        msg = decode_message(data, time)
+        if msg is None:
+            return
+        with self._lock:
+            self._pending.append(msg)
+            if len(self._pending) > 1:
+                return  # Already scheduled.
+        clk.SystemClock.sched(0, lambda: self._drain())
+
+    def _drain(self):
+        with self._lock:
+            messages = self._pending
+            self._pending = []
+        self._iface._msg_dispatch(messages, self._midi_in)
+
+
+class _OutputQueue():
+    # Timestamped messages are sent by a single thread at their physical
+    # time, without clock tasks. The thread starts with the first message.
+
+    def __init__(self):
+        self._queue = []
+        self._count = itertools.count()  # Keeps insertion order for ties.
+        self._cond = threading.Condition(threading.Lock())
+        self._thread = None
+        self._running = False
+
+    def add(self, entries):
+        '''Add (time, port, message) entries, time is in elapsed seconds.'''
+        with self._cond:
+            for time, port, message in entries:
+                heapq.heappush(
+                    self._queue, (time, next(self._count), port, message))
+            if self._thread is None:
+                self._running = True
+                self._thread = threading.Thread(
+                    target=self._run, name='MIDI output', daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def stop(self):
+        # Pending note offs are sent at once so notes don't hang,
+        # the other messages are discarded.
+        with self._cond:
+            self._running = False
+            pending = sorted(self._queue)
+            self._queue.clear()
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for _, _, port, message in pending:
+            if self._is_note_off(message) and not port.closed:
+                port.send(message)
+
+    @staticmethod
+    def _is_note_off(message):
+        type = getattr(message, 'type', None)
+        return type == 'note_off'\
+            or type == 'note_on' and message.velocity == 0
+
+    def _run(self):
+        queue = self._queue
+        while True:
+            with self._cond:
+                while self._running:
+                    if not queue:
+                        self._cond.wait()
+                        continue
+                    delay = queue[0][0] - _libsc3.main.elapsed_time()
+                    if delay > 0:
+                        self._cond.wait(delay)
+                        continue
+                    break
+                if not self._running:
+                    return
+                now = _libsc3.main.elapsed_time()
+                due = []
+                while queue and queue[0][0] <= now:
+                    due.append(heapq.heappop(queue))
+            for _, _, port, message in due:
+                if not port.closed:  # Prevents segfault.
+                    port.send(message)
+
+
 class MidiNrtInterface(MidiInterface):
     class _DummyPort():
         def __init__(self, name, virtual=False):
@@ -198,6 +485,11 @@ class MidiNrtInterface(MidiInterface):
     def send_msg(self, port, msg, **kwargs):  # override
         self._midi_score.add(port, msg, **kwargs)
 
+    def sched_msgs(self, port, msgs):  # override
+        now = _libsc3.main.current_tt._seconds
+        for delta, msg, kwargs in msgs:
+            self._midi_score._add(now + delta, port, msg, kwargs)
+
 
 class MidiScore():
     class _Entry():
@@ -225,13 +517,15 @@ class MidiScore():
         return self._scoreq.peek(False)[0]
 
     def add(self, port, msg, **kwargs):
+        self._add(_libsc3.main.current_tt._seconds, port, msg, kwargs)
+
+    def _add(self, send_time, port, msg, kwargs):
         if self._finished:
             raise Exception('already finished MIDI score')
         try:
             midi_msg = mido.Message(msg, **kwargs)
         except LookupError:
             midi_msg = mido.MetaMessage(msg, **kwargs)
-        send_time = _libsc3.main.current_tt._seconds
         self._scoreq.add(send_time, type(self)._Entry(port, midi_msg))
 
     def finish(self):
@@ -1,6 +1,12 @@
 
 from abc import ABC, abstractmethod
+import asyncio
+import heapq
+import itertools
 import logging
+import pathlib
+import shutil
+import tempfile
 import threading
 import errno
 import struct
@@ -21,21 +27,40 @@ from . import functions as fn
 from . import platform as plf
 
 
-__all__ = ['OscUdpInterface', 'OscTcpInterface', 'OscNrtInterface']
+__all__ = [
+    'OscUdpInterface', 'OscAsyncUdpInterface',
+    'OscTcpInterface', 'OscAsyncTcpInterface', 'OscNrtInterface']
 
 
 _logger = logging.getLogger(__name__)
 
 
+# get_running_loop is new in Python 3.7, get_event_loop returns the
+# running loop when called from a coroutine.
+_get_running_loop = getattr(
+    asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+
 class OscInterface(ABC):
     _recv_functions = set()
+    _recv_snapshot = ()
+    _deferred = None
     _local_endpoints = dict()
+    _MAX_CACHED_ADDRS = 1024
+
+    batch_dispatch = True
+    '''
+    If True, all messages of an incoming packet are dispatched in order
+    within a single task scheduled in SystemClock, otherwise each message
+    is scheduled as a separate task.
+    '''
 
     def __init__(self, port=None, port_range=1):
         self._port = port
         self._port_range = port_range if port_range > 0 else 1
         self._socket = None
         self._proto = None
+        self._addr_cache = dict()
 
     @property
     def port(self):
@@ -64,11 +89,32 @@ class OscInterface(ABC):
             port: Local port as int.
         '''
         cls._recv_functions.add(func)
+        OscInterface._recv_snapshot = tuple(cls._recv_functions)
 
     @classmethod
     def remove_recv_func(cls, func):
         '''Unregister func callback.'''
         cls._recv_functions.discard(func)
+        OscInterface._recv_snapshot = tuple(cls._recv_functions)
+
+    def _get_netaddr(self, addr):
+        # NetAddr objects are cached by sender address, the cache is
+        # just dropped if it grows too much (e.g. many remote clients).
+        try:
+            return self._addr_cache[addr]
+        except KeyError:
+            if len(self._addr_cache) >= self._MAX_CACHED_ADDRS:
+                self._addr_cache.clear()
+            netaddr = nad.NetAddr(addr[0], addr[1])
+            netaddr._osc_interface = self
+            self._addr_cache[addr] = netaddr
+            return netaddr
+
+    def _recv_dispatch(self, msg, time, addr):
+        # Functions can be added or removed while dispatching, the
+        # snapshot is replaced (not modified) in that case.
+        for func in type(self)._recv_snapshot:
+            func(list(msg), time, addr, self.port)
 
     def _msg_dispatch(self, addr, time, *msg):
         '''
@@ -79,28 +125,80 @@ class OscInterface(ABC):
             time: OSC timetag as 64bits unsigned integer.
             *msg: OSC message as address followed by values.
         '''
-        addr = nad.NetAddr(addr[0], addr[1])
-        addr._osc_interface = self
+        addr = self._get_netaddr(addr)
+
+        def sched_func():
+            self._dispatch_messages([(time, msg)], addr)
+
+        clk.SystemClock.sched(0, sched_func)  # Updates logical time.
+
+    def _packet_dispatch(self, addr, messages):
+        '''
+        This method routes all the messages of an incoming OSC packet to
+        responders in order, within one scheduled task.
+
+        Args:
+            addr: A tuple (sender_ip:str, sender_port:int).
+            messages: A list of tuples (time, msg) where msg is a list
+                with the OSC address followed by values.
+        '''
+        addr = self._get_netaddr(addr)
 
         def sched_func():
-            for func in type(self)._recv_functions.copy():
-                func(list(msg), time, addr, self.port)
+            self._dispatch_messages(messages, addr)
 
         clk.SystemClock.sched(0, sched_func)  # Updates logical time.
 
+    def _dispatch_messages(self, messages, addr):
+        # Functions deferred by receive functions are evaluated after
+        # the last message, dispatch runs in SystemClock's thread.
+        OscInterface._deferred = deferred = []
+        try:
+            for time, msg in messages:
+                try:
+                    self._recv_dispatch(msg, time, addr)
+                except Exception:
+                    # Errors of one message don't prevent the others.
+                    _logger.error(
+                        'Exception happened during dispatch of %s from %s',
+                        msg[0], addr, exc_info=1)
+        finally:
+            OscInterface._deferred = None
+        for func in deferred:
+            try:
+                func()
+            except Exception:
+                _logger.error(
+                    'Exception happened after dispatch of packet from %s',
+                    addr, exc_info=1)
+
+    @staticmethod
+    def _at_dispatch_end(func):
+        # Evaluate func after the messages of the packet being dispatched,
+        # or now if called outside dispatch.
+        if OscInterface._deferred is None:
+            func()
+        else:
+            OscInterface._deferred.append(func)
+
     def _handle_request(self, data, address):
         try:
             elapsed_time = _libsc3.main.elapsed_time()
             packet = oli.OscPacket(data)
+            messages = []
             for timed_msg in packet.messages:
                 if timed_msg.time is None or timed_msg.time == oli.IMMEDIATELY:
                     time = elapsed_time
                 else:
                     time = clk.SystemClock.osc_to_elapsed_time(timed_msg.time)
-                self._msg_dispatch(
-                    address, time,
-                    *[timed_msg.message.address,
-                    *timed_msg.message.params])
+                messages.append((
+                    time,
+                    [timed_msg.message.address, *timed_msg.message.params]))
+            if self.batch_dispatch:
+                self._packet_dispatch(address, messages)
+            else:
+                for time, msg in messages:
+                    self._msg_dispatch(address, time, *msg)
         except:
             _logger.error(
                 'Exception happened during processing '
@@ -137,51 +235,56 @@ class OscInterface(ABC):
 
     def _build_msg(self, send_time, arg_list):
         # ['/path', arg1, arg2, ..., argN]
-        msg_builder = oli.OscMessageBuilder(arg_list[0])
+        args = []
+        stack = [args]
         for arg in arg_list[1:]:
             if arg is None:
-                msg_builder.add_arg(0)
+                stack[-1].append(0)
             elif isinstance(arg, bool):
-                msg_builder.add_arg(int(arg))
+                stack[-1].append(int(arg))
             elif isinstance(arg, list):
                 if not arg:
-                    msg_builder.add_arg(0)
+                    stack[-1].append(0)
                 elif isinstance(arg[0], str):
-                    msg_builder.add_arg(
+                    stack[-1].append(
                         self._build_msg(send_time, arg).dgram)
                 elif isinstance(arg[0], (int, float, type(None)))\
                 and len(arg) > 1 and isinstance(arg[1], list):
-                    msg_builder.add_arg(
+                    stack[-1].append(
                         self._build_bundle(send_time, arg).dgram)
                 else:
                     raise ValueError(
                         'lists within messages must be valid '
                         f'OSC messages or bundles: {arg}')
             elif arg == '[':
-                msg_builder.args.append(
-                    (msg_builder.ARG_TYPE_ARRAY_START, None))
+                array = []
+                stack[-1].append(array)
+                stack.append(array)
             elif arg == ']':
-                msg_builder.args.append(
-                    (msg_builder.ARG_TYPE_ARRAY_STOP, None))
+                if len(stack) < 2:
+                    raise ValueError(f'unexpected closing bracket: {arg_list}')
+                stack.pop()
             else:
-                msg_builder.add_arg(arg)  # Infiere correctamente el resto de los tipos.
-        return msg_builder.build()
+                stack[-1].append(arg)  # Infiere correctamente el resto de los tipos.
+        if len(stack) > 1:
+            raise ValueError(f'missing closing bracket: {arg_list}')
+        return oli.encode_message(arg_list[0], args)
 
     def _build_bundle(self, send_time, arg_list):
         # [time, ['/path', arg1, arg2, ..., argN], [...], ...]
         timetag = self._get_timetag(send_time, arg_list[0])
-        bndl_builder = oli.OscBundleBuilder(timetag)
+        contents = []
         for arg in arg_list[1:]:
             if isinstance(arg[0], str):
-                bndl_builder.add_content(self._build_msg(send_time, arg))
+                contents.append(self._build_msg(send_time, arg))
             elif isinstance(arg[0], (int, float, type(None))):
                 self._check_subtime(arg_list[0], arg[0])
-                bndl_builder.add_content(self._build_bundle(send_time, arg))
+                contents.append(self._build_bundle(send_time, arg))
             else:
                 raise ValueError(
                     'elements within bundles must be valid '
                     f'OSC messages or bundles: {arg}')
-        return bndl_builder.build()
+        return oli.encode_bundle(timetag, contents)
 
     @staticmethod
     def _get_timetag(send_time, time):
@@ -329,6 +432,70 @@ class OscUdpInterface(OscInterface):
         self._socket.sendto(msg.dgram, target)
 
 
+class _OscDatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, interface):
+        self._interface = interface
+
+    def datagram_received(self, data, addr):
+        self._interface._handle_request(data, addr)
+
+    def error_received(self, exc):
+        _logger.error(f'{str(self._interface)}: {str(exc)}')
+
+
+class OscAsyncUdpInterface(OscUdpInterface):
+    '''OSC over UDP served by an asyncio event loop instead of a thread.
+
+    Incoming packets are dispatched from the event loop to the library's
+    responders as with the other interfaces. The socket is non-blocking,
+    messages can be sent from any thread.
+
+    '''
+
+    def __init__(self, port, port_range=1):
+        super().__init__(port, port_range)
+        self._loop = None
+        self._transport = None
+
+    async def start_async(self):
+        '''Bind the socket and start receiving in the running loop.'''
+        if self._running:
+            return
+        with _libsc3.main._main_lock:
+            self.bind()
+        self._socket.setblocking(False)
+        self._loop = _get_running_loop()
+        self._transport, _ = await self._loop.create_datagram_endpoint(
+            lambda: _OscDatagramProtocol(self), sock=self._socket)
+        self._running = True
+        _libsc3.main._atexitq.add(
+            _libsc3.main._atexitprio.NETWORKING + 1, self.stop)
+
+    def start(self):
+        raise RuntimeError(
+            f'{type(self).__name__} must be started with start_async')
+
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+        bind_addr = self._socket.getsockname()
+        if self._loop.is_closed():
+            self._socket.close()
+        else:
+            self._loop.call_soon_threadsafe(self._transport.close)
+        type(self)._local_endpoints.pop(bind_addr, None)
+        _libsc3.main._atexitq.remove(self.stop)
+
+    def _send(self, msg, target):  # override
+        try:
+            self._socket.sendto(msg.dgram, target)
+        except BlockingIOError:
+            # The transport buffers the data until the socket is ready.
+            self._loop.call_soon_threadsafe(
+                self._transport.sendto, msg.dgram, target)
+
+
 class OscTcpInterface(OscInterface):
     '''
     OSC client over TCP. OscTcpInterface instances aren't reusable.
@@ -410,6 +577,80 @@ class OscTcpInterface(OscInterface):
         self._socket.send(msg.dgram)
 
 
+class _OscStreamProtocol(asyncio.Protocol):
+    def __init__(self, interface):
+        self._interface = interface
+        self._buffer = bytearray()
+
+    def data_received(self, data):
+        # Packets are prefixed by their size and can arrive split.
+        buffer = self._buffer
+        buffer.extend(data)
+        while len(buffer) >= 4:
+            size = struct.unpack('>i', buffer[:4])[0]
+            if len(buffer) < size + 4:
+                break
+            packet = bytes(buffer[4:size + 4])
+            del buffer[:size + 4]
+            self._interface._handle_request(
+                packet, self._interface._peername)
+
+    def connection_lost(self, exc):
+        self._interface._is_connected = False
+        if exc is not None:
+            _logger.error(f'{str(self._interface)}: {str(exc)}')
+
+
+class OscAsyncTcpInterface(OscTcpInterface):
+    '''OSC client over TCP served by an asyncio event loop instead of
+    a thread.
+
+    Incoming packets are dispatched from the event loop to the library's
+    responders as with the other interfaces. Messages can be sent from
+    any thread, they are written by the loop in order.
+
+    '''
+
+    def __init__(self, port, port_range=1):
+        super().__init__(port, port_range)
+        self._loop = None
+        self._transport = None
+        self._peername = None
+
+    async def connect_async(self, target):
+        '''Connect to target and start receiving in the running loop.'''
+        self._socket.setblocking(False)
+        self._loop = _get_running_loop()
+        await self._loop.sock_connect(self._socket, target)
+        self._peername = self._socket.getpeername()
+        self._transport, _ = await self._loop.create_connection(
+            lambda: _OscStreamProtocol(self), sock=self._socket)
+        self._is_connected = True
+        _libsc3.main._atexitq.add(
+            _libsc3.main._atexitprio.NETWORKING, self.disconnect)
+
+    def connect(self, target):
+        raise RuntimeError(
+            f'{type(self).__name__} must be connected with connect_async')
+
+    def try_connect(self, target, timeout=3, on_complete=None, on_failure=None):
+        self.connect(target)
+
+    def disconnect(self):
+        self._is_connected = False
+        bind_addr = self._socket.getsockname()
+        if self._transport is None or self._loop.is_closed():
+            self._socket.close()
+        else:
+            self._loop.call_soon_threadsafe(self._transport.close)
+        type(self)._local_endpoints.pop(bind_addr, None)
+        _libsc3.main._atexitq.remove(self.disconnect)
+
+    def _send(self, msg, _=None):  # override
+        self._loop.call_soon_threadsafe(
+            self._transport.write, msg.size.to_bytes(4, 'big') + msg.dgram)
+
+
 class OscNrtInterface(OscInterface):
     def init(self):
         self._osc_score = OscScore()
@@ -428,6 +669,9 @@ class OscNrtInterface(OscInterface):
     def _msg_dispatch(self, addr, time, *msg):  # override
         pass  # Exception?
 
+    def _packet_dispatch(self, addr, messages):  # override
+        pass  # Exception?
+
     def send_msg(self, target, *args):  # override
         # In NRT all messages are bundles at current time.
         self.send_bundle(target, 0.0, list(args))
@@ -463,6 +707,7 @@ class OscScore():
         self._scoreq = tsq.TaskQueue()
         self._lst_score = []
         self._raw_score = bytearray()
+        self._stream = None
         self._finished = False
         self.add([0.0, ["/g_new", 1, 0, 0]])  # Root node.
 
@@ -472,18 +717,60 @@ class OscScore():
 
     @property
     def raw(self):
+        if self._stream is not None:
+            return bytearray(self._stream.path.read_bytes())
         return self._raw_score[:]
 
     @property
     def duration(self):
+        if self._stream is not None:
+            return self._stream.duration
         return self._scoreq.peek(False)[0] * clk.SystemClock._OSC_TO_SECONDS
 
+    @property
+    def path(self):
+        '''Output file of a streaming score or None.'''
+        return None if self._stream is None else self._stream.path
+
+    def stream(self, path, keep_list=False):
+        '''Write bundles to a file as the NRT clock passes their time.
+
+        The bundles already in the score are moved to the stream. Bundles
+        added afterwards for a time that was already written are kept in
+        sorted runs and merged into the file when the score is finished.
+
+        Parameters
+        ----------
+        path: str | pathlib.Path
+            Output OSC file.
+        keep_list: bool
+            If True, bundles are also kept as lists for the ``list``
+            property, this makes memory use grow with the score length.
+
+        '''
+
+        if self._finished:
+            raise Exception('already finished OSC score')
+        if self._stream is not None:
+            raise Exception('OSC score is already streaming')
+        self._stream = _OscScoreStream(path, keep_list)
+        for time, entry in self._scoreq:
+            self._stream.add(time, entry.msg, entry.bndl)
+        self._scoreq.clear()
+
     def add(self, bndl):
         if self._finished:
             raise Exception('already finished OSC score')
         send_time = _libsc3.main.current_tt._seconds
         msg = _libsc3.main._osc_interface._build_bundle(send_time, bndl)  # Raises Exception.
         msg = msg.size.to_bytes(4, 'big') + msg.dgram
+        if self._stream is not None:
+            time = self._get_logical_time(send_time, bndl[0])
+            if self._stream.keep_list:
+                bndl = self._process_bndl_time(send_time, bndl)
+            self._stream.add(time, msg, bndl)
+            self._stream.flush(_libsc3.main.main_tt._seconds)
+            return
         bndl = self._process_bndl_time(send_time, bndl)
         self._scoreq.add(bndl[0], type(self)._Entry(bndl, msg))
 
@@ -521,27 +808,36 @@ class OscScore():
         if _libsc3.main.current_tt is _libsc3.main.main_tt:
             tailtime += _libsc3.main.current_tt._seconds
         self.add([tailtime, ['/c_set', 0, 0]])  # Dummy cmd.
-        for _, entry in self._scoreq:
-            self._lst_score.append(entry.bndl)
-            self._raw_score.extend(entry.msg)
+        if self._stream is not None:
+            self._lst_score = self._stream.finish()
+        else:
+            for _, entry in self._scoreq:
+                self._lst_score.append(entry.bndl)
+                self._raw_score.extend(entry.msg)
         self._finished = True
 
     def write(self, path):
         if not self._finished:
             self.finish(self.duration)
+        if self._stream is not None:
+            if pathlib.Path(path).resolve() != self._stream.path.resolve():
+                shutil.copyfile(self._stream.path, path)
+            return
         with open(path, 'wb') as file:
             file.write(self._raw_score)
 
     def render(self, path=None, input_file=None, server=None):
         # This method blocks until cmd finish and returns its exit code.
-        osc_file = plf.Platform.tmp_dir
-        osc_file /= 'SC_' + time.strftime('%Y%m%d_%H%M%S') + '.osc'
-        self.write(osc_file)
+        if self._stream is not None:
+            self.write(self._stream.path)
+            osc_file = None
+        else:
+            osc_file = plf.Platform.tmp_dir
+            osc_file /= 'SC_' + time.strftime('%Y%m%d_%H%M%S') + '.osc'
+            self.write(osc_file)
 
-        server = srv.Server.default if server is None else server
-        cmd = [server.options.program]
-        cmd.extend(
-            server.options.options_list(None, osc_file, input_file, path))
+        cmd = self._render_cmd(
+            osc_file or self._stream.path, path, input_file, server)
 
         self._render_proc = subprocess.Popen(
             cmd,
@@ -555,7 +851,116 @@ class OscScore():
             self._render_proc.wait()
             return self._render_proc.poll()
         finally:
-            osc_file.unlink()
+            if osc_file is not None:
+                osc_file.unlink()
+
+    @staticmethod
+    def _render_cmd(osc_file, path=None, input_file=None, server=None):
+        server = srv.Server.default if server is None else server
+        cmd = [server.options.program]
+        cmd.extend(
+            server.options.options_list(None, osc_file, input_file, path))
+        return cmd
 
     def __str__(self):
         return pprint.pformat(self._lst_score)
+
+
+class _OscScoreStream():
+    # Bundles are written in time order once the clock passed their time.
+    # Bundles for an already written time are late, they are sorted in
+    # runs and merged with the output file at finish. Equal timetags keep
+    # the order in which bundles were added.
+
+    _RUN_SIZE = 4096
+
+    def __init__(self, path, keep_list):
+        self.path = pathlib.Path(path)
+        self.keep_list = keep_list
+        self.duration = 0.0
+        self._file = open(self.path, 'wb')
+        self._pending = []  # Heap of (timetag, count, msg, bndl).
+        self._counter = itertools.count()
+        self._last = 0  # Timetag of the last written bundle.
+        self._late = []
+        self._runs = []
+        self._lst = [] if keep_list else None
+
+    def add(self, time, msg, bndl):
+        timetag = int.from_bytes(msg[12:20], 'big')  # After size and '#bundle'.
+        heapq.heappush(
+            self._pending, (timetag, next(self._counter), msg, bndl))
+        if time > self.duration:
+            self.duration = time
+
+    def flush(self, seconds):
+        '''Write pending bundles before seconds.'''
+        timetag = int(seconds * clk.SystemClock._SECONDS_TO_OSC)
+        pending = self._pending
+        while pending and pending[0][0] < timetag:
+            self._write(heapq.heappop(pending))
+
+    def _write(self, entry):
+        timetag, count, msg, bndl = entry
+        if timetag < self._last:
+            self._late.append(entry)
+            if len(self._late) >= self._RUN_SIZE:
+                self._spill()
+        else:
+            self._file.write(msg)
+            self._last = timetag
+        if self._lst is not None:
+            self._lst.append((timetag, count, bndl))
+
+    def _spill(self):
+        self._late.sort(key=lambda e: e[:2])
+        with tempfile.NamedTemporaryFile(
+                dir=self.path.parent, suffix='.run', delete=False) as file:
+            for entry in self._late:
+                file.write(entry[2])
+        self._runs.append(pathlib.Path(file.name))
+        self._late = []
+
+    def finish(self):
+        '''Write the remaining bundles and return the list score.'''
+        pending = self._pending
+        while pending:
+            self._write(heapq.heappop(pending))
+        self._file.close()
+        if self._late or self._runs:
+            self._merge()
+        if self._lst is None:
+            return []
+        self._lst.sort(key=lambda e: e[:2])
+        lst = [bndl for _, _, bndl in self._lst]
+        self._lst = None
+        return lst
+
+    def _merge(self):
+        self._late.sort(key=lambda e: e[:2])
+        late = [(entry[0], entry[2]) for entry in self._late]
+        self._late = []
+        main_run = self.path.with_name(self.path.name + '.run')
+        self.path.replace(main_run)
+        runs = [main_run, *self._runs]
+        sources = [self._read_run(run) for run in runs]
+        try:
+            with open(self.path, 'wb') as file:
+                # Merge is stable, the output file and older runs first.
+                for _, msg in heapq.merge(*sources, late, key=lambda r: r[0]):
+                    file.write(msg)
+        finally:
+            for source, run in zip(sources, runs):
+                source.close()
+                run.unlink()
+            self._runs = []
+
+    @staticmethod
+    def _read_run(path):
+        with open(path, 'rb') as file:
+            while True:
+                size = file.read(4)
+                if not size:
+                    return
+                data = file.read(int.from_bytes(size, 'big'))
+                yield (int.from_bytes(data[8:16], 'big'), size + data)
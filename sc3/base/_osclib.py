@@ -543,7 +543,7 @@ class OscBundleBuilder(object):
         try:
             dgram += write_timetag(self._timetag)
             for content in self._contents:
-                if type(content) is OscMessage or type(content) is OscBundle:
+                if type(content) in (OscMessage, OscBundle, OscOutPacket):
                     size = content.size
                     dgram += write_int(size)
                     dgram += content.dgram
@@ -828,6 +828,150 @@ class OscMessageBuilder(object):
             raise OscMessageBuildError(f'Could not build the message') from e
 
 
+### OSC Encoder ###
+
+
+class OscOutPacket(object):
+    """Encoded outgoing OSC message or bundle.
+
+    Returned by encode_message and encode_bundle, it holds the datagram and
+    only parses it back into an OscMessage or OscBundle if `content` is
+    accessed.
+    """
+
+    __slots__ = ('_dgram', '_content')
+
+    def __init__(self, dgram: bytes) -> None:
+        self._dgram = dgram
+        self._content = None
+
+    @property
+    def size(self) -> int:
+        """Returns the length of the datagram."""
+        return len(self._dgram)
+
+    @property
+    def dgram(self) -> bytes:
+        """Returns the encoded datagram."""
+        return self._dgram
+
+    @property
+    def content(self) -> Any:
+        """Returns the datagram parsed as OscMessage or OscBundle."""
+        if self._content is None:
+            if OscBundle.dgram_is_bundle(self._dgram):
+                self._content = OscBundle(self._dgram)
+            else:
+                self._content = OscMessage(self._dgram)
+        return self._content
+
+
+def _str_dgram_len(n: int) -> int:
+    # Always null terminated and padded to 4 bytes.
+    return n + _STRING_DGRAM_PAD - (n % _STRING_DGRAM_PAD)
+
+
+def _encode_args(args, tags, fmt, values) -> None:
+    # Appends type tags, struct formats and values for each argument
+    # so the whole message can be packed by a single struct.pack call.
+    for arg in args:
+        if isinstance(arg, str):
+            data = arg.encode('utf-8')
+            tags.append('s')
+            fmt.append(f'{_str_dgram_len(len(data))}s')
+            values.append(data)
+        elif isinstance(arg, (bytes, bytearray, memoryview)):
+            if not arg:
+                raise OscTypeBuildError('Blob value cannot be empty')
+            if isinstance(arg, memoryview):
+                arg = arg.tobytes()
+            size = len(arg)
+            tags.append('b')
+            fmt.append(f'i{size + (-size % _BLOB_DGRAM_PAD)}s')
+            values.append(size)
+            values.append(arg)
+        elif arg is True:
+            tags.append('T')
+        elif arg is False:
+            tags.append('F')
+        elif isinstance(arg, int):
+            tags.append('i')
+            fmt.append('i')
+            values.append(arg)
+        elif isinstance(arg, float):
+            tags.append('f')
+            fmt.append('f')
+            values.append(arg)
+        elif arg is None:
+            tags.append('N')
+        elif isinstance(arg, tuple) and len(arg) == 4:
+            tags.append('m')
+            fmt.append('I')
+            values.append(sum(
+                (v & 0xFF) << 8 * (3 - pos) for pos, v in enumerate(arg)))
+        elif isinstance(arg, list):
+            tags.append('[')
+            _encode_args(arg, tags, fmt, values)
+            tags.append(']')
+        else:
+            raise ValueError(
+                f'Infered arg_value type is not supported: {type(arg)}')
+
+
+def encode_message(address: str, args=()) -> OscOutPacket:
+    """Encode an OSC message in a single pass.
+
+    Argument types are inferred as in OscMessageBuilder, lists are encoded
+    as OSC arrays. The datagram size is computed from the type tags and
+    packed at once without parsing it back.
+
+    Raises:
+      - BuildError: if the message could not be build or if the address
+        was empty.
+    """
+    if not address:
+        raise OscMessageBuildError('OSC addresses cannot be empty')
+    tags = [',']
+    fmt = []
+    values = []
+    try:
+        _encode_args(args, tags, fmt, values)
+        address = address.encode('utf-8')
+        tags = ''.join(tags).encode('utf-8')
+        dgram = struct.pack(
+            f'>{_str_dgram_len(len(address))}s'
+            f'{_str_dgram_len(len(tags))}s{"".join(fmt)}',
+            address, tags, *values)
+    except (OscTypeBuildError, struct.error,
+            UnicodeEncodeError, AttributeError) as e:
+        raise OscMessageBuildError('Could not build the message') from e
+    return OscOutPacket(dgram)
+
+
+def encode_bundle(timetag: int, contents) -> OscOutPacket:
+    """Encode an OSC bundle in a single pass.
+
+    Args:
+      - timetag: OSC timetag as uint64.
+      - contents: Already encoded elements, any object with a `dgram`
+        attribute (OscOutPacket, OscMessage or OscBundle).
+
+    Raises:
+      - BuildError: if we could not build the bundle.
+    """
+    fmt = ['>8sQ']
+    values = [_BUNDLE_PREFIX_DGRAM, timetag]
+    for content in contents:
+        dgram = content.dgram
+        fmt.append(f'i{len(dgram)}s')
+        values.append(len(dgram))
+        values.append(dgram)
+    try:
+        return OscOutPacket(struct.pack(''.join(fmt), *values))
+    except struct.error as e:
+        raise OscBundleBuildError('Could not build the bundle') from e
+
+
 ### OSC Packet ###
 
 
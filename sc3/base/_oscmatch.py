@@ -1,3 +1,4 @@
+import functools
 import re
 
 
@@ -36,9 +37,87 @@ def _rewrite_func(match):
     return _rewrite_symbols[match.group(0)]
 
 
+_PATTERN_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=_PATTERN_CACHE_SIZE)
+def _compile_pattern(pattern):
+    return re.compile(re.sub(_rewrite_pattern, _rewrite_func, pattern))
+
+
 def osc_rematch_pattern(pattern, address):
-    pattern = re.sub(_rewrite_pattern, _rewrite_func, pattern)
-    return re.match(pattern, address) is not None
+    return _compile_pattern(pattern).match(address) is not None
+
+
+_prefix_stop_symbols = set('*?[]{},')
+
+
+def _literal_prefix(pattern):
+    # Return the part of pattern before the first special symbol or None
+    # if the rewritten regex is an alternation that doesn't start with it.
+    end = None
+    depth = 0
+    for i, c in enumerate(pattern):
+        if c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+        elif c == ',' and depth <= 0:
+            return None
+        if end is None and (
+                c in _prefix_stop_symbols or pattern.startswith('-]', i)):
+            end = i
+    return pattern if end is None else pattern[:end]
+
+
+class OscAddressIndex():
+    '''
+    Trie of literal OSC addresses by path segments. It is used to find the
+    candidate addresses an incoming address pattern can match without
+    testing all of them. The descent uses the literal prefix of the pattern
+    so the cost depends on the depth of the path, the returned candidates
+    still have to be tested with osc_rematch_pattern. Candidates are
+    returned in the same order the addresses were given.
+    '''
+
+    def __init__(self, addresses=()):
+        self._root = dict()
+        self._count = 0
+        for address in addresses:
+            self.add(address)
+
+    def add(self, address):
+        node = self._root
+        for segment in address.split('/'):
+            node = node.setdefault(segment, dict())
+        if None not in node:
+            node[None] = (self._count, address)
+            self._count += 1
+
+    def candidates(self, pattern):
+        prefix = _literal_prefix(pattern)
+        if prefix is None:
+            nodes = [self._root]
+        else:
+            *segments, partial = prefix.split('/')
+            node = self._root
+            for segment in segments:
+                node = node.get(segment)
+                if node is None:
+                    return []
+            nodes = [
+                child for name, child in node.items()
+                if name is not None and name.startswith(partial)]
+        ret = []
+        while nodes:
+            node = nodes.pop()
+            for name, child in node.items():
+                if name is None:
+                    ret.append(child)
+                else:
+                    nodes.append(child)
+        ret.sort()
+        return [address for _, address in ret]
 
 
 ### Option 2 ###
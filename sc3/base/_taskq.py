@@ -1,4 +1,3 @@
-
 import heapq
 import itertools
 
@@ -12,10 +11,18 @@ class TaskQueue():
     documentation. heapq module in itself use the same principles as
     SuperCollider's clocks implementation. TaskQueue is not thread safe.
 
+    The head of the heap is always kept valid (removed entries are
+    discarded from the top eagerly) so `peek` is O(1) and `add`/`pop` are
+    O(log n). Lazily removed entries that are not at the top are compacted
+    in bulk once they outnumber the valid ones. The largest entry is cached
+    and only recomputed when the cached one is removed.
+
     '''
 
     class _REMOVED(): pass
 
+    _COMPACT_THRESHOLD = 64
+
     def __init__(self):
         self._init()
 
@@ -24,6 +31,8 @@ class TaskQueue():
         self._entry_finder = {}
         self._counter = itertools.count()
         self._removed_counter = 0
+        self._largest = None
+        self._largest_valid = True
 
     def add(self, prio, task):
         '''Add a new task or update the prio of an existing task.'''
@@ -33,15 +42,38 @@ class TaskQueue():
         entry = [prio, count, task]
         self._entry_finder[task] = entry
         heapq.heappush(self._queue, entry)
+        if self._largest_valid and (
+                self._largest is None or entry[:2] > self._largest[:2]):
+            self._largest = entry
 
     def remove(self, task):
         '''Remove an existing task. Does nothing if not found.'''
         try:
             entry = self._entry_finder.pop(task)
-            entry[-1] = type(self)._REMOVED
-            self._removed_counter += 1
         except KeyError:
             return
+        entry[-1] = type(self)._REMOVED
+        self._removed_counter += 1
+        if entry is self._largest:
+            self._largest = None
+            self._largest_valid = not self._entry_finder
+        if entry is self._queue[0]:
+            self._discard_head()
+        elif self._removed_counter > self._COMPACT_THRESHOLD\
+        and self._removed_counter > len(self._entry_finder):
+            self._compact()
+
+    def _discard_head(self):
+        queue = self._queue
+        while queue and queue[0][-1] is type(self)._REMOVED:
+            heapq.heappop(queue)
+            self._removed_counter -= 1
+
+    def _compact(self):
+        self._queue = [
+            e for e in self._queue if e[-1] is not type(self)._REMOVED]
+        heapq.heapify(self._queue)
+        self._removed_counter = 0
 
     def pop(self):
         '''
@@ -50,14 +82,15 @@ class TaskQueue():
 
         '''
 
-        while self._queue:
-            prio, count, task = heapq.heappop(self._queue)
-            if task is not type(self)._REMOVED:
-                del self._entry_finder[task]
-                return (prio, task)
-            else:
-                self._removed_counter -= 1
-        raise KeyError('pop from an empty task queue')
+        if not self._queue:
+            raise KeyError('pop from an empty task queue')
+        prio, _, task = entry = heapq.heappop(self._queue)
+        del self._entry_finder[task]
+        if entry is self._largest:
+            self._largest = None
+            self._largest_valid = not self._entry_finder
+        self._discard_head()
+        return (prio, task)
 
     def peek(self, smallest=True):
         '''
@@ -66,43 +99,37 @@ class TaskQueue():
 
         '''
 
-        if self._queue:
-            if smallest:
-                prio, count, task = heapq.nsmallest(
-                    1, self._queue, key=self._small_key)[0]
-            else:
-                prio, count, task = heapq.nlargest(
-                    1, self._queue, key=self._large_key)[0]
-            if task is not self._REMOVED:
-                return (prio, task)
-        raise KeyError('peek from an empty task queue')
-
-    def _small_key(self, item):
-        if item[2] is type(self)._REMOVED:
-            return [float('inf')] * 2
+        if not self._queue:
+            raise KeyError('peek from an empty task queue')
+        if smallest:
+            entry = self._queue[0]
         else:
-            return item[:2]
+            if not self._largest_valid:
+                self._largest = max(
+                    self._entry_finder.values(), key=self._prio_key)
+                self._largest_valid = True
+            entry = self._largest
+        return (entry[0], entry[2])
 
-    def _large_key(self, item):
-        if item[2] is type(self)._REMOVED:
-            return [float('-inf')] * 2
-        else:
-            return item[:2]
+    @staticmethod
+    def _prio_key(item):
+        return item[:2]
 
     def empty(self):
         '''Return True if queue is empty.'''
-        return (len(self._queue) - self._removed_counter) == 0
+        return not self._entry_finder
 
     def clear(self):
         '''Reset the queue to initial state (remove all tasks).'''
         self._init()
 
+    def __len__(self):
+        return len(self._entry_finder)
+
     def __iter__(self):
-        # FIXME: Returns a generator but creates the whole list first.
-        queue = heapq.nsmallest(len(self._queue), self._queue)
-        for prio, count, task in queue:
-            if task is not type(self)._REMOVED:
-                yield (prio, task)
+        queue = sorted(self._entry_finder.values(), key=self._prio_key)
+        for prio, _, task in queue:
+            yield (prio, task)
 
     # def __copy__(self):
     #     ...
@@ -0,0 +1,110 @@
+"""Asyncio integration.
+
+Request and reply flows with the server can be awaited from coroutines
+running in an asyncio event loop, e.g. ``await s.async_sync()``,
+``await buffer.async_getn(0, 64)`` or ``await bus.async_get()``. Replies
+are dispatched by the library as usual and resolve futures in the loop
+that is waiting for them, one loop can drive many servers at once.
+
+By default OSC is received by the library's UDP thread. Optionally,
+``open_udp_endpoint`` creates a local port served by the event loop
+itself::
+
+  await aio.open_udp_endpoint(57130)
+  s.addr.change_output_port(57130)
+
+TCP connections are served by the event loop with
+``await addr.async_connect()``.
+
+"""
+
+import socket
+
+from . import main as _libsc3
+from . import responders as rpd
+from . import _oscinterface as osci
+
+
+__all__ = ['open_udp_endpoint', 'osc_reply']
+
+
+async def open_udp_endpoint(port, port_range=1):
+    '''Open an extra UDP port served by the running event loop.
+
+    Parameters
+    ----------
+    port: int
+        Local port number.
+    port_range: int
+        Number of consecutive ports to try if port is in use.
+
+    Returns
+    -------
+    OscAsyncUdpInterface
+        The interface, use its ``port`` attribute to change the output
+        port of NetAddr objects. It is closed by its ``stop`` method.
+
+    '''
+
+    local_addr = (socket.gethostbyname('localhost'), port)
+    with _libsc3.main._main_lock:
+        interface = osci.OscInterface._local_endpoints.get(local_addr)
+    if interface is not None:
+        raise OSError(f'port {port} is already open')
+    interface = osci.OscAsyncUdpInterface(port, port_range)
+    await interface.start_async()
+    return interface
+
+
+def osc_reply(path, src_id=None, arg_template=None, transform=None):
+    '''Return a future resolved with the next matching OSC message.
+
+    This function must be called from a coroutine, the future belongs
+    to the running loop. The responder is freed when the message is
+    received or the future is cancelled, e.g. by ``asyncio.wait_for``.
+
+    Parameters
+    ----------
+    path: str
+        OSC address.
+    src_id: NetAddr
+        Optional sender address.
+    arg_template: list
+        Optional list of values to match the message's arguments,
+        as in ``OscFunc``.
+    transform: callable
+        An optional function that receives the message as a list and
+        returns the value of the future.
+
+    '''
+
+    loop = osci._get_running_loop()
+    future = loop.create_future()
+
+    def set_result(value):
+        if not future.done():
+            future.set_result(value)
+
+    def set_exception(e):
+        if not future.done():
+            future.set_exception(e)
+
+    def resp_func(msg, *_):
+        osc_func.free()
+        try:
+            value = msg if transform is None else transform(msg)
+        except Exception as e:
+            loop.call_soon_threadsafe(set_exception, e)
+        else:
+            loop.call_soon_threadsafe(set_result, value)
+
+    def done_callback(future):
+        if future.cancelled():
+            with _libsc3.main._main_lock:
+                osc_func.free()
+
+    with _libsc3.main._main_lock:
+        osc_func = rpd.OscFunc(
+            resp_func, path, src_id, arg_template=arg_template)
+    future.add_done_callback(done_callback)
+    return future
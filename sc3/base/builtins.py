@@ -6,7 +6,13 @@
 # sclang's behaviour too (e.g. mod and random functions). They will need to be
 # optimized along with events, patterns and streams. However, when running the
 # library on pypy all unoptimized code at least matches sclang.
+#
+# Builtins also accept a list, tuple, array.array or numpy array as first
+# argument and return a sequence of results. Some have vectorized numpy
+# kernels (see Vectorized section below) for numeric sequences, otherwise
+# the function is mapped element by element (numpy is optional).
 
+import array
 import math
 import builtins
 
@@ -14,6 +20,12 @@ from ..base import _hooks as hks
 
 
 _libsc3 = hks.late_import(__name__, 'sc3.base.main', '_libsc3')
+np = hks.import_optional_module('numpy')
+
+
+_VECTOR_TYPES = {list, tuple, array.array}
+if not isinstance(np, hks.OptionalModuleProxy):
+    _VECTOR_TYPES.add(np.ndarray)
 
 
 # Module Constants
@@ -50,6 +62,8 @@ class scbuiltin():
             try:
                 return x._compose_unop(func)
             except AttributeError:
+                if type(x) in _VECTOR_TYPES:
+                    return _vector_op(scbuiltin_, x, ())
                 try:
                     return func(x)
                 except TypeError:
@@ -59,6 +73,7 @@ class scbuiltin():
 
         scbuiltin_.__name__ = func.__name__  # used to obtain special_index.
         scbuiltin_.__qualname__ += func.__name__
+        scbuiltin_.kernel = None
         return scbuiltin_
 
     @staticmethod
@@ -67,6 +82,8 @@ class scbuiltin():
             try:
                 return a._compose_binop(func, *b)
             except AttributeError:
+                if type(a) in _VECTOR_TYPES:
+                    return _vector_op(scbuiltin_, a, b)
                 try:
                     return b._rcompose_binop(func, a)
                 except AttributeError:
@@ -86,6 +103,7 @@ class scbuiltin():
 
         scbuiltin_.__name__ = func.__name__  # used to obtain special_index.
         scbuiltin_.__qualname__ += func.__name__
+        scbuiltin_.kernel = None
         return scbuiltin_
 
     @staticmethod
@@ -94,6 +112,8 @@ class scbuiltin():
             try:
                 return x._compose_narop(func, *args)
             except AttributeError:
+                if type(x) in _VECTOR_TYPES:
+                    return _vector_op(scbuiltin_, x, args)
                 try:
                     return func(x, *args)
                 except TypeError:
@@ -104,9 +124,78 @@ class scbuiltin():
 
         scbuiltin_.__name__ = func.__name__  # used to obtain special_index.
         scbuiltin_.__qualname__ += func.__name__
+        scbuiltin_.kernel = None
         return scbuiltin_
 
 
+def _vector_op(builtin, x, args):
+    # Sequences are processed by the builtin's kernel if it has one and
+    # the arguments are numeric, else the builtin is mapped, which also
+    # supports nested sequences and abstract objects as elements.
+    if builtin.kernel is not None\
+    and all(isinstance(a, (int, float, str)) or a is None for a in args):
+        arr = _as_ndarray(x)
+        if arr is not None:
+            with np.errstate(all='ignore'):  # Masked values.
+                result = builtin.kernel(arr, *args)
+            if result is not NotImplemented:
+                return _from_ndarray(result, x)
+    results = [builtin(i, *args) for i in x]
+    if type(x) is array.array:
+        if all(type(i) is int for i in results):
+            return array.array(x.typecode, results)
+        return array.array('d', results)
+    if type(x) is not list and type(x) is not tuple:
+        return np.array(results)
+    return results
+
+
+def _as_ndarray(x):
+    # Return x as int64 or float64 numpy array or None if x is not
+    # homogeneous, int and float elements follow different semantics.
+    if isinstance(np, hks.OptionalModuleProxy):
+        return None
+    if type(x) is array.array:
+        if x.typecode == 'u':
+            return None
+        x = np.frombuffer(x, x.typecode) if x else np.array([], x.typecode)
+    if type(x) is np.ndarray:
+        if x.dtype.kind == 'f':
+            return x.astype(np.float64, copy=False)
+        if x.dtype.kind in 'iu':
+            return x.astype(np.int64, copy=False)
+        return None
+    types = set(map(type, x))
+    try:
+        if types <= {float}:
+            return np.array(x, np.float64)
+        if types == {int}:
+            return np.array(x, np.int64)
+    except OverflowError:
+        pass
+    return None
+
+
+def _from_ndarray(result, x):
+    if type(x) is np.ndarray:
+        return result
+    if type(x) is array.array:
+        code = 'd' if result.dtype.kind == 'f' else x.typecode
+        return array.array(code, result.astype(code, copy=False).tobytes())
+    return result.tolist()
+
+
+def _vectorized(builtin):
+    # Set the numpy kernel of a builtin. Kernels receive the sequence as an
+    # int64 or float64 array and the builtin's arguments as numbers, and
+    # must return the same values as the builtin does for each element,
+    # or NotImplemented to map the builtin.
+    def decorator(kernel):
+        builtin.kernel = kernel
+        return kernel
+    return decorator
+
+
 ### Random ###
 
 # Have special index.
@@ -1150,7 +1239,7 @@ def lincurve(x, inmin, inmax, outmin, outmax, curve=-4, clip='minmax'):
     a = (outmax - outmin) / (1.0 - grow)
     b = outmin + a
     scaled = (x - inmin) / (inmax - inmin)
-    return b - a * math.pow(grow, scaled, math.e)
+    return b - a * math.pow(grow, scaled)
 
 @scbuiltin.narop
 def curvelin(x, inmin, inmax, outmin, outmax, curve=-4, clip='minmax'):
@@ -1230,6 +1319,134 @@ def gauss_curve(x, a=1.0, b=0.0, c=1.0):
 # dist
 
 
+### Vectorized ###
+
+def _clip_mask(x, inmin, inmax, outmin, outmax, clip, y):
+    # Same clipping as linlin and alike.
+    if clip == 'minmax':
+        return np.where(x <= inmin, outmin, np.where(x >= inmax, outmax, y))
+    elif clip == 'min':
+        return np.where(x <= inmin, outmin, y)
+    elif clip == 'max':
+        return np.where(x >= inmax, outmax, y)
+    return y
+
+@_vectorized(midicps)
+def _midicps(x):
+    return 440. * np.power(2., (x - 69.) * _ONETWELFTH)
+
+@_vectorized(midiratio)
+def _midiratio(x):
+    return np.power(2., x * _ONETWELFTH)
+
+@_vectorized(dbamp)
+def _dbamp(x):
+    return np.power(10., x * .05)
+
+@_vectorized(mod)
+def _mod(a, b):
+    is_float = a.dtype.kind == 'f' or type(b) is float
+    if is_float:
+        a = a.astype(np.float64, copy=False)
+    ge = a >= b
+    lt = ~ge & (a < 0)
+    a = np.where(ge, a - b, np.where(lt, a + b, a))
+    done = (ge & (a < b)) | (lt & (a >= 0)) | ~(ge | lt)
+    if b == 0:
+        c = np.zeros_like(a)
+    elif is_float:
+        c = a - b * np.floor(a / b)
+    else:
+        c = np.fmod(a, b)
+        c = np.where(c < 0, c + b, c)
+    return np.where(done, a, c)
+
+@_vectorized(wrap)
+def _wrap(x, lo, hi, range=None):
+    if x.dtype.kind == 'i':
+        lo = int(lo)
+        hi = int(hi)
+        return _mod(x - lo, hi - lo + 1) + lo
+    if range is None:
+        range = hi - lo
+    ge = x >= hi
+    lt = ~ge & (x < lo)
+    y = np.where(ge, x - range, np.where(lt, x + range, x))
+    done = (ge & (y < hi)) | (lt & (y >= lo)) | ~(ge | lt)
+    if hi == lo:
+        c = np.full_like(y, lo)
+    else:
+        c = y - range * np.floor((y - lo) / range)
+    return np.where(done, y, c)
+
+@_vectorized(fold)
+def _fold(x, lo, hi, range=None, range2=None):
+    if x.dtype.kind == 'i':
+        lo = int(lo)
+        hi = int(hi)
+        b = hi - lo
+        b2 = b + b
+        c = _mod(x - lo, b2)
+        return np.where(c > b, b2 - c, c) + lo
+    if range is not None or range2 is not None:
+        return NotImplemented
+    x2 = x - lo
+    ge = x >= hi
+    lt = ~ge & (x < lo)
+    y = np.where(ge, hi + hi - x, np.where(lt, lo + lo - x, x))
+    done = (ge & (y >= lo)) | (lt & (y < hi)) | ~(ge | lt)
+    if hi == lo:
+        c = np.full_like(y, lo)
+    else:
+        range = hi - lo
+        range2 = range + range
+        c = x2 - range2 * np.floor(x2 / range2)
+        c = np.where(c >= range, range2 - c, c) + lo
+    return np.where(done, y, c)
+
+@_vectorized(round)
+def _round(x, quant=1):
+    if x.dtype.kind == 'i':
+        quant = int(quant)
+        if quant == 0:
+            return x.astype(np.float64)
+        a = x + quant // 2
+        c = np.trunc(np.where(a < 0, (a + 1) / quant - 1, a / quant))
+        return (c.astype(np.int64) * quant).astype(np.float64)
+    if quant == 0.:
+        return x
+    return np.floor(x / quant + .5) * quant
+
+@_vectorized(clip)
+def _clip(x, lo, hi):
+    T = int if x.dtype.kind == 'i' else float
+    lo = T(lo)
+    hi = T(hi)
+    x = np.where(hi < x, hi, x)  # Same as builtins.min and max.
+    return np.where(lo > x, lo, x)
+
+@_vectorized(linlin)
+def _linlin(x, inmin, inmax, outmin, outmax, clip='minmax'):
+    if inmax == inmin:
+        return NotImplemented
+    y = (x - inmin) / (inmax - inmin) * (outmax - outmin) + outmin
+    return _clip_mask(x, inmin, inmax, outmin, outmax, clip, y)
+
+@_vectorized(lincurve)
+def _lincurve(x, inmin, inmax, outmin, outmax, curve=-4, clip='minmax'):
+    if inmax == inmin:
+        return NotImplemented
+    if abs(curve) < 0.001:
+        y = (x - inmin) / (inmax - inmin) * (outmax - outmin) + outmin
+    else:
+        grow = math.exp(curve)
+        a = (outmax - outmin) / (1.0 - grow)
+        b = outmin + a
+        scaled = (x - inmin) / (inmax - inmin)
+        y = b - a * np.power(grow, scaled)
+    return _clip_mask(x, inmin, inmax, outmin, outmax, clip, y)
+
+
 ### Array ###
 
 # The next sclang functios operate over lists and don't map to server opcodes.
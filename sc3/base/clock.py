@@ -637,7 +637,104 @@ class Quant():
 # */
 
 
+class _SharedTempoScheduler():
+    # Drives any number of TempoClock instances from a single timing thread.
+    # Clocks keep their own queues in beats while this object keeps a merged
+    # queue with the next deadline of each clock in seconds, it has to be
+    # updated by the clocks each time their head or tempo changes.
+
+    def __init__(self):
+        self._queue = tsq.TaskQueue()
+        self._cond = threading.Condition(_libsc3.main._main_lock)
+        self._reset_metrics()
+        self._run_sched = True
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f'{type(self).__name__} id: {id(self)}',
+            daemon=True)
+        self._thread.start()
+        _libsc3.main._atexitq.add(
+            _libsc3.main._atexitprio.CLOCKS + 3, self._stop)
+
+    def _reset_metrics(self):
+        self._wakeups = 0
+        self._jitter_sum = 0.0
+        self._jitter_max = 0.0
+        self._jitter_last = 0.0
+
+    def _metrics(self):
+        return {
+            'clocks': len(self._queue),
+            'wakeups': self._wakeups,
+            'mean_jitter': self._jitter_sum / (self._wakeups or 1),
+            'max_jitter': self._jitter_max,
+            'last_jitter': self._jitter_last}
+
+    def _update(self, clock):
+        # Call with acquired lock.
+        if clock._task_queue.empty():
+            self._queue.remove(clock)
+            return
+        if self._queue.empty():
+            prev_time = None
+        else:
+            prev_time = self._queue.peek()[0]
+        self._queue.add(clock.beats2secs(clock._task_queue.peek()[0]), clock)
+        if self._queue.peek()[0] != prev_time:
+            self._cond.notify()
+
+    def _remove(self, clock):
+        # Call with acquired lock.
+        self._queue.remove(clock)
+
+    def _stop(self):
+        if not self._run_sched:
+            return
+        with self._cond:
+            self._queue.clear()
+            self._run_sched = False
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        with self._cond:
+            while True:
+                # // wait until there is something in scheduler
+                while self._queue.empty():
+                    self._cond.wait()
+                    if not self._run_sched:
+                        return
+                if not self._run_sched:
+                    return
+
+                # // wait until the next clock is ready
+                now = _libsc3.main.elapsed_time()
+                deadline, clock = self._queue.peek()
+                if now < deadline:
+                    self._cond.wait(deadline - now)
+                    continue
+
+                jitter = now - deadline
+                self._wakeups += 1
+                self._jitter_sum += jitter
+                self._jitter_last = jitter
+                if jitter > self._jitter_max:
+                    self._jitter_max = jitter
+
+                # // perform all events of the clock that are ready
+                self._queue.pop()
+                if clock._task_queue.empty():
+                    continue
+                # Deadline was converted from beats, avoid rounding errors.
+                clock._perform(max(
+                    clock.secs2beats(now), clock._task_queue.peek()[0]))
+                if clock._run_sched:
+                    self._update(clock)
+
+
 class MetaTempoClock(MetaClock):
+    _shared_scheduler = None
+
     def __init__(cls, *_):
         cls._all = weakref.WeakSet()
 
@@ -660,6 +757,32 @@ class MetaTempoClock(MetaClock):
         for clock in list(cls._all):
             clock.stop()
 
+    def shared_metrics(cls, reset=False):
+        '''Return the wake-up metrics of the shared scheduling thread.
+
+        The returned dict contains the number of `clocks` with pending tasks
+        driven by the shared thread, the number of `wakeups` and the `mean`,
+        `max` and `last` wake-up jitter, i.e. the time in seconds between
+        the deadline of a clock and the actual dispatch of its tasks. If
+        `reset` is True the values are reset after being returned.
+
+        '''
+
+        if _libsc3.main is not _libsc3.RtMain or cls._shared_scheduler is None:
+            return None
+        with cls._shared_scheduler._cond:
+            ret = cls._shared_scheduler._metrics()
+            if reset:
+                cls._shared_scheduler._reset_metrics()
+        return ret
+
+    def _get_shared_scheduler(cls):
+        with _libsc3.main._main_lock:
+            if cls._shared_scheduler is None\
+            or not cls._shared_scheduler._run_sched:
+                MetaTempoClock._shared_scheduler = _SharedTempoScheduler()
+            return cls._shared_scheduler
+
 
     ### System Actions ###
 
@@ -686,6 +809,11 @@ class TempoClock(Clock, metaclass=MetaTempoClock):
     seconds : int | float
         The reference time in seconds, to which the beats argument
         corresponds. Defaults to the current Thread's `logical time`.
+    shared : bool
+        If True the clock does not start its own scheduling thread, it is
+        driven by a single timing thread shared by all the clocks created
+        with this option. Wake-up metrics of that thread are returned by
+        `TempoClock.shared_metrics()`. Defaults to False.
 
     Notes
     -----
@@ -727,7 +855,8 @@ class TempoClock(Clock, metaclass=MetaTempoClock):
 
     '''
 
-    def __init__(self, tempo=None, beats=None, seconds=None):
+    def __init__(self, tempo=None, beats=None, seconds=None, *,
+                 shared=False):
         # prTempoClock_New
         tempo = tempo or 1.0  # tempo=0 is invalid too.
         if tempo < 0.0:
@@ -745,17 +874,25 @@ class TempoClock(Clock, metaclass=MetaTempoClock):
         self._base_bar_beat = 0.0
         self._base_bar = 0.0
         self.permanent = False
+        self._scheduler = None
         type(self)._all.add(self)
 
         if _libsc3.main is _libsc3.RtMain:
             self._pure_nrt = False
             self._task_queue = tsq.TaskQueue()
-            self._sched_cond = threading.Condition(_libsc3.main._main_lock)
-            self._thread = threading.Thread(
-                target=self._run,
-                name=f'{type(self).__name__} id: {id(self)}',
-                daemon=True)
-            self._thread.start()
+            if shared:
+                self._scheduler = type(self)._get_shared_scheduler()
+                self._sched_cond = self._scheduler._cond
+                self._thread = self._scheduler._thread
+                self._run_sched = True
+            else:
+                self._sched_cond = threading.Condition(
+                    _libsc3.main._main_lock)
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f'{type(self).__name__} id: {id(self)}',
+                    daemon=True)
+                self._thread.start()
             _libsc3.main._atexitq.add(
                 _libsc3.main._atexitprio.CLOCKS + 2, self._stop)
         else:
@@ -796,29 +933,40 @@ class TempoClock(Clock, metaclass=MetaTempoClock):
                         return
 
                 # // perform all events that are ready
-                while not self._task_queue.empty()\
-                and elapsed_beats >= self._task_queue.peek()[0]:
-                    item = self._task_queue.pop()
-                    self._beats = item[0]
-                    task = item[1]
-                    try:
-                        _libsc3.main._update_logical_time(
-                            self.beats2secs(self._beats))
-                        _libsc3.main._in_awake_call = True
-                        delta = task.__awake__(self)
-                        if isinstance(delta, (int, float))\
-                        and not isinstance(delta, bool):
-                            time = self._beats + delta
-                            self._sched_add(time, task)
-                    except stm.StopStream:
-                        pass
-                    except Exception:
-                        _logger.error(
-                            '%s(%s) scheduled on TempoClock id %s',
-                            type(task).__name__, task.func.__qualname__,
-                            id(self), exc_info=1)
-                    finally:
-                        _libsc3.main._in_awake_call = False
+                self._perform(elapsed_beats)
+
+    def _perform(self, elapsed_beats):
+        # Call with acquired lock.
+        while not self._task_queue.empty()\
+        and elapsed_beats >= self._task_queue.peek()[0]:
+            item = self._task_queue.pop()
+            self._beats = item[0]
+            task = item[1]
+            try:
+                _libsc3.main._update_logical_time(
+                    self.beats2secs(self._beats))
+                _libsc3.main._in_awake_call = True
+                delta = task.__awake__(self)
+                if isinstance(delta, (int, float))\
+                and not isinstance(delta, bool):
+                    time = self._beats + delta
+                    self._sched_add(time, task)
+            except stm.StopStream:
+                pass
+            except Exception:
+                _logger.error(
+                    '%s(%s) scheduled on TempoClock id %s',
+                    type(task).__name__, task.func.__qualname__,
+                    id(self), exc_info=1)
+            finally:
+                _libsc3.main._in_awake_call = False
+
+    def _notify(self):
+        # Call with acquired lock.
+        if self._scheduler is None:
+            self._sched_cond.notify()  # NOTE: is notify_one in C++.
+        else:
+            self._scheduler._update(self)
 
     def stop(self):
         '''Stop the clock's scheduling thread.
@@ -848,8 +996,12 @@ class TempoClock(Clock, metaclass=MetaTempoClock):
             self._task_queue.clear()
             type(self)._all.remove(self)
             self._run_sched = False
-            self._sched_cond.notify_all()
-        self._thread.join()
+            if self._scheduler is None:
+                self._sched_cond.notify_all()
+            else:
+                self._scheduler._remove(self)
+        if self._scheduler is None:
+            self._thread.join()
         self._thread = None
         self._sched_cond = None
 
@@ -922,7 +1074,7 @@ class TempoClock(Clock, metaclass=MetaTempoClock):
             return
         else:
             with self._sched_cond:
-                self._sched_cond.notify()  # NOTE: is notify_one in C++.
+                self._notify()
 
     def etempo(self, value):
         '''Set the current tempo at the current `elapsed time`.
@@ -951,7 +1103,7 @@ class TempoClock(Clock, metaclass=MetaTempoClock):
             return
         else:
             with self._sched_cond:
-                self._sched_cond.notify()  # NOTE: is notify_one in C++.
+                self._notify()
 
     @property
     def beat_dur(self):
@@ -1009,7 +1161,7 @@ class TempoClock(Clock, metaclass=MetaTempoClock):
             return
         else:
             with self._sched_cond:
-                self._sched_cond.notify()  # NOTE: is notify_one in C++
+                self._notify()
 
     @property
     def seconds(self):
@@ -1024,7 +1176,7 @@ class TempoClock(Clock, metaclass=MetaTempoClock):
             prev_beat = self._task_queue.peek()[0]
         self._task_queue.add(beats, task)
         if self._task_queue.peek()[0] != prev_beat:
-            self._sched_cond.notify()
+            self._notify()
 
     def _sched_add_nrt(self, beats, task):
         ClockTask(beats, self, task, _libsc3.main._clock_scheduler)
@@ -1086,7 +1238,7 @@ class TempoClock(Clock, metaclass=MetaTempoClock):
             with self._sched_cond:
                 while not self._task_queue.empty():
                     self._task_queue.pop()
-                self._sched_cond.notify()  # NOTE: is notify_one in C++.
+                self._notify()
 
     @property
     def beats_per_bar(self):
@@ -1,7 +1,12 @@
 """Kernel.sc & Main.sc"""
 
+import concurrent.futures
 import enum
+import logging
+import multiprocessing
+import subprocess
 import threading
+import uuid
 import atexit
 import pathlib
 import time
@@ -25,6 +30,9 @@ from . import responders as rpd
 __all__ = ['main', 'RtMain', 'NrtMain']
 
 
+_logger = logging.getLogger(__name__)
+
+
 main = None
 '''Default main class global variable set by sc3.init().'''
 
@@ -386,6 +394,144 @@ class NrtMain(metaclass=Process):
         else:
             ValueError(f'invalid protocol name {repr(proto)}')
 
+    @classmethod
+    def stream_score(cls, path, keep_list=False):
+        '''Write the OSC score to a file while it is generated.
+
+        Bundles are written as soon as the clock passes their time so
+        memory use doesn't grow with the length of the score. The file
+        is complete after the score is returned by `process`. Scores
+        created by `reset` don't stream.
+
+        Parameters
+        ----------
+        path : str | pathlib.Path
+            Output OSC file.
+        keep_list : bool
+            Also keep the bundles as lists for the score's `list`
+            property, memory use then grows with the score.
+
+        '''
+
+        cls._osc_interface._osc_score.stream(path, keep_list)
+
+    @classmethod
+    def render_batch(cls, funcs, paths, tailtime=0, input_file=None,
+                     server=None, workers=None, concurrency=None,
+                     ranges=None):
+        '''Generate and render many scores in parallel.
+
+        Each function is called in a worker process with its own NRT
+        state after `reset`, it has to schedule the score's content as
+        would be done before calling `process`. Scores are streamed to
+        temporary OSC files and rendered as soon as they are finished.
+
+        Parameters
+        ----------
+        funcs : iterable
+            Functions that generate the scores, they must be picklable
+            (i.e. defined at module level) and are called without
+            arguments, use `functools.partial` for parameters.
+        paths : iterable
+            Output sound file path of each score.
+        tailtime : float
+            Wait time after the last event of each score.
+        input_file : str | pathlib.Path
+            Optional input sound file for all the renders.
+        server : Server
+            Server whose options are used to run the render commands,
+            default server if None.
+        workers : int
+            Maximum number of processes generating scores, number of
+            processors if None.
+        concurrency : int
+            Maximum number of render commands running at the same time,
+            same as workers if None.
+        ranges : iterable
+            Optional `(start, end)` time ranges in seconds, each score is
+            split into one sub-score per range rendered as a separate
+            command, `end` can be None for the end of the score. The
+            output of range `i` is the score's path with `_i` appended
+            to the file name stem. Sub-scores contain the bundles at
+            time 0 and the ones within the range with their time moved
+            by `start`, nodes created before the range are not in it.
+            Use ranges for scores of independent events or split at
+            silences.
+
+        Returns
+        -------
+        A list of `(path, exit_code)` tuples in the order of `funcs`,
+        and of `ranges` for each function. Exit code is None if the
+        score could not be generated.
+
+        '''
+
+        paths = [pathlib.Path(path) for path in paths]
+        funcs = list(funcs)
+        if len(funcs) != len(paths):
+            raise ValueError('funcs and paths must have the same length')
+        if ranges is None:
+            outputs = [[path] for path in paths]
+        else:
+            ranges = [tuple(r) for r in ranges]
+            outputs = [
+                [path.with_name(f'{path.stem}_{i}{path.suffix}')
+                 for i in range(len(ranges))]
+                for path in paths]
+        workers = workers or multiprocessing.cpu_count()
+        concurrency = concurrency or workers
+        plf.Platform.tmp_dir.mkdir(parents=True, exist_ok=True)
+        osc_files = [
+            [plf.Platform.tmp_dir / f'SC_{uuid.uuid4().hex}.osc'
+             for _ in output]
+            for output in outputs]
+        renders = [None] * len(funcs)
+
+        def render(error, osc_file, path):
+            if error is not None:
+                _logger.error(
+                    'could not generate score for %s', path, exc_info=error)
+                return None
+            cmd = osci.OscScore._render_cmd(
+                osc_file, path, input_file, server)
+            try:
+                return subprocess.run(
+                    cmd, stdin=subprocess.DEVNULL).returncode
+            finally:
+                osc_file.unlink()
+
+        def launch(i, error=None):
+            # Renders are launched in completion order, from the pool's
+            # result thread.
+            renders[i] = [
+                render_pool.submit(render, error, file, path)
+                for file, path in zip(osc_files[i], outputs[i])]
+
+        score_pool = sc3._nrt_pool(min(workers, len(funcs)) or 1)
+        render_pool = concurrent.futures.ThreadPoolExecutor(concurrency)
+
+        try:
+            with score_pool, render_pool:
+                scores = [
+                    score_pool.apply_async(
+                        _batch_score, (func, files, tailtime, ranges),
+                        callback=lambda _, i=i: launch(i),
+                        error_callback=lambda e, i=i: launch(i, e))
+                    for i, (func, files) in enumerate(zip(funcs, osc_files))]
+                for score in scores:
+                    score.wait()  # After the callback.
+                return [
+                    (path, future.result())
+                    for output, futures in zip(outputs, renders)
+                    for path, future in zip(output, futures)]
+        finally:
+            for files in osc_files:
+                for osc_file in files:
+                    try:
+                        osc_file.unlink()
+                    except FileNotFoundError:
+                        pass
+
     @classmethod
     def reset(cls):
         '''Reset sc3 time, scheduler and command scores to initial state.'''
@@ -394,3 +540,35 @@ class NrtMain(metaclass=Process):
         cls._clock_scheduler.reset()
         cls._osc_interface.init()  # Reset OscScore.
         cls._midi_interface.init()  # Reset MidiScore.
+
+
+### Batch rendering ###
+
+def _batch_score(func, osc_files, tailtime, ranges):
+    main.reset()
+    if ranges is None:
+        main.stream_score(osc_files[0])
+        func()
+        main.process(tailtime)
+        return
+    func()
+    main._clock_scheduler.run()
+    queue = main._osc_interface._osc_score._scoreq
+    bundles = [entry.bndl for _, entry in queue][1:]  # Without root group.
+    last = max((b[0] for b in bundles), default=0.0)
+    for (start, end), osc_file in zip(ranges, osc_files):
+        main.reset()
+        score = main._osc_interface._osc_score
+        for bndl in bundles:
+            if bndl[0] == 0 or start <= bndl[0]\
+            and (end is None or bndl[0] < end):
+                score.add(_shift_bundle(bndl, start))
+        score.finish((last if end is None else end) - start + tailtime)
+        score.write(osc_file)
+
+
+def _shift_bundle(bndl, offset):
+    return [
+        max(bndl[0] - offset, 0.0),
+        *(e if isinstance(e[0], str) else _shift_bundle(e, offset)
+          for e in bndl[1:])]
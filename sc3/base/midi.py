@@ -62,6 +62,25 @@ class MidiOut(MidiIO):
     def send_msg(self, msg, **kwargs):
         _libsc3.main._midi_interface.send_msg(self._port, msg, **kwargs)
 
+    def sched_msg(self, delta, msg, **kwargs):
+        '''Send a message delta seconds after the current logical time.
+
+        Scheduled messages are sent by a dedicated thread at their time,
+        messages with the same time keep their order.
+        '''
+        self.sched_msgs([(delta, msg, kwargs)])
+
+    def sched_msgs(self, msgs):
+        '''Schedule many messages at once.
+
+        Parameters
+        ----------
+        msgs: iterable
+            (delta, msg, kwargs) tuples, delta is relative to the
+            current logical time and kwargs a dict of message values.
+        '''
+        _libsc3.main._midi_interface.sched_msgs(self._port, msgs)
+
     def reset(self):
         self._port.reset()
 
@@ -8,6 +8,7 @@ from . import main as _libsc3
 from . import builtins as bi
 from . import responders as rpd
 from . import _oscinterface as osci
+from . import aio
 
 
 __all__ = ['NetAddr', 'BundleNetAddr']
@@ -42,6 +43,7 @@ class NetAddr():
     # IP header)".
     _MAX_UDP_DGRAM_SIZE = 65504  # It is 4 instead of 7 (pad4).
     _SYNC_BNDL_DGRAM_SIZE = 36  # Size of bundle(latency, ['/sync', id]) dgram.
+    _NUMBER_TYPES = frozenset((int, float, bool, type(None)))
 
     def __init__(self, hostname, port):
         if hostname is None:
@@ -127,6 +129,29 @@ class NetAddr():
             self._osc_interface.try_connect(
                 self._target, timeout, on_complete, on_failure)
 
+    async def async_connect(self, local_port=None):
+        '''
+        Coroutine version of ``connect`` to be awaited from an asyncio event
+        loop, the connection is served by the loop. Raises OSError if the
+        connection fails.
+        '''
+
+        with _libsc3.main._main_lock:
+            if self._osc_interface.proto == 'tcp'\
+            and self._osc_interface.is_connected:
+                self.disconnect()
+            interface = osci.OscAsyncTcpInterface(
+                local_port or self.lang_port() + 1, 100)
+            interface.bind()
+        try:
+            await interface.connect_async(self._target)
+        except OSError:
+            with _libsc3.main._main_lock:
+                interface.disconnect()
+            raise
+        with _libsc3.main._main_lock:
+            self._osc_interface = interface
+
     def disconnect(self):
         '''Close TCP connection to this address.'''
         if self._osc_interface is _libsc3.main._osc_interface:
@@ -196,8 +221,9 @@ class NetAddr():
         This method is used to send bundles larger than UDP datagram size
         as successive sub-clumped packages.
         '''
-        if self._calc_bndl_dgram_size(elements) > self._MAX_UDP_DGRAM_SIZE:
-            for item in self._clump_bundle(elements):
+        sizes = [self._calc_element_dgram_size(e) for e in elements]
+        if 16 + sum(sizes) + 4 * len(sizes) > self._MAX_UDP_DGRAM_SIZE:
+            for item in self._clump_bundle(elements, sizes=sizes):
                 if time is not None:
                     time += 1e-9  # One nanosecond later each.
                 self.send_bundle(time, *item)
@@ -254,6 +280,31 @@ class NetAddr():
                 self.send_bundle(latency, *elements)
                 yield from condition.wait()
 
+    async def async_sync(self, latency=None, elements=None):
+        '''
+        Coroutine version of ``sync`` to be awaited from an asyncio event
+        loop, parameters are the same except for the condition.
+        '''
+
+        if elements is None:
+            await self._async_sync_bundle(latency, [])
+            return
+        max_size = self._MAX_UDP_DGRAM_SIZE - self._SYNC_BNDL_DGRAM_SIZE
+        if self._calc_bndl_dgram_size(elements) > max_size:
+            for item in self._clump_bundle(elements, max_size):
+                await self._async_sync_bundle(latency, item)
+                if latency is not None:
+                    latency += 1e-9  # One nanosecond later each.
+        else:
+            await self._async_sync_bundle(latency, list(elements))
+
+    async def _async_sync_bundle(self, latency, elements):
+        with _libsc3.main._main_lock:
+            id = bi.uid()
+            future = aio.osc_reply('/synced', self, [id])
+            self.send_bundle(latency, *elements, ['/sync', id])
+        await future
+
     def _make_sync_responder(self, condition):
         id = bi.uid()
 
@@ -266,21 +317,14 @@ class NetAddr():
         resp = rpd.OscFunc(resp_func, '/synced', self)
         return id
 
-    def _clump_bundle(self, elements, size=8192):
-        elist = []
-        for e in elements:
-            if isinstance(e[0], str):
-                elist.append((self._calc_msg_dgram_size(e), e))
-            elif isinstance(e[0], (int, float)):  # bundle
-                elist.append((self._calc_bndl_dgram_size(e[1:]), e))
-            else:
-                raise ValueError(
-                    'elements within bundles must be valid OSC '
-                    f'messages or bundles, received: {e}')
+    def _clump_bundle(self, elements, size=8192, sizes=None):
+        if sizes is None:
+            sizes = [self._calc_element_dgram_size(e) for e in elements]
         res = []
         clump = []
         acc_size = 16  # Bundle prefix + Timetag bytes.
-        for s, e in elist:
+        for s, e in zip(sizes, elements):
+            s += 4  # Element size bytes.
             if acc_size + s >= size:
                 res.append(clump)
                 clump = []
@@ -295,22 +339,26 @@ class NetAddr():
         # Argument elements is the content without Timetag: [[], [], ...].
         res = 16  # Bundle prefix + Timetag bytes.
         for e in elements:
-            res += 4  # Element size bytes.
-            if isinstance(e[0], str):  # message
-                res += self._calc_msg_dgram_size(e)
-            elif isinstance(e[0], (int, float)):  # bundle
-                res += self._calc_bndl_dgram_size(e[1:])
-            else:
-                raise ValueError(
-                    'elements within bundles must be valid OSC '
-                    f'messages or bundles, received: {e}')
+            res += 4 + self._calc_element_dgram_size(e)  # + Element size bytes.
         return res
 
+    def _calc_element_dgram_size(self, e):
+        if isinstance(e[0], str):  # message
+            return self._calc_msg_dgram_size(e)
+        elif isinstance(e[0], (int, float)):  # bundle
+            return self._calc_bndl_dgram_size(e[1:])
+        else:
+            raise ValueError(
+                'elements within bundles must be valid OSC '
+                f'messages or bundles, received: {e}')
+
     def _calc_msg_dgram_size(self, msg):
         res = self._strpad4(len(bytes(msg[0], 'ascii')))  # Address.
         res += self._strpad4(len(msg[1:]) + 1)  # Type tag string.
         for val in msg[1:]:
-            if isinstance(val, str):
+            if type(val) in self._NUMBER_TYPES:
+                res += 4
+            elif isinstance(val, str):
                 res += self._strpad4(len(val))
             elif isinstance(val, (bytes, bytearray, memoryview)):
                 res += len(val) + 4  # Blob size bytes.
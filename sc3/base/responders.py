@@ -1,6 +1,7 @@
 """ResponseDefs.sc"""
 
 from abc import ABC, abstractmethod
+import inspect
 import logging
 
 from ..synth import server as srv
@@ -9,7 +10,9 @@ from . import systemactions as sac
 from . import model as mdl
 from . import main as _libsc3
 from . import utils as utl
+from . import _midiinterface as mii
 from ._oscmatch import osc_rematch_pattern as _match_osc_address_pattern
+from ._oscmatch import OscAddressIndex as _OscAddressIndex
 
 
 __all__ = ['OscFunc', 'MidiFunc', 'oscfunc', 'midifunc']
@@ -386,11 +389,25 @@ class OscMessageDispatcher(AbstractWrappingDispatcher):
 
 
 class OscMessagePatternDispatcher(OscMessageDispatcher):
+    def __init__(self):
+        super().__init__()
+        self._index = None  # Rebuilt lazily after add/remove.
+
+    def add(self, func_proxy):
+        super().add(func_proxy)
+        self._index = None
+
+    def remove(self, func_proxy):
+        super().remove(func_proxy)
+        self._index = None
+
     def __call__(self, msg, time, addr, recv_port):
         pattern = msg[0]
-        for key, funcs in self.active.copy().items():
+        if self._index is None:
+            self._index = _OscAddressIndex(self.active)
+        for key in self._index.candidates(pattern):
             if _match_osc_address_pattern(pattern, key):
-                for func in funcs:
+                for func in tuple(self.active.get(key, ())):
                     fn.value(func, msg, time, addr, recv_port)
 
     def type_key(self):
@@ -569,6 +586,15 @@ class OscFunc(AbstractResponderFunc):
 ### MIDI ###
 
 
+def _fixed_arity(func):
+    # Same as fn.value but the signature is inspected only once.
+    parameters = inspect.signature(func).parameters
+    if any(p.kind == p.VAR_POSITIONAL for p in parameters.values()):
+        return func
+    nargs = len(parameters)
+    return lambda *args: func(*args[:nargs])
+
+
 class MidiFuncRecvPortMessageMatcher(AbstractMessageMatcher):
     def __init__(self, midi_in, func):
         self.midi_in = midi_in
@@ -576,7 +602,7 @@ class MidiFuncRecvPortMessageMatcher(AbstractMessageMatcher):
 
     def __call__(self, data, midi_in):
         if self.midi_in._name == midi_in._name:
-            fn.value(self.func, data, midi_in)
+            self.func(data, midi_in)
 
 
 class MidiArgsMatcher(AbstractMessageMatcher):
@@ -591,33 +617,86 @@ class MidiArgsMatcher(AbstractMessageMatcher):
                     return
             elif item is not None and item != data[key]:
                 return
-        fn.value(self.func, data, midi_in)
+        self.func(data, midi_in)
 
 
 class MidiMessageDispatcher(AbstractWrappingDispatcher):
+    # Responders are indexed by (type, channel, number), channel and
+    # number are None if not fixed by the arg_template. Number is the
+    # note, control or program number depending on the message type.
+
     def wrap_func(self, func_proxy):
-        func = func_proxy.func
+        func = _fixed_arity(func_proxy.func)
         midi_in = func_proxy.port
         arg_template = func_proxy.arg_template
         if arg_template is not None:
-            func = MidiArgsMatcher(arg_template, func)
+            indexed = self._indexed_fields(func_proxy)
+            arg_template = {
+                k: v for k, v in arg_template.items() if k not in indexed}
+            if arg_template:
+                func = MidiArgsMatcher(arg_template, func)
         if midi_in is not None:
             return MidiFuncRecvPortMessageMatcher(midi_in, func)
         else:
             return func
 
-    def get_keys_for_func_proxy(self, func_proxy):
+    @staticmethod
+    def _message_types(func_proxy):
         mm = func_proxy.midi_msg
         if isinstance(mm, (list, tuple, set)):
             return list(mm)
         else:
             return [mm]
 
+    @staticmethod
+    def _template_int(arg_template, key):
+        value = arg_template.get(key) if key is not None else None
+        return value if type(value) is int else None
+
+    def _indexed_fields(self, func_proxy):
+        # Template keys that are matched by the index for all the types.
+        arg_template = func_proxy.arg_template or {}
+        types = self._message_types(func_proxy)
+        fields = set()
+        if self._template_int(arg_template, 'channel') is not None\
+        and all(t in mii._CHANNEL_TYPES for t in types):
+            fields.add('channel')
+        number_fields = {mii._NUMBER_FIELDS.get(t) for t in types}
+        if len(number_fields) == 1:
+            field = number_fields.pop()
+            if self._template_int(arg_template, field) is not None:
+                fields.add(field)
+        return fields
+
+    def get_keys_for_func_proxy(self, func_proxy):
+        arg_template = func_proxy.arg_template or {}
+        indexed = self._indexed_fields(func_proxy)
+        channel = self._template_int(arg_template, 'channel')\
+            if 'channel' in indexed else None
+        keys = []
+        for t in self._message_types(func_proxy):
+            field = mii._NUMBER_FIELDS.get(t)
+            number = self._template_int(arg_template, field)\
+                if field in indexed else None
+            keys.append((t, channel, number))
+        return keys
+
     def __call__(self, data, midi_in):
-        mt = data['type']
-        if mt in self.active:
-            for func in self.active[mt]:
-                fn.value(func, data, midi_in)
+        active = self.active
+        mt = data.type
+        channel = data.channel
+        number = data.number
+        keys = [(mt, None, None)]
+        if channel is not None:
+            keys.append((mt, channel, None))
+        if number is not None:
+            keys.append((mt, None, number))
+            if channel is not None:
+                keys.append((mt, channel, number))
+        for key in keys:
+            if key in active:
+                for func in tuple(active[key]):
+                    func(data, midi_in)
 
     def register(self):
         _libsc3.main._midi_interface.add_recv_func(self)
@@ -206,6 +206,21 @@ class Stream(aob.AbstractObject, ABC):
     def reset(self):
         pass
 
+    def seek(self, n, inval=None):
+        '''Skip the next n values of the stream.
+
+        Return the number of values that could not be skipped because
+        the stream ended.
+
+        '''
+
+        for i in range(n):
+            try:
+                self.next(inval)
+            except StopStream:
+                return n - i
+        return 0
+
     # def stream_arg(self): # BUG: Used for Pcollect, Pselect, Preject, method defined by Object and Pattern.
     #     return self
 
@@ -278,6 +293,9 @@ class UnopStream(Stream):
     def reset(self):
         self.a.reset()
 
+    def seek(self, n, inval=None):
+        return self.a.seek(n, inval)
+
     def __repr__(self):
         return f'{type(self).__name__}({self.selector.__name__}, {self.a})'
 
@@ -297,6 +315,9 @@ class BinopStream(Stream):
         self.a.reset()
         self.b.reset()
 
+    def seek(self, n, inval=None):
+        return max(self.a.seek(n, inval), self.b.seek(n, inval))
+
     def __repr__(self):
         return (
             f'{type(self).__name__}({self.selector.__name__}, '
@@ -327,6 +348,12 @@ class NaropStream(Stream):
         for item in self.args:
             item.reset()
 
+    def seek(self, n, inval=None):
+        left = self.a.seek(n, inval)
+        for item in self.args:
+            left = max(left, item.seek(n, inval))
+        return left
+
     def __repr__(self):
         return (
             f'{type(self).__name__}({self.selector.__name__}, '
@@ -850,6 +877,9 @@ class ValueStream(Stream):
     def next(self, inval=None):
         return self.value
 
+    def seek(self, n, inval=None):
+        return 0
+
     def __repr__(self):
         return f'{type(self).__name__}({self.value})'
 
@@ -1,5 +1,6 @@
 
 from . eventstream import *
+from . eventbatch import *
 from . event import *
 from . scale import *
 from . pattern import *
@@ -8,7 +8,6 @@ import sys
 from ..base import builtins as bi
 from ..base import absobject as aob
 from ..base import operand as opd
-from ..base import clock as clk
 from ..synth import server as srv
 from ..synth import synthdesc as sdc
 from ..synth import node as nod
@@ -342,7 +341,7 @@ class DurationKeys(PartialEvent):
     stretch = 1.0
 
     # tempo = None
-    # lag = 0.0
+    lag = 0.0  # Seconds added to latency, tempo independent.
     # strum = 0.0
     # strum_ends_together = False
 
@@ -419,7 +418,7 @@ class ServerKeys(PartialEvent):
     has_gate = True  # // assume SynthDef has gate
     send_gate = None  # // sendGate == false turns off releases
     args = ('freq', 'amp', 'pan', 'trig')  # // for 'type' 'set'
-    # lag = 0
+    lag = 0.0
     timing_offset = 0  # Used in EventStreamPlayer._synch_with_quant
 
     @keyfunction
@@ -483,6 +482,7 @@ class ServerKeys(PartialEvent):
 class MidiKeys(PartialEvent):
     midiout = None
     midicmd = 'note_on'
+    latency = None  # Same as the default server's to align with OSC.
 
     channel = 0  # 'note_on', 'note_off', 'polytouch', 'control_change'
                  # ''program_change', 'aftertouch', 'pitchwheel',
@@ -499,6 +499,10 @@ class MidiKeys(PartialEvent):
     pos = 0  # 'songpos'
     song = 0 # 'song_select'
 
+    @keyfunction
+    def latency(self):
+        return srv.Server.default.latency
+
     def _note_on(self):
         return {
             'type': 'note_on',
@@ -648,10 +652,11 @@ class NoteEvent(EventType, partial_events=(
         msg = ['/s_new', instrument, node_id, add_action, group, *param_list]
         msg = gpp.node_param(msg)._as_osc_arg_list()
 
-        server.addr.send_bundle(server.latency, msg)  # Missing ~latency, ~lag and ~timmingOffset.
+        latency = server.latency + self('lag')
+        server.addr.send_bundle(latency, msg)  # Missing ~latency and ~timmingOffset.
         if self('send_gate'):
             server.addr.send_bundle(
-                server.latency + self('sustain'),
+                latency + self('sustain'),
                 ['/n_set', node_id, 'gate', 0])
 
         self['is_playing'] = True
@@ -668,12 +673,12 @@ class MidiEvent(EventType, partial_events=(
         midiout = self['midiout']
         midicmd = self('midicmd')
         msgargs = getattr(self, '_' + midicmd)()
-        midiout.send_msg(msgargs.pop('type'), **msgargs)
+        latency = (self('latency') or 0) + self('lag')
+        msgs = [(latency, msgargs.pop('type'), msgargs)]
         has_gate = self.get('has_gate', True)  # Server compatibility.
         if has_gate and midicmd == 'note_on':
-            clk.SystemClock.sched(  # Clock's sched degrade performance.
-                self('sustain'),  # Missing ~latency, ~lag.
-                lambda: midiout.send_msg('note_off', **msgargs))
+            msgs.append((latency + self('sustain'), 'note_off', msgargs))
+        midiout.sched_msgs(msgs)
 
 class _MonoOnEvent(EventType, partial_events=(
         PitchKeys, AmplitudeKeys, DurationKeys, ServerKeys)):
@@ -687,7 +692,8 @@ class _MonoOnEvent(EventType, partial_events=(
             '/s_new', self['instrument'], self['node_id'],
             self['add_action'], self['group'], *self['msg_params']]
         msg = gpp.node_param(msg)._as_osc_arg_list()
-        self['server'].addr.send_bundle(self['server'].latency, msg)  # Missing ~latency, ~lag and ~timmingOffset.
+        self['server'].addr.send_bundle(
+            self['server'].latency + self('lag'), msg)  # Missing ~latency and ~timmingOffset.
         self['is_playing'] = True
 
     def _prepare_event(self, instrument):
@@ -710,7 +716,8 @@ class _MonoSetEvent(EventType, partial_events=(
         self['server'] = self('server')
         msg = ['/n_set', self['node_id'], *self._update_msg_params()]
         msg = gpp.node_param(msg)._as_osc_arg_list()
-        self['server'].addr.send_bundle(self['server'].latency, msg)
+        self['server'].addr.send_bundle(
+            self['server'].latency + self('lag'), msg)
 
     def _update_msg_params(self):
         msg_params = []
@@ -734,5 +741,6 @@ class _MonoOffEvent(EventType, partial_events=(ServerKeys,)):
             msg = ['/n_free', self['node_id']]
         msg = gpp.node_param(msg)._as_osc_arg_list()
         server = self('server')
-        server.addr.send_bundle(server.latency + self('delay'), msg)
+        server.addr.send_bundle(
+            server.latency + self('lag') + self('delay'), msg)
         self['is_playing'] = False
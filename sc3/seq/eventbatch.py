@@ -0,0 +1,400 @@
+"""
+Columnar rendering of event patterns.
+
+``Pattern.render`` pulls a number of events, or the events that start
+within a duration, into an ``EventBatch`` that holds one column per key.
+Pbind evaluates each key as a whole column, list, series and random
+value patterns compute their output at once and the pitch, amplitude
+and duration keys are computed over the columns instead of event by
+event. Other event patterns are pulled as a stream and their events
+evaluated one by one.
+
+Random patterns produce a different realization than the event stream
+with the same seed because the keys are evaluated one after the other
+instead of interleaved by event.
+"""
+
+import itertools
+from array import array
+
+from ..base import main as _libsc3
+from ..base import builtins as bi
+from ..base import stream as stm
+from ..synth import node as nod
+from ..synth import _graphparam as gpp
+from . import event as evt
+
+
+__all__ = ['EventBatch']
+
+
+_PLAIN = {int, float}
+
+
+class EventBatch():
+    '''Events of a pattern as columns of values.
+
+    A batch is indexed by key and returns the column of values of that
+    key for all the events. Columns of the keys set by the pattern and
+    the prototype event hold the values as they were set. The computed
+    keys 'freq' (with harmonic and detune applied, as sent to the
+    server), 'amp', 'dur', 'delta', 'sustain' and 'onset', the time of
+    each event from the start in beats, are ``array('d')`` unless the
+    events have arrayed values. The 'type' column is the event type and
+    ``rests`` marks the events that are rests.
+
+    Batches are created by ``Pattern.render``.
+
+    '''
+
+    _computed_keys = ('type', 'freq', 'amp', 'dur', 'delta', 'sustain')
+
+    def __init__(self, raw, columns, rests, proto):
+        self._raw = raw
+        self._columns = {**raw, **columns}
+        self.rests = rests
+        self.proto = proto
+
+    @classmethod
+    def _from_stream(cls, stream, proto, n, duration):
+        # Pull the events and evaluate them one by one, keys
+        # that are not set by an event have None as value.
+        events = []
+        position = 0.0
+        try:
+            while len(events) < n and position < duration:
+                event = stream.next(proto.copy())
+                if event is None:
+                    break
+                events.append(event)
+                position += float(event('delta'))
+        except stm.StopStream:
+            pass
+        keys = dict()
+        for event in events:
+            keys.update(dict.fromkeys(event))
+        raw = {key: [e.get(key) for e in events] for key in keys}
+        columns = dict()
+        columns['type'] = [e.get('type', e('type')) for e in events]
+        columns['freq'] = _column(e._detuned_freq() for e in events)
+        columns['amp'] = _column(e('amp') for e in events)
+        for key in ('dur', 'delta', 'sustain'):
+            columns[key] = _column(e(key) for e in events)
+        columns['onset'] = _onsets(columns['delta'])
+        rests = [evt.is_rest(e) for e in events]
+        return cls(raw, columns, rests, proto)
+
+    @classmethod
+    def _from_columns(cls, raw, proto, size):
+        # Compute the event keys over the columns of a pattern.
+        values = _Values(raw, proto, size)
+        columns = {key: getattr(values, key)() for key in cls._computed_keys}
+        columns['onset'] = _onsets(columns['delta'])
+        rests = [t == 'rest' for t in columns['type']]
+        for column in raw.values():
+            if values.types(column) <= _PLAIN:
+                continue
+            for i, value in enumerate(column):
+                if isinstance(value, evt.Rest):
+                    rests[i] = True
+        raw = {**{k: [v] * size for k, v in proto.items()}, **raw}
+        return cls(raw, columns, rests, proto)
+
+    def __len__(self):
+        return len(self.rests)
+
+    def __getitem__(self, key):
+        return self._columns[key]
+
+    def __contains__(self, key):
+        return key in self._columns
+
+    def keys(self):
+        return self._columns.keys()
+
+    def items(self):
+        return self._columns.items()
+
+    @property
+    def duration(self):
+        '''Time from the first event to the end of the last one in beats.'''
+        if not self.rests:
+            return 0.0
+        return self['onset'][-1] + self['delta'][-1]
+
+    def event(self, index):
+        '''Return the event at index with the keys that were set.'''
+        values = {
+            k: c[index] for k, c in self._raw.items()
+            if c[index] is not None}
+        return evt.event(values, type=self._columns['type'][index])
+
+    def to_score(self, score=None, start=0.0, tempo=1.0):
+        '''Add the note events of the batch to an OSC score.
+
+        Each note adds a '/s_new' bundle at its onset and, if the event
+        sends gate, a gate off bundle after its sustain, as the events
+        do when played in nrt mode. Rests and events of other types are
+        skipped.
+
+        Parameters
+        ----------
+        score: OscScore
+            The score, by default the score of the nrt main.
+        start: int | float
+            Time of the first event in seconds from the current
+            logical time.
+        tempo: int | float
+            Beats per second of the onset and sustain times.
+
+        '''
+
+        if score is None:
+            if _libsc3.main is not _libsc3.NrtMain:
+                raise Exception('a score must be supplied in rt mode')
+            score = _libsc3.main._osc_interface._osc_score
+        raw = self._raw
+        columns = self._columns
+        types = columns['type']
+        onsets = columns['onset']
+        sustains = columns['sustain']
+        varying = any(
+            k in raw and any(v != raw[k][0] for v in raw[k])
+            for k in _SynthSetup.keys)
+        setup = None
+        for i, rest in enumerate(self.rests):
+            if rest or types[i] != 'note':
+                continue
+            if setup is None or varying:
+                setup = _SynthSetup(self.event(i))
+            params = []
+            for name in setup.params:
+                if name in _SynthSetup.computed:
+                    params.extend([name, columns[name][i]])
+                elif name in raw:
+                    params.extend([name, raw[name][i]])
+                else:
+                    params.extend([name, setup[name]])
+            node_id = setup.server._next_node_id()
+            msg = [
+                '/s_new', setup.name, node_id,
+                setup.add_action, setup.group, *params]
+            if not all(type(v) in (int, float) for v in params[1::2]):
+                msg = gpp.node_param(msg)._as_osc_arg_list()
+            time = start + onsets[i] / tempo + setup.server.latency
+            time += raw['lag'][i] if 'lag' in raw else setup.lag
+            score.add([time, msg])
+            if setup.send_gate:
+                score.add([
+                    time + sustains[i] / tempo,
+                    ['/n_set', node_id, 'gate', 0]])
+
+    def __repr__(self):
+        return f'{type(self).__name__}({len(self)} events)'
+
+
+class _SynthSetup():
+    # Synth definition, target and parameter names of a note event,
+    # as computed by NoteEvent.play.
+    keys = (
+        'instrument', 'variant', 'server', 'synth_lib', 'group',
+        'add_action', 'msg_params', 'send_gate', 'has_gate')
+    computed = ('freq', 'amp')  # Detuned freq, amp of default params.
+
+    def __init__(self, event):
+        event['freq'] = event._detuned_freq()
+        params = event._get_msg_params()
+        self._values = dict(zip(params[::2], params[1::2]))
+        self.params = params[::2]
+        self.name = event._synthdef_name()
+        self.server = event('server')
+        self.add_action = nod.Node._action_number_for(event('add_action'))
+        self.group = gpp.node_param(event('group'))._as_control_input()
+        self.send_gate = event('send_gate')
+        self.lag = event('lag')
+
+    def __getitem__(self, name):
+        return self._values[name]
+
+
+class _Values():
+    # Event keys computed over columns of plain numbers, rests count
+    # as numbers. Keys with other values are evaluated event by event.
+
+    def __init__(self, columns, proto, size):
+        self.columns = columns  # Keys of the pattern.
+        self.proto = proto
+        self.size = size
+        self._floats = dict()
+        self._events = None
+
+    def __contains__(self, key):
+        return key in self.columns or key in self.proto
+
+    def floats(self, *keys):
+        # Columns of floats or None if a value is not a plain number.
+        ret = []
+        for key in keys:
+            if key not in self._floats:
+                self._floats[key] = self._float_column(key)
+            if self._floats[key] is None:
+                return None
+            ret.append(self._floats[key])
+        return ret
+
+    def _float_column(self, key):
+        if key in self.columns:
+            values = self.columns[key]
+        else:
+            values = [self.proto(key)]
+        if not self.types(values) <= _PLAIN:
+            if not all(isinstance(v, (int, float, evt.Rest)) for v in values):
+                return None
+        values = list(map(float, values))
+        if key not in self.columns:
+            values *= self.size
+        return values
+
+    @staticmethod
+    def types(values):
+        return set(map(type, values))
+
+    def events(self):
+        # The events as created by Pbind.
+        if self._events is None:
+            items = self.columns.items()
+            self._events = []
+            for i in range(self.size):
+                event = self.proto.copy()
+                event.update({k: c[i] for k, c in items})
+                self._events.append(event)
+        return self._events
+
+    def type(self):
+        if 'type' in self.columns:
+            return self.columns['type']
+        return [self.proto('type')] * self.size
+
+    def freq(self):
+        freq = self._freq()
+        if freq is None:
+            return _column(e._detuned_freq() for e in self.events())
+        modifiers = self.floats('harmonic', 'detune')
+        if modifiers is None:
+            return _column(e._detuned_freq() for e in self.events())
+        return array('d', (
+            f * h + d for f, h, d in zip(freq, *modifiers)))
+
+    def _freq(self):
+        if 'freq' in self:
+            values = self.floats('freq')
+            return values and values[0]
+        elif 'midinote' in self or 'note' in self:
+            midinote = self._midinote()
+            values = self.floats('ctranspose')
+            if midinote is None or values is None:
+                return None
+            return bi.midicps([m + c for m, c in zip(midinote, values[0])])
+        elif 'degree' in self:
+            midinote = self._midinote_from_degree()
+            return midinote and bi.midicps(midinote)
+        else:
+            return [float(self.proto('freq'))] * self.size
+
+    def _midinote(self):
+        if 'midinote' in self:
+            values = self.floats('midinote')
+            return values and values[0]
+        values = self.floats('note')
+        return values and self._note_to_midinote(values[0])
+
+    def _midinote_from_degree(self):
+        values = self.floats('degree', 'mtranspose')
+        scale = self._scale()
+        if values is None or scale is None:
+            return None
+        spo = scale.tuning._spo
+        steps = list(scale)
+        size = len(steps)
+        keys = []
+        for degree, mtranspose in zip(*values):
+            degree += mtranspose
+            keys.append(spo * (degree // size) + steps[int(degree) % size])
+        return self._note_to_midinote(keys)
+
+    def _note_to_midinote(self, keys):
+        values = self.floats('gtranspose', 'root', 'octave')
+        scale = self._scale()
+        if values is None or scale is None:
+            return None
+        spo = scale.tuning.spo
+        ratio = 12.0 * bi.log2(scale.tuning.octave_ratio)
+        return [
+            ((k + g + r) / spo + o - 5.0) * ratio + 60
+            for k, g, r, o in zip(keys, *values)]
+
+    def _scale(self):
+        # A scale by column is evaluated by event.
+        if 'scale' in self.columns:
+            return None
+        return self.proto('scale')
+
+    def amp(self):
+        if 'amp' in self:
+            values = self.floats('amp')
+            values = values and values[0]
+        elif 'db' in self:
+            values = self.floats('db')
+            values = values and bi.dbamp(values[0])
+        elif 'velocity' in self:
+            values = self.floats('velocity')
+            values = values and [v / 127 for v in values[0]]
+        else:
+            values = [float(self.proto('amp'))] * self.size
+        if values is None:
+            return _column(e('amp') for e in self.events())
+        return array('d', values)
+
+    def dur(self):
+        values = self.floats('dur')
+        if values is None:
+            return _column(e('dur') for e in self.events())
+        return array('d', values[0])
+
+    def delta(self):
+        if 'delta' in self:
+            values = self.floats('delta')
+            values = values and values[0]
+        else:
+            values = self.floats('dur', 'stretch')
+            values = values and [d * s for d, s in zip(*values)]
+        if values is None:
+            return _column(e('delta') for e in self.events())
+        return array('d', values)
+
+    def sustain(self):
+        if 'sustain' in self:
+            values = self.floats('sustain')
+            values = values and values[0]
+        else:
+            values = self.floats('dur', 'legato', 'stretch')
+            values = values and [d * l * s for d, l, s in zip(*values)]
+        if values is None:
+            return _column(e('sustain') for e in self.events())
+        return array('d', values)
+
+
+def _column(values):
+    # Array of floats, or list for arrayed values.
+    values = list(values)
+    try:
+        return array('d', values)
+    except TypeError:
+        return values
+
+
+def _onsets(deltas):
+    if not deltas:
+        return array('d')
+    return array('d', itertools.accumulate(
+        itertools.chain([0.0], (float(d) for d in deltas[:-1]))))
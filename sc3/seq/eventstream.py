@@ -7,6 +7,7 @@ from ..base import stream as stm
 from ..base import systemactions as sac
 from ..base import clock as clk
 from . import event as evt
+from . import pattern as ptt
 
 
 __all__ = []
@@ -96,7 +97,10 @@ class EventStreamCleanup():
 
 
 class EventStreamPlayer(stm.Routine):
-    def __init__(self, stream, event=None):
+    def __init__(self, stream, event=None, lookahead=None):
+        self._lookahead = lookahead
+        self._dry_count = 0
+        self._resync = False
         super().__init__(self._stream_player_func())
         self._stream = stream
         self._event = event or evt.event()
@@ -107,6 +111,27 @@ class EventStreamPlayer(stm.Routine):
     def cleanup(self):
         return self._cleanup
 
+    @property
+    def lookahead(self):
+        '''Seconds ahead of time events are computed and sent, or None.
+
+        The window is bounded by the latency of the server of the
+        player's event. Events within the window are sent with their
+        lag increased by the time left, tempo changes, mute, stop and
+        reset apply to the events that were not sent. Events played by
+        patterns while computed, as Pmono's articulation, are not
+        delayed.
+
+        '''
+
+        return self._lookahead
+
+    @property
+    def dry_count(self):
+        '''Number of times the events ahead took longer to compute
+        and send than the lookahead window.'''
+        return self._dry_count
+
     def mute(self):
         self._is_muted = True
 
@@ -123,6 +148,7 @@ class EventStreamPlayer(stm.Routine):
         with self._state_lock:
             if self.state == self.State.Paused:
                 self.state = self.State.Suspended
+                self._resync = True
                 clock = clock or self._clock
                 self._event, quant = self._synch_with_quant(self._event, quant)
                 clock.play(self, quant)
@@ -133,6 +159,9 @@ class EventStreamPlayer(stm.Routine):
             self._cleanup.run()
 
     def _stream_player_func(self):
+        if self._lookahead is not None:
+            return self._lookahead_player_func()
+
         def esp_func():
             try:
                 while True:
@@ -143,8 +172,40 @@ class EventStreamPlayer(stm.Routine):
 
         return esp_func
 
-    def _play_and_delta(self, outevent):  # Was Event.playAndDelta.
+    def _lookahead_player_func(self):
+        def esp_func():
+            # The routine wakes when the next event enters the window
+            # and plays the events within it. Cleanup runs at the end
+            # of the last event as without lookahead.
+            onset = self._beats
+            try:
+                while True:
+                    if self._resync:  # Played or resumed after a pause.
+                        self._resync = False
+                        onset = max(onset, self._beats)
+                    clock = self._clock
+                    seconds = self._seconds  # Time of the bundles.
+                    latency = self._event('server').latency or 0
+                    window = min(self._lookahead, latency)
+                    horizon = clock.secs2beats(seconds + window)
+                    while onset <= horizon:
+                        outevent = self._stream.next(self._event.copy())
+                        lag = clock.beats2secs(onset) - seconds
+                        onset += float(self._play_and_delta(outevent, lag))
+                    if _libsc3.main.elapsed_time() > seconds + window:
+                        self._dry_count += 1
+                    yield onset - horizon
+            except stm.StopStream:
+                if onset > self._beats:
+                    yield onset - self._beats
+                self._cleanup.run()
+
+        return esp_func
+
+    def _play_and_delta(self, outevent, lag=0):  # Was Event.playAndDelta.
         if not (self._is_muted or evt.is_rest(outevent)):
+            if lag > 0:
+                outevent['lag'] = outevent.get('lag', 0) + lag
             outevent.play()
         return outevent('delta')
 
@@ -155,6 +216,7 @@ class EventStreamPlayer(stm.Routine):
             if self.state == self.State.Init\
             or self.state == self.state.Paused:
                 self.state = self.State.Suspended
+                self._resync = True
                 clock = clock or _libsc3.main.current_tt._clock
                 self._event, quant = self._synch_with_quant(self._event, quant)
                 clock.play(self, quant)
@@ -184,6 +246,7 @@ class PatternValueStream(stm.Stream):
     def __init__(self, pattern):
         self.pattern = pattern
         self._stream = None
+        self._start = None  # Embedding function positioned by seek.
 
 
     ### Stream protocol ###
@@ -191,7 +254,11 @@ class PatternValueStream(stm.Stream):
     def next(self, inval=None):
         try:
             if self._stream is None:
-                self._stream = stm.embed(self.pattern, inval)
+                if self._start is None:
+                    self._stream = stm.embed(self.pattern, inval)
+                else:
+                    self._stream = self._start(inval)
+                    self._start = None
                 return next(self._stream)
             else:
                 return self._stream.send(inval)
@@ -200,6 +267,32 @@ class PatternValueStream(stm.Stream):
 
     def reset(self):
         self._stream = None
+        self._start = None
+
+    def seek(self, n, inval=None):
+        '''Skip the next n values of the stream.
+
+        List patterns, Pn, Pseries, Pgeom, Pconst and Pkey skip values
+        without evaluating them when the stream was not started. Return
+        the number of values that could not be skipped because the
+        stream ended.
+
+        '''
+
+        return self._seek(int(n), inval, ptt._count)
+
+    def _seek(self, amount, inval, measure):
+        if self._start is not None:
+            embed, left = ptt._pull(
+                self._start(inval), inval, amount, measure)
+        elif self._stream is not None:
+            embed, left = ptt._pull(
+                self._stream, inval, amount, measure, started=True)
+        else:
+            embed, left = ptt._seek(self.pattern, inval, amount, measure)
+        self._stream = None
+        self._start = ptt._nothing if embed is None else embed
+        return left
 
 
     def __repr__(self):
@@ -217,7 +310,11 @@ class PatternEventStream(PatternValueStream):
         try:
             inevent = evt.event() if inevent is None else inevent
             if self._stream is None:
-                self._stream = stm.embed(self.pattern, inevent)
+                if self._start is None:
+                    self._stream = stm.embed(self.pattern, inevent)
+                else:
+                    self._stream = self._start(inevent)
+                    self._start = None
                 return next(self._stream)
             else:
                 return self._stream.send(inevent)
@@ -227,6 +324,25 @@ class PatternEventStream(PatternValueStream):
     def reset(self):
         self.clear()
         self._stream = None
+        self._start = None
+
+    def seek(self, beats, inevent=None):
+        '''Skip the events of the next number of beats.
+
+        Pbind evaluates only the keys needed to compute the duration of
+        the skipped events, the streams of keys defined after the timing
+        keys ('dur', 'stretch' and 'delta') are skipped by count. Within
+        those, Pkey only sees the keys up to the last timing key. Ppar,
+        Pdur, list patterns and Pn seek their sub patterns. An event
+        that overlaps the seek point is replaced by a rest that lasts
+        until the next event, positions within 1e-9 beats of the seek
+        point are taken as exact. Return the number of beats that could
+        not be skipped because the stream ended.
+
+        '''
+
+        inevent = evt.event() if inevent is None else inevent
+        return self._seek(beats, inevent, ptt._delta)
 
     def clear(self):
         if self._stream:
@@ -49,6 +49,7 @@ from . import event as evt
 
 
 est = hks.late_import(__name__, 'sc3.seq.eventstream', 'est')
+ebt = hks.late_import(__name__, 'sc3.seq.eventbatch', 'ebt')
 flp = hks.late_import(__name__, 'sc3.seq.patterns.filterpatterns', 'flp')
 
 
@@ -80,6 +81,29 @@ class Pattern(aob.AbstractObject):
     def __embed__(self, inval=None):
         return (yield from self.__stream__().__embed__(inval))
 
+    def _seek(self, inval, amount, measure):
+        # Return a function of inval that returns the embedding from the
+        # point after the first amount of output, as computed by measure,
+        # and 0, or None and the amount left if the pattern ended. Patterns
+        # that know their structure override this method to skip without
+        # evaluating their output, the default pulls the values.
+        if isinstance(inval, _SeekDict):
+            raise _SeekMiss(self)
+        return _pull(self.__embed__(inval), inval, amount, measure)
+
+    def _render(self, proto, n, duration):
+        # Return an EventBatch of the events, patterns that can
+        # evaluate their keys as columns override this method.
+        return ebt.EventBatch._from_stream(
+            self.__stream__(), proto, n, duration)
+
+    def _batch(self, n, columns):
+        # Return a list of up to n values for a key of an event pattern,
+        # columns are the keys already computed as in the input event
+        # of each value. Patterns that know their output override this
+        # method to compute it at once, the default pulls the values.
+        return _pull_batch(self.__stream__(), n, columns)
+
 
     ### AbstractObject interface ###
 
@@ -96,14 +120,50 @@ class Pattern(aob.AbstractObject):
         return Pnarop(selector, self, *args)
 
 
-    def play(self, clock=None, quant=None, proto=None):
+    def play(self, clock=None, quant=None, proto=None,
+             start_beat=0, lookahead=None):
         if not self.is_event_pattern:
             raise ValueError(f'{type(self)} is not an event pattern')
         proto = evt.event() if proto is None else evt.event(proto)
-        stream = est.EventStreamPlayer(self.__stream__(), proto)
+        stream = self.__stream__()
+        if start_beat > 0:
+            if not isinstance(stream, est.PatternEventStream):
+                stream = est.PatternEventStream(self)
+            stream.seek(start_beat, proto.copy())
+        stream = est.EventStreamPlayer(stream, proto, lookahead)
         stream.play(clock, quant)
         return stream
 
+    def render(self, n=None, duration=None, proto=None):
+        '''Render the events of the pattern as columns of values.
+
+        Parameters
+        ----------
+        n: int
+            Maximum number of events.
+        duration: int | float
+            Maximum duration in beats, events that start before
+            it are rendered.
+        proto: dict
+            Prototype event.
+
+        Returns
+        -------
+        EventBatch
+            The events by key, it can be added to an OSC score with
+            its ``to_score`` method.
+
+        '''
+
+        if not self.is_event_pattern:
+            raise ValueError(f'{type(self)} is not an event pattern')
+        if n is None and duration is None:
+            raise ValueError('n or duration must be set')
+        proto = evt.event() if proto is None else evt.event(proto)
+        n = float('inf') if n is None else n
+        duration = float('inf') if duration is None else duration
+        return self._render(proto, n, duration)
+
     # def _as_event_stream_player(self, proto_event=None):
     #     return est.EventStreamPlayer(self.__stream__(), proto_event)
 
@@ -171,6 +231,12 @@ class Punop(Pattern):
     def __stream__(self):
         return stm.UnopStream(self.selector, stm.stream(self.a))
 
+    def _seek(self, inval, amount, measure):
+        return _seek_op(self, inval, amount, measure)
+
+    def _batch(self, n, columns):
+        return _batch_op(self, n, columns, self.a)
+
     def __embed__(self, inval=None):
         stream = stm.stream(self.a)
         try:
@@ -201,6 +267,12 @@ class Pbinop(Pattern):
         # NOTE: See BinaryOpXStream implementation options. Class is not
         # defined.
 
+    def _seek(self, inval, amount, measure):
+        return _seek_op(self, inval, amount, measure)
+
+    def _batch(self, n, columns):
+        return _batch_op(self, n, columns, self.a, self.b)
+
     def __repr__(self):
         return (
             f'{type(self).__name__}({self.selector.__name__}, '
@@ -223,6 +295,12 @@ class Pnarop(Pattern):  # Was Pnaryop.
         args = [stm.stream(x) for x in self.args]
         return stm.NaropStream(self.selector, stm.stream(self.a), *args)
 
+    def _seek(self, inval, amount, measure):
+        return _seek_op(self, inval, amount, measure)
+
+    def _batch(self, n, columns):
+        return _batch_op(self, n, columns, self.a, *self.args)
+
     def __embed__(self, inval=None):
         stream_a = stm.stream(self.a)
         # NOTE: See omitted optimization.
@@ -241,6 +319,147 @@ class Pnarop(Pattern):  # Was Pnaryop.
             f'{self.a}, {self.args})')
 
 
+### Batch ###
+
+
+def _batch(obj, n, columns):
+    if isinstance(obj, Pattern):
+        return obj._batch(n, columns)
+    stream = stm.stream(obj)
+    if isinstance(stream, stm.ValueStream):
+        return [obj] * n
+    return _pull_batch(stream, n, columns)
+
+
+def _pull_batch(stream, n, columns):
+    ret = []
+    items = columns.items()
+    try:
+        for i in range(n):
+            ret.append(stream.next({k: c[i] for k, c in items}))
+    except stm.StopStream:
+        pass
+    return ret
+
+
+def _batch_op(pattern, n, columns, *operands):
+    # Operations apply the selector to the columns of their operands.
+    if pattern.is_event_pattern:
+        return Pattern._batch(pattern, n, columns)
+    operands = [_batch(x, n, columns) for x in operands]
+    return [pattern.selector(*args) for args in zip(*operands)]
+
+
+### Seek ###
+
+
+def _count(value):
+    # Measure of value streams.
+    return 1
+
+
+def _delta(event):
+    # Measure of event streams, in beats.
+    if not isinstance(event, evt.EventDict):
+        event = evt.event(event)
+    return float(event('delta'))
+
+
+class _SeekMiss(Exception):
+    pass
+
+
+class _SeekDict(dict):
+    # Input of the streams of event pattern keys while seeking. Reading
+    # a key, or skipping a pattern that has to pull its values, raises
+    # _SeekMiss and the caller evaluates the events instead.
+    def __missing__(self, key):
+        raise _SeekMiss(key)
+
+
+def _seek(obj, inval, amount, measure):
+    if isinstance(obj, Pattern):
+        return obj._seek(inval, amount, measure)
+    elif isinstance(inval, _SeekDict) and hasattr(obj, '__embed__'):
+        raise _SeekMiss(obj)
+    else:
+        return _pull(stm.embed(obj, inval), inval, amount, measure)
+
+
+# Summed float deltas differ from the seek amount in the last bits,
+# positions closer than this land exactly on an event.
+_SEEK_TOLERANCE = 1e-9
+
+
+def _left(amount):
+    return 0 if amount < _SEEK_TOLERANCE else amount
+
+
+def _pull(embed, inval, amount, measure, started=False):
+    # An event that overlaps the seek point is replaced by a rest
+    # that lasts until the end of the event.
+    position = 0
+    try:
+        outval = embed.send(inval) if started else next(embed)
+        while amount - position > _SEEK_TOLERANCE:
+            position += measure(outval)
+            if position - amount > _SEEK_TOLERANCE:
+                rest = evt.silent(position - amount)
+                return (lambda _: _Resumed(embed, rest)), 0
+            outval = embed.send(inval)
+    except StopIteration:
+        return None, _left(amount - position)
+    return (lambda _: _Resumed(embed, outval)), 0
+
+
+def _seek_op(pattern, inval, amount, measure):
+    # Operations skip the values of their operands.
+    if measure is not _count or pattern.is_event_pattern:
+        return Pattern._seek(pattern, inval, amount, measure)
+    stream = pattern.__stream__()
+    left = stream.seek(amount, inval)
+    if left > 0:
+        return None, left
+    return stream.__embed__, 0
+
+
+def _rest(delta, inval=None):
+    return (yield evt.silent(delta))
+
+
+def _nothing(inval=None):
+    return
+    yield
+
+
+class _Resumed():
+    # Embeddable form of a started generator, yields the pending value
+    # and delegates the rest of the protocol to the generator.
+
+    def __init__(self, embed, pending):
+        self._embed = embed
+        self._pending = [pending]
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.send(None)
+
+    def send(self, inval):
+        if self._pending:
+            return self._pending.pop()
+        return self._embed.send(inval)
+
+    def throw(self, *args):
+        self._pending = []
+        return self._embed.throw(*args)
+
+    def close(self):
+        self._pending = []
+        self._embed.close()
+
+
 def pattern(gfunc):
     '''
     Decorator to create value patterns from generator functions. ::
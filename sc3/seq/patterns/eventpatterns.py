@@ -7,6 +7,7 @@ from ...base import builtins as bi
 from ...base import _taskq as tsq
 from .. import pattern as ptt
 from .. import eventstream as est
+from .. import eventbatch as ebt
 from .. import event as evt
 
 
@@ -33,13 +34,32 @@ class Pkey(ptt.Pattern):
 
     def __embed__(self, inevent):
         key_stream = stm.stream(self.key)
+        return (yield from self._embed(inevent, key_stream, self.length))
+
+    def _seek(self, inevent, amount, measure):
+        if measure is not ptt._count:
+            return super()._seek(inevent, amount, measure)
+        n = min(amount, self.length)
+        key_stream = stm.stream(self.key)
+        left = key_stream.seek(n, inevent)
+        if left > 0 or n == self.length:
+            return None, amount - n + left
+        length = self.length - n
+        return (lambda inevent: self._embed(inevent, key_stream, length)), 0
+
+    def _embed(self, inevent, key_stream, length):
         try:
-            for _ in bi.counter(self.length):
+            for _ in bi.counter(length):
                 inevent = (yield inevent[key_stream.next(inevent)]) or dict()
         except (stm.StopStream, KeyError):
             pass
         return inevent
 
+    def _batch(self, n, columns):
+        if hasattr(self.key, '__embed__') or self.key not in columns:
+            return super()._batch(n, columns)
+        return columns[self.key][:int(min(n, self.length))]
+
     # storeArgs
 
 
@@ -85,13 +105,156 @@ class Pevent(EventPattern):
 
 
 class Pbind(EventPattern):
+    _timing_keys = {'dur', 'stretch', 'delta'}
+
     def __init__(self, mapping):
         self.dict = dict(mapping)
 
     def __embed__(self, inevent):
-        event = None
         stream_dict = {k: stm.stream(v) for k, v in self.dict.items()}
+        return (yield from self._embed(inevent, stream_dict))
+
+    def _seek(self, inevent, amount, measure):
+        if measure is not ptt._delta or inevent is None:
+            return super()._seek(inevent, amount, measure)
+        stream_dict, rest = self._seek_streams(inevent, amount)
+        if stream_dict is None:
+            return None, rest
+        return (lambda inevent: self._embed(inevent, stream_dict, rest)), 0
+
+    def _seek_streams(self, inevent, amount):
+        # Delta only mode, evaluates the timing keys and skips the other
+        # ones by the number of events. If a timing key reads other keys
+        # all the keys up to the last timing key are evaluated, if a key
+        # can't be skipped without pulling its values, as Pfunc, all the
+        # keys are evaluated. Returns the streams and the rest until the
+        # next event, if any, or None and the amount left.
+        keys = list(self.dict)
+        timing = [k for k in keys if self._timing_keys.intersection(
+            k if isinstance(k, tuple) else (k,))]
+        last = keys.index(timing[-1]) + 1 if timing else 0
+        try:
+            return self._seek_keys(inevent, amount, timing, ptt._SeekDict())
+        except ptt._SeekMiss:
+            pass
+        if last < len(keys):
+            try:
+                return self._seek_keys(inevent, amount, keys[:last], dict())
+            except ptt._SeekMiss:
+                pass
+        return self._seek_keys(inevent, amount, keys, dict())
+
+    def _seek_keys(self, inevent, amount, evaluated, values):
+        stream_dict = {k: stm.stream(v) for k, v in self.dict.items()}
+        timing_dict = {k: stream_dict[k] for k in evaluated}
+        skipped = [s for k, s in stream_dict.items() if k not in timing_dict]
+        for stream in skipped:
+            if not self._skips(stream):
+                raise ptt._SeekMiss(stream)
+        event = evt.event(inevent)
+        position = 0.0
+        ends = []
+        try:
+            while amount - position > ptt._SEEK_TOLERANCE:
+                values.clear()
+                event.update(self._stream_dict_next(timing_dict, values))
+                position += float(event('delta'))
+                ends.append(position)
+        except stm.StopStream:
+            return None, ptt._left(amount - position)
+        count = len(ends)
+        for stream in skipped:
+            left = stream.seek(len(ends), ptt._SeekDict())
+            count = min(count, len(ends) - left)
+        if count < len(ends):  # Ended by a shorter stream.
+            end = ends[count - 1] if count else 0.0
+            return None, ptt._left(amount - end)
+        if position - amount > ptt._SEEK_TOLERANCE:
+            return stream_dict, evt.silent(position - amount)
+        return stream_dict, None
+
+    @classmethod
+    def _skips(cls, stream):
+        # Whether the stream can skip values without pulling them,
+        # the default Stream.seek evaluates the values.
+        if isinstance(stream, stm.UnopStream):
+            return cls._skips(stream.a)
+        if isinstance(stream, stm.BinopStream):
+            return cls._skips(stream.a) and cls._skips(stream.b)
+        if isinstance(stream, stm.NaropStream):
+            return all(cls._skips(s) for s in (stream.a, *stream.args))
+        return type(stream).seek is not stm.Stream.seek
+
+    def _render(self, proto, n, duration):
+        # Keys are evaluated as columns one after the other. If the
+        # duration is set the timing keys are evaluated first by event,
+        # as for seek, to know the number of events.
+        keys = list(self.dict)
+        columns = dict()
+        evaluated = []
+        size = n
+        if duration != float('inf'):
+            evaluated = [k for k in keys if self._timing_keys.intersection(
+                k if isinstance(k, tuple) else (k,))]
+            try:
+                size = self._render_keys(
+                    proto, n, duration, evaluated, ptt._SeekDict(), columns)
+            except ptt._SeekMiss:
+                evaluated = keys[:keys.index(evaluated[-1]) + 1]
+                columns.clear()
+                size = self._render_keys(
+                    proto, n, duration, evaluated, dict(), columns)
+        size = int(size)
+        for key in keys:
+            if key in evaluated:
+                continue
+            values = ptt._batch(self.dict[key], size, columns)
+            if len(values) < size:  # Ended by a shorter stream.
+                size = len(values)
+                for name, column in columns.items():
+                    columns[name] = column[:size]
+            if isinstance(key, tuple):
+                columns.update(zip(key, self._unpack_columns(key, values)))
+            else:
+                columns[key] = values
+        return ebt.EventBatch._from_columns(columns, proto, size)
+
+    def _render_keys(self, proto, n, duration, evaluated, values, columns):
+        stream_dict = {k: stm.stream(self.dict[k]) for k in evaluated}
+        event = proto.copy()
+        rows = []
+        position = 0.0
+        try:
+            while len(rows) < n and position < duration:
+                values.clear()
+                event.update(self._stream_dict_next(stream_dict, values))
+                position += float(event('delta'))
+                rows.append(dict(values))
+        except stm.StopStream:
+            pass
+        for row in rows:
+            for name in row:
+                if name not in columns:
+                    columns[name] = [r.get(name) for r in rows]
+        return len(rows)
 
+    @staticmethod
+    def _unpack_columns(key, values):
+        columns = [[] for _ in key]
+        for value in values:
+            if not isinstance(value, (list, tuple)) or len(key) > len(value):
+                _logger.warning(
+                    'the pattern is not providing enough '
+                    f'values to assign to the key set: {key}')
+                value = [None] * len(key)
+            for column, item in zip(columns, value):
+                column.append(item)
+        return columns
+
+    def _embed(self, inevent, stream_dict, rest=None):
+        event = None
+        if rest is not None:
+            inevent = yield rest
         try:
             while True:
                 if inevent is None:
@@ -104,8 +267,8 @@ class Pbind(EventPattern):
         return inevent
 
     @staticmethod
-    def _stream_dict_next(stream_dict):
-        event = dict()
+    def _stream_dict_next(stream_dict, event=None):
+        event = dict() if event is None else event
         for name, stream in stream_dict.items():
             stream_out = stream.next(event)  # raises StopStream
             if isinstance(name, tuple):
@@ -133,18 +296,24 @@ class Pmono(Pbind):
         self.instrument = instrument
         self.articulate = articulate
 
-    def __embed__(self, inevent):
+    def _render(self, proto, n, duration):
+        raise ValueError('Pmono events depend on the node of the player')
+
+    def _embed(self, inevent, stream_dict, rest=None):
+        # The first event after a seek starts a new node.
         if self.articulate:
-            return (yield from self._embed_mono_artic(inevent))
+            return (yield from self._embed_mono_artic(
+                inevent, stream_dict, rest))
         else:
-            return (yield from self._embed_mono(inevent))
+            return (yield from self._embed_mono(inevent, stream_dict, rest))
 
-    def _embed_mono(self, inevent):
+    def _embed_mono(self, inevent, stream_dict, rest):
         instrument = self.instrument
         kept_keys = self._kept_keys
-        stream_dict = {k: stm.stream(v) for k, v in self.dict.items()}
         cleanup = est.CleanupEntry()
         server = node_id = mono_params = event = None
+        if rest is not None:
+            inevent = yield rest
 
         try:
             while True:
@@ -169,12 +338,13 @@ class Pmono(Pbind):
             cleanup.run()
         return inevent
 
-    def _embed_mono_artic(self, inevent):
+    def _embed_mono_artic(self, inevent, stream_dict, rest):
         instrument = self.instrument
         kept_keys = self._kept_keys
-        stream_dict = {k: stm.stream(v) for k, v in self.dict.items()}
         cleanup = est.CleanupEntry()
         server = node_id = mono_params = event = cleanup_event = None
+        if rest is not None:
+            inevent = yield rest
 
         try:
             while True:
@@ -225,8 +395,27 @@ class Ppar(EventPattern):
     def __embed__(self, inevent):
         # assn?
         queue = tsq.TaskQueue()
-        now = 0.0
         self._init_streams(queue)
+        return (yield from self._embed(inevent, queue))
+
+    def _seek(self, inevent, amount, measure):
+        streams = [stm.stream(p) for p in self.patterns]
+        if measure is not ptt._delta or not all(
+                isinstance(s, est.PatternEventStream) for s in streams):
+            return super()._seek(inevent, amount, measure)
+        queue = tsq.TaskQueue()
+        rest = amount
+        for stream in streams:
+            left = stream.seek(amount, inevent)
+            if left == 0:
+                queue.add(0.0, stream)
+            rest = min(rest, left)
+        if queue.empty():
+            return None, rest
+        return (lambda inevent: self._embed(inevent, queue)), 0
+
+    def _embed(self, inevent, queue):
+        now = 0.0
         # // If first event not at time zero.
         if not queue.empty():
             nexttime = queue.peek()[0]
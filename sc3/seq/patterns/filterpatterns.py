@@ -1,6 +1,7 @@
 """FilterPatterns.sc"""
 
 import copy
+import functools
 import logging
 
 from ...base import builtins as bi
@@ -8,6 +9,7 @@ from ...base import stream as stm
 from ...base import utils as utl
 from ...base import functions as fn
 from .. import pattern as ptt
+from .. import eventstream as est
 from .. import event as evt
 
 
@@ -44,10 +46,54 @@ class Pn(FilterPattern):
             inevent[key] = False
         return inevent
 
+    def _seek(self, inevent, amount, measure):
+        pattern = self.pattern
+        repeats = self.repeats
+        key = self.key
+        i = 0
+        while i < repeats:
+            if key is not None:
+                inevent[key] = True
+            start = amount
+            embed, amount = ptt._seek(pattern, inevent, amount, measure)
+            if embed is not None:
+                return (lambda inevent: self._embed_repeats(
+                    inevent, embed, i)), 0
+            if amount == start:
+                break
+            i += 1
+            if not hasattr(pattern, '__embed__'):
+                # Plain values repeat the same measure.
+                size = start - amount
+                k = int(amount // size)
+                if repeats != float('inf'):
+                    k = min(k, repeats - i)
+                i += k
+                amount -= k * size
+        if key is not None:
+            inevent[key] = False
+        return None, ptt._left(amount)
+
+    def _embed_repeats(self, inevent, embed, i):
+        pattern = self.pattern
+        key = self.key
+        if key is not None:
+            inevent[key] = True
+        inevent = yield from embed(inevent)
+        for _ in bi.counter(self.repeats - i - 1):
+            if key is not None:
+                inevent[key] = True
+            inevent = yield from stm.embed(pattern, inevent)
+        if key is not None:
+            inevent[key] = False
+        return inevent
+
     # storeArgs
 
 
 class Pgate(Pn):
+    _seek = ptt.Pattern._seek  # Holds values.
+
     def __embed__(self, inevent):
         pattern = self.pattern
         key = self.key
@@ -211,11 +257,35 @@ class Pdur(FilterPattern):  # Was Pfindur.
         self.quant = quant
 
     def __embed__(self, inevent):
-        elapsed = 0.0
+        stream = stm.stream(self.pattern)
+        return (yield from self._embed(inevent, stream, 0.0))
+
+    def _seek(self, inevent, amount, measure):
+        stream = stm.stream(self.pattern)
+        if measure is not ptt._delta\
+        or not isinstance(stream, est.PatternEventStream):
+            return super()._seek(inevent, amount, measure)
+        local_dur = self.dur
+        quant = self.quant
+        elapsed = min(amount, local_dur)
+        left = stream.seek(elapsed, inevent)
+        if left == 0:
+            if amount < local_dur:
+                return (lambda inevent: self._embed(
+                    inevent, stream, amount)), 0
+            return None, amount - local_dur
+        # The sub pattern is shorter, the total includes the quant rest.
+        elapsed -= left
+        if quant is not None:
+            elapsed = bi.roundup(elapsed, quant)
+        if amount < elapsed:
+            return functools.partial(ptt._rest, elapsed - amount), 0
+        return None, amount - elapsed
+
+    def _embed(self, inevent, stream, elapsed):
         local_dur = self.dur
         tolerance = self.tolerance
         quant = self.quant
-        stream = stm.stream(self.pattern)
         delta = next_elapsed = remaining = None
         try:
             while True:
@@ -250,9 +320,28 @@ class Pconst(FilterPattern):
 
     def __embed__(self, inval):
         stream = stm.stream(self.pattern)
+        return (yield from self._embed(inval, stream, 0))
+
+    def _seek(self, inval, amount, measure):
+        if measure is not ptt._count:
+            return super()._seek(inval, amount, measure)
+        stream = stm.stream(self.pattern)
+        local_sum = self.sum
+        tolerance = self.tolerance
+        sum = 0
+        for i in range(amount):
+            try:
+                sum += stream.next(inval)
+            except stm.StopStream:
+                return None, amount - i - 1  # Skipped the remainder.
+            if bi.roundup(sum, tolerance) >= local_sum:
+                return None, amount - i - 1
+        return (lambda inval: self._embed(inval, stream, sum)), 0
+
+    def _embed(self, inval, stream, sum):
         local_sum = self.sum
         tolerance = self.tolerance
-        sum = next_sum = 0
+        next_sum = 0
         value = None
         try:
             while True:
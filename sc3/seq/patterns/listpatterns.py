@@ -22,6 +22,56 @@ class ListPattern(ptt.Pattern):
     def is_event_pattern(self):
         return self._is_event_pattern
 
+    def _seek_cycle(self, inval, amount, measure, length):
+        # Seek the sequence of length items that cycles over lst from
+        # offset. Cycles of plain values have always the same measure
+        # and are skipped at once after the first one.
+        lst = self.lst
+        size = len(lst)
+        offset = self.offset
+        plain = not any(hasattr(item, '__embed__') for item in lst)
+        start = amount
+        i = 0
+        while i < length:
+            if plain and i == size:
+                cycle = start - amount
+                if cycle <= 0:
+                    break
+                k = int(amount // cycle)
+                if length != float('inf'):
+                    k = min(k, (length - i) // size)
+                i += k * size
+                amount -= k * cycle
+                if i == length:
+                    break
+            embed, amount = ptt._seek(
+                lst[(i + offset) % size], inval, amount, measure)
+            if embed is not None:
+                return (lambda inval: self._embed_cycle(
+                    inval, embed, i, length)), 0
+            i += 1
+        return None, ptt._left(amount)
+
+    def _batch_cycle(self, n, columns, length):
+        # Cycles of plain values are indexed at once.
+        lst = self.lst
+        if any(hasattr(item, '__embed__') for item in lst):
+            return super()._batch(n, columns)
+        size = len(lst)
+        offset = self.offset
+        return [lst[(i + offset) % size] for i in range(int(min(n, length)))]
+
+    def _embed_cycle(self, inval, embed, i, length):
+        lst = self.lst
+        size = len(lst)
+        offset = self.offset
+        inval = yield from embed(inval)
+        i += 1
+        while i < length:
+            inval = yield from stm.embed(lst[(i + offset) % size], inval)
+            i += 1
+        return inval
+
     # copy
     # storeArgs
 
@@ -42,6 +92,14 @@ class Pseq(ListPattern):
                 inval = yield from stm.embed(item, inval)
         return inval
 
+    def _seek(self, inval, amount, measure):
+        length = self.repeats * len(self.lst)
+        return self._seek_cycle(inval, amount, measure, length)
+
+    def _batch(self, n, columns):
+        length = self.repeats * len(self.lst)
+        return self._batch_cycle(n, columns, length)
+
     # storeArgs # TODO
 
 
@@ -54,6 +112,12 @@ class Pser(Pseq):
             inval = yield from stm.embed(lst[(i + offset) % size], inval)
         return inval
 
+    def _seek(self, inval, amount, measure):
+        return self._seek_cycle(inval, amount, measure, self.repeats)
+
+    def _batch(self, n, columns):
+        return self._batch_cycle(n, columns, self.repeats)
+
 
 # class Pindex(ptt.Pattern):
 #     # I don't see the difference with Pswitch, here or in sclang.
@@ -131,6 +195,9 @@ class Ptuple(ListPattern):
 
 
 class Place(Pseq):
+    _seek = ptt.Pattern._seek  # Not a cycle.
+    _batch = ptt.Pattern._batch
+
     def __embed__(self, inval):
         lst = self.lst
         offset = self.offset
@@ -144,6 +211,9 @@ class Place(Pseq):
 
 
 class Placep(Pseq):  # Was Ppatlace.
+    _seek = ptt.Pattern._seek  # Not a cycle.
+    _batch = ptt.Pattern._batch
+
     def __embed__(self, inval):
         lst = self.lst
         size = len(lst)
@@ -1,5 +1,9 @@
 """From Patterns.sc"""
 
+import itertools
+import functools
+import operator
+
 from ...base import builtins as bi
 from ...base import stream as stm
 from ...base import main as _libsc3
@@ -38,6 +42,34 @@ class Pseries(ValuePattern):
         cur = self.start  # value makes the pattern object to keep state
         length = self.length  # if the parameter is a stream.
         step_stream = stm.stream(self.step)
+        return (yield from self._embed(inval, cur, length, step_stream))
+
+    def _seek(self, inval, amount, measure):
+        if measure is not ptt._count:
+            return super()._seek(inval, amount, measure)
+        n = min(amount, self.length)
+        step_stream = stm.stream(self.step)
+        cur = self.start
+        if hasattr(self.step, '__embed__'):
+            for i in range(n):
+                try:
+                    cur += step_stream.next(inval)
+                except stm.StopStream:
+                    return None, amount - i
+        else:
+            cur = _advance(cur, self.step, operator.add, n)
+        if n == self.length:
+            return None, amount - n
+        length = self.length - n
+        return (lambda inval: self._embed(
+            inval, cur, length, step_stream)), 0
+
+    def _batch(self, n, columns):
+        if hasattr(self.step, '__embed__'):
+            return super()._batch(n, columns)
+        return _accumulate(self.start, self.step, operator.add, n, self.length)
+
+    def _embed(self, inval, cur, length, step_stream):
         outval = stepval = None
         try:
             for _ in bi.counter(length):
@@ -63,6 +95,34 @@ class Pgeom(ValuePattern):
         cur = self.start
         length = self.length
         grow_stream = stm.stream(self.grow)
+        return (yield from self._embed(inval, cur, length, grow_stream))
+
+    def _seek(self, inval, amount, measure):
+        if measure is not ptt._count:
+            return super()._seek(inval, amount, measure)
+        n = min(amount, self.length)
+        grow_stream = stm.stream(self.grow)
+        cur = self.start
+        if hasattr(self.grow, '__embed__'):
+            for i in range(n):
+                try:
+                    cur *= grow_stream.next(inval)
+                except stm.StopStream:
+                    return None, amount - i
+        else:
+            cur = _advance(cur, self.grow, operator.mul, n)
+        if n == self.length:
+            return None, amount - n
+        length = self.length - n
+        return (lambda inval: self._embed(
+            inval, cur, length, grow_stream)), 0
+
+    def _batch(self, n, columns):
+        if hasattr(self.grow, '__embed__'):
+            return super()._batch(n, columns)
+        return _accumulate(self.start, self.grow, operator.mul, n, self.length)
+
+    def _embed(self, inval, cur, length, grow_stream):
         outval = growval = None
         try:
             for _ in bi.counter(length):
@@ -77,6 +137,21 @@ class Pgeom(ValuePattern):
     # storeArgs
 
 
+def _advance(start, step, func, n):
+    # Value after n plain steps, folded one by one as the embedding
+    # does so seeked values match the stream's ones exactly.
+    return functools.reduce(func, itertools.repeat(step, int(n)), start)
+
+
+def _accumulate(start, step, func, n, length):
+    # Series of plain steps, same operations as the embedding.
+    n = int(min(n, length))
+    if n == 0:
+        return []
+    steps = itertools.repeat(step, n - 1)
+    return list(itertools.accumulate(itertools.chain([start], steps), func))
+
+
 class Pbrown(ValuePattern):
     def __init__(self, lo=0.0, hi=1.0, step=0.125, length=float('inf')):
         self.lo = lo
@@ -134,6 +209,17 @@ class Pwhite(ValuePattern):
             pass
         return inval
 
+    def _batch(self, n, columns):
+        lo = self.lo
+        hi = self.hi
+        if hasattr(lo, '__embed__') or hasattr(hi, '__embed__'):
+            return super()._batch(n, columns)
+        n = int(min(n, self.length))
+        if type(lo) is float or type(hi) is float:
+            random = _libsc3.main._rgen.random  # Same as rrand.
+            return [lo + random() * (hi - lo) for _ in range(n)]
+        return [bi.rrand(lo, hi) for _ in range(n)]
+
     # storeArgs
 
 
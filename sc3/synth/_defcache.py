@@ -0,0 +1,203 @@
+"""Persistent content addressed cache of SynthDef binaries."""
+
+import enum
+import hashlib
+import inspect
+import logging
+import os
+import sys
+import types
+import uuid
+
+from ..base import platform as plf
+
+
+_logger = logging.getLogger(__name__)
+
+
+DIR_NAME = '.sc3cache'  # Inside Platform.synthdef_dir.
+SUFFIX = 'sc3def'  # Not scsyndef, the server doesn't have to load them.
+
+
+def cache_dir():
+    return plf.Platform.synthdef_dir / DIR_NAME
+
+
+class _Uncached(Exception):
+    pass
+
+
+def make_key(name, func, rates, prepend, variants):
+    '''Return a hash of the graph function code, its parameters and
+    globals, the SynthDef build arguments and the library version, or
+    None if func can't be hashed and the definition is not cached.'''
+
+    from .. import __version__
+    if not isinstance(func, types.FunctionType):
+        return None  # Partials and other callables have no code.
+    try:
+        token = (
+            __version__, name, _func_token(func, set()),
+            _value_token(rates, set()), _value_token(prepend, set()),
+            _value_token(variants, set()))
+    except (_Uncached, RecursionError):  # Recursive containers too.
+        return None
+    return hashlib.sha1(repr(token).encode()).hexdigest()
+
+
+def _func_token(func, seen):
+    if id(func) in seen:
+        return func.__qualname__
+    seen.add(id(func))
+    names = set()
+    code = _code_token(func.__code__, names)
+    globs = tuple(
+        (n, _value_token(func.__globals__[n], seen))
+        for n in sorted(names) if n in func.__globals__)
+    cells = tuple(
+        _value_token(c.cell_contents, seen)
+        for c in func.__closure__ or () if _cell_has_value(c))
+    return (
+        code, globs, cells, _value_token(func.__defaults__, seen),
+        _value_token(func.__kwdefaults__, seen),
+        _value_token(func.__annotations__, seen))
+
+
+def _code_token(code, names):
+    names.update(code.co_names)
+    consts = tuple(
+        _code_token(c, names) if isinstance(c, types.CodeType) else repr(c)
+        for c in code.co_consts)
+    return (code.co_code, consts, code.co_names, code.co_varnames)
+
+
+_LITERALS = (type(None), bool, int, float, complex, str, bytes)
+
+
+def _value_token(value, seen):
+    # Only plain literals, their containers and known types are hashed,
+    # the repr of other objects may contain addresses or be truncated
+    # (numpy arrays) and they just miss the cache.
+    if type(value) in _LITERALS:
+        return repr(value)
+    if type(value) in (tuple, list):
+        return (
+            type(value).__name__,
+            tuple(_value_token(v, seen) for v in value))
+    if type(value) in (set, frozenset):
+        return (
+            type(value).__name__,
+            tuple(sorted(repr(_value_token(v, seen)) for v in value)))
+    if type(value) is dict:
+        return ('dict', tuple(
+            (_value_token(k, seen), _value_token(v, seen))
+            for k, v in value.items()))
+    if isinstance(value, types.FunctionType):
+        return _func_token(value, seen)
+    if isinstance(value, (types.ModuleType, type)):
+        return _source_token(value)
+    if isinstance(value, types.BuiltinFunctionType)\
+    and isinstance(value.__self__, (types.ModuleType, type(None))):
+        return f'{value.__module__}.{value.__qualname__}'
+    if isinstance(value, enum.Enum):
+        return (_source_token(type(value)), value.name)
+    numpy = sys.modules.get('numpy')  # Not imported if not used.
+    if numpy is not None:
+        if isinstance(value, numpy.ndarray) and not value.dtype.hasobject:
+            data = numpy.ascontiguousarray(value).tobytes()
+            return (
+                'ndarray', value.dtype.str, value.shape,
+                hashlib.sha1(data).hexdigest())
+        if isinstance(value, numpy.generic) and not value.dtype.hasobject:
+            return (value.dtype.str, repr(value.item()))
+    raise _Uncached(type(value).__qualname__)
+
+
+def _source_token(obj):
+    # Library and built-in modules and classes are covered by the
+    # version. The source of the other ones is hashed so that editing
+    # them changes the key, the ones without source are not cached.
+    if isinstance(obj, types.ModuleType):
+        module = name = obj.__name__
+    else:
+        module = obj.__module__
+        name = f'{module}.{obj.__qualname__}'
+    package = module.partition('.')[0]
+    if package == __name__.partition('.')[0] or package == 'builtins'\
+    or package in sys.builtin_module_names:
+        return name
+    try:
+        source = inspect.getsource(obj)
+    except (OSError, TypeError) as e:
+        raise _Uncached(name) from e
+    return (name, hashlib.sha1(source.encode()).hexdigest())
+
+
+def _cell_has_value(cell):
+    try:
+        cell.cell_contents
+        return True
+    except ValueError:
+        return False
+
+
+def load(key):
+    '''Return the cached bytes for key or None.'''
+    path = cache_dir() / f'{key}.{SUFFIX}'
+    try:
+        with open(path, 'rb') as file:
+            data = file.read()
+        os.utime(path)  # Most recently used.
+        return data
+    except OSError:
+        return None
+
+
+def store(key, data, max_size):
+    '''Save data for key and evict least recently used entries if the
+    cache is bigger than max_size bytes.'''
+    dir = cache_dir()
+    path = dir / f'{key}.{SUFFIX}'
+    tmp = dir / f'{uuid.uuid4().hex}.tmp'
+    try:
+        dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp, 'wb') as file:
+            file.write(data)
+        os.replace(tmp, path)  # Atomic for concurrent processes.
+        _evict(dir, max_size)
+    except OSError as e:
+        _logger.warning(f'could not write SynthDef cache file {path}: {e}')
+
+
+def _evict(dir, max_size):
+    entries = []
+    total = 0
+    for entry in os.scandir(dir):
+        if entry.name.endswith(SUFFIX):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+    if total <= max_size:
+        return
+    entries.sort()
+    for _, size, path in entries:
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= max_size:
+            break
+
+
+def clear():
+    '''Remove all cached entries.'''
+    dir = cache_dir()
+    if not dir.exists():
+        return
+    for entry in os.scandir(dir):
+        if entry.name.endswith((SUFFIX, '.tmp')):
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
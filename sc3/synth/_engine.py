@@ -2,6 +2,7 @@
 
 import math
 import logging
+import bisect
 
 from ..base import builtins as bi
 
@@ -32,6 +33,14 @@ class NodeIDAllocator():
         self._temp = bi.wrap(x + 1, self._init_temp, 0x03FFFFFF)
         return x | self._mask
 
+    def alloc_many(self, count):
+        # Contiguous run, starts over if the range would wrap around.
+        x = self._temp
+        if x + count > 0x03FFFFFF:
+            x = self._init_temp
+        self._temp = bi.wrap(x + count, self._init_temp, 0x03FFFFFF)
+        return range(x | self._mask, (x + count) | self._mask)
+
     def alloc_perm(self):
         if len(self._perm_freed) > 0:
             x = min(self._perm_freed)
@@ -355,3 +364,94 @@ class ContiguousBlockAllocator():
     #         Post << size << ": " <<< set << "\n";
     #     });
     # }
+
+
+class BestFitBlockAllocator():
+    '''Contiguous block allocator with a deterministic best fit policy.
+
+    Same interface as ContiguousBlockAllocator. Free blocks are kept in two
+    sorted lists, by address and by (size, address), so alloc, reserve and
+    free (merging adjacent free blocks) find their blocks with binary
+    searches instead of linear scans. Inserting and removing free blocks
+    from the lists is still O(n) in the number of free blocks, a memmove
+    of the list's pointers, which is cheap for the sizes of server
+    resources. Allocation returns the smallest free block that fits, the
+    lowest address between blocks of the same size.
+    '''
+
+    def __init__(self, size, pos=0, addr_offset=0):
+        # pos is offset for reserved numbers,
+        # addr_offset is offset for client_id * size.
+        self.size = size
+        self.pos = pos + addr_offset
+        self.addr_offset = addr_offset
+        self._used = dict()  # start: ContiguousBlock
+        self._free = dict()  # start: size
+        self._free_starts = []
+        self._free_sizes = []  # (size, start)
+        if size > pos:
+            self._add_free(self.pos, size - pos)
+
+    def alloc(self, n=1):
+        i = bisect.bisect_left(self._free_sizes, (n,))
+        if i == len(self._free_sizes):
+            return None
+        start = self._free_sizes[i][1]
+        return self._take(start, start, n).start
+
+    def reserve(self, addr, size=1, warn=True):
+        i = bisect.bisect_right(self._free_starts, addr) - 1
+        if i >= 0:
+            start = self._free_starts[i]
+            if addr + size <= start + self._free[start]:
+                return self._take(start, addr, size)
+        if warn:
+            _logger.warning(
+                f'The block at ({addr}, {size}) is '
+                'already in use and cannot be reserved.')
+        return None
+
+    def free(self, addr):
+        # This prevents an error if a Buffer object is freed twice.
+        block = self._used.pop(addr, None)
+        if block is None:
+            return
+        block.used = False
+        start = block.start
+        end = start + block.size
+        if end in self._free:
+            end += self._remove_free(end)
+        i = bisect.bisect_left(self._free_starts, start)
+        if i > 0:
+            prev = self._free_starts[i - 1]
+            if prev + self._free[prev] == start:
+                self._remove_free(prev)
+                start = prev
+        self._add_free(start, end - start)
+
+    def blocks(self):
+        return sorted(self._used.values(), key=lambda x: x.start)
+
+    def _take(self, free_start, addr, n):
+        # Split the free block at free_start around [addr, addr + n).
+        free_end = free_start + self._remove_free(free_start)
+        if free_start < addr:
+            self._add_free(free_start, addr - free_start)
+        if addr + n < free_end:
+            self._add_free(addr + n, free_end - addr - n)
+        block = ContiguousBlock(addr, n)
+        block.used = True
+        self._used[addr] = block
+        return block
+
+    def _add_free(self, start, size):
+        self._free[start] = size
+        bisect.insort(self._free_starts, start)
+        bisect.insort(self._free_sizes, (size, start))
+
+    def _remove_free(self, start):
+        size = self._free.pop(start)
+        del self._free_starts[bisect.bisect_left(self._free_starts, start)]
+        del self._free_sizes[
+            bisect.bisect_left(self._free_sizes, (size, start))]
+        return size
@@ -10,6 +10,11 @@ and Node messages respectively. UGen, Node, SynthDef and SynthDescLib
 classes make use of this interface to prepare data in the right format.
 This functionality shoudln't be exposed to the user interface, supported
 data types must just work with its own interface.
+
+The parameter class for each concrete type is resolved once and kept in a
+dispatch table which is cleared when a new parameter class is defined.
+Plain int, float and str values within sequences are passed through
+without creating wrapper objects.
 """
 
 from math import isnan
@@ -26,9 +31,22 @@ nod = hks.late_import(__name__, 'sc3.synth.node', 'nod')
 lne = hks.late_import(__name__, 'sc3.synth.ugens.line', 'lne')
 
 
+# Types that are their own ugen input and control input value.
+_PLAIN_TYPES = frozenset((int, float, str))
+
+# Dispatch tables, type(obj) -> parameter class.
+_ugen_param_types = dict()
+_node_param_types = dict()
+
+
 ### Graphs Parameter Base Class ###
 
 class GraphParameter():
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _ugen_param_types.clear()
+        _node_param_types.clear()
+
     def __init__(self, value):
         self.__param_value = value
 
@@ -249,7 +267,8 @@ class UGenSequence(UGenParameter):
 
     def _as_ugen_input(self, *ugen_cls):
         m = map(
-            lambda x: ugen_param(x)._as_ugen_input(*ugen_cls),
+            lambda x: x if type(x) in _PLAIN_TYPES
+                else ugen_param(x)._as_ugen_input(*ugen_cls),
             self._param_value)
         return type(self._param_value)(m)
 
@@ -264,7 +283,8 @@ class UGenSequence(UGenParameter):
             return ugen_param(self._param_value[0])._as_ugen_rate()
         else:
             return utl.list_min(
-                [ugen_param(item)._as_ugen_rate() or 'scalar'
+                ['scalar' if type(item) in _PLAIN_TYPES
+                else ugen_param(item)._as_ugen_rate() or 'scalar'
                 for item in self._param_value])
 
     def _write_input_spec(self, file, synthdef):
@@ -331,18 +351,25 @@ class NodeSequence(NodeParameter):
 
     def _as_control_input(self):
         return type(self._param_value)(
-            node_param(x)._as_control_input() for x in self._param_value)
+            x if type(x) in _PLAIN_TYPES else node_param(x)._as_control_input()
+            for x in self._param_value)
 
     def _as_osc_arg_list(self):
         lst = []
         for e in self._param_value:
-            node_param(e)._embed_as_osc_arg(lst)
+            if type(e) in _PLAIN_TYPES:
+                lst.append(e)
+            else:
+                node_param(e)._embed_as_osc_arg(lst)
         return lst
 
     def _embed_as_osc_arg(self, lst):
         lst.append('[')
         for e in self._param_value:
-            node_param(e)._embed_as_osc_arg(lst)
+            if type(e) in _PLAIN_TYPES:
+                lst.append(e)
+            else:
+                node_param(e)._embed_as_osc_arg(lst)
         lst.append(']')
 
 
@@ -371,7 +398,7 @@ class NodeDictionary(NodeParameter):
 
 ### Module functions ###
 
-def _graph_param(obj, param_cls):
+def _graph_param(obj, param_cls, table):
     new_cls = None
     for sub_class in param_cls.__subclasses__():
         if isinstance(obj, sub_class._param_type()):
@@ -380,16 +407,23 @@ def _graph_param(obj, param_cls):
     if new_cls is None:
         raise TypeError(
             f"{param_cls.__name__}: type '{type(obj).__name__}' not supported")
+    table[type(obj)] = new_cls
     return new_cls(obj)
 
 
 def ugen_param(obj):
     if isinstance(obj, UGenParameter):
         return obj
-    return _graph_param(obj, UGenParameter)
+    new_cls = _ugen_param_types.get(type(obj))
+    if new_cls is None:
+        return _graph_param(obj, UGenParameter, _ugen_param_types)
+    return new_cls(obj)
 
 
 def node_param(obj):
     if isinstance(obj, NodeParameter):
         return obj
-    return _graph_param(obj, NodeParameter)
+    new_cls = _node_param_types.get(type(obj))
+    if new_cls is None:
+        return _graph_param(obj, NodeParameter, _node_param_types)
+    return new_cls(obj)
@@ -1,6 +1,7 @@
 """NodeWatcher.sc"""
 
-from ..base import responders as rpd
+from ..base import main as _libsc3
+from ..base import _oscinterface as osci
 from ..base import systemactions as sac
 from ..base import model as mdl
 
@@ -11,23 +12,24 @@ from ..base import model as mdl
 class NodeWatcher():
     # // Watches registered nodes and sets their isPlaying/isRunning flag.
     # // A node needs to be registered to be addressed, other nodes are ignored.
-    _CMDS = ('/n_go', '/n_end', '/n_off', '/n_on', '/n_move', '/n_info')
+
+    # All node replies go through a single receive function and a table
+    # of state changes, (is_playing, is_running), None is unchanged.
+    _CMDS = {
+        '/n_go': (True, True),
+        '/n_end': (False, False),
+        '/n_off': (None, False),  # response to /n_run 0
+        '/n_on': (None, True),  # response to /n_run 1
+        '/n_move': (None, None),  # response to /n_before, /n_after, /n_order
+        '/n_info': (None, None),  # response to /n_query
+    }
 
     def __init__(self, server):
         self._server = server
+        self._addr = server.addr
         self._nodes = dict()
-        self._responders = []
+        self._pending = []
         self._is_watching = False
-        for cmd in self._CMDS:
-            method = '_' + cmd[1:]
-            osc_func = rpd.OscFunc(
-                (lambda mthd:
-                    lambda msg, *_:
-                        self.respond(mthd, msg))(method),
-                cmd, self._server.addr)
-            osc_func.permanent = True
-            # osc_func.disable()  # *** NOTE: no sense if self.start() is not manual.
-            self._responders.append(osc_func)
         sac.CmdPeriod.add(self.__on_cmd_period)
         sac.ServerBoot.add(self._server, self.__on_server_boot)
         sac.ServerQuit.add(self._server, self.__on_server_quit)
@@ -43,27 +45,56 @@ class NodeWatcher():
 
     @property
     def responders(self):
-        return self._responders
+        # Kept for compatibility, replies are received by one function.
+        return []
 
     @property
     def is_watching(self):
         return self._is_watching
 
+    def _dispatch(self, msg, time, addr, recv_port):
+        if msg[0] not in self._CMDS\
+        or addr.addr != self._addr.addr\
+        or (self._addr.port is not None and addr.port != self._addr.port):
+            return
+        node = self._nodes.get(msg[1])
+        if node is not None:
+            self._update(node, msg[0])
+
     def respond(self, method, msg):
+        # Method is the name of the reply as '_n_go'.
         node = self._nodes.get(msg[1])
         if node is not None:
-            getattr(self, method)(node)  # *** NOTE: podría pasar también msg completo.
+            self._update(node, '/' + method[1:])
+
+    def _update(self, node, cmd):
+        playing, running = self._CMDS[cmd]
+        if playing is not None:
+            node._is_playing = playing
+        if running is not None:
+            node._is_running = running
+        if playing is False:
+            self.unregister(node)
+        # Only nodes with observers are notified, once per packet.
+        if node in mdl.NotificationCenter._registrations:
+            self._pending.append((node, cmd))
+            if len(self._pending) == 1:
+                osci.OscInterface._at_dispatch_end(self._notify_pending)
+
+    def _notify_pending(self):
+        pending = self._pending
+        self._pending = []
+        for node, cmd in pending:
+            mdl.NotificationCenter.notify(node, cmd)
 
     def start(self):
         if not self._is_watching:
-            for item in self._responders:
-                item.enable()
-                self._is_watching = True
+            _libsc3.main.add_osc_recv_func(self._dispatch)
+            self._is_watching = True
 
     def stop(self):
         if self._is_watching:
-            for item in self._responders:
-                item.free()
+            _libsc3.main.remove_osc_recv_func(self._dispatch)
             self._is_watching = False
             # self.free()  # *** BUG: sclang call Object.free that does nothing.
 
@@ -93,32 +124,6 @@ class NodeWatcher():
             mdl.NotificationCenter.notify(node, '/n_end')
         self._nodes = dict()
 
-    def _n_go(self, node):
-        node._is_playing = True
-        node._is_running = True
-        mdl.NotificationCenter.notify(node, '/n_go')
-
-    def _n_end(self, node):
-        self.unregister(node)
-        node._is_playing = False
-        node._is_running = False
-        mdl.NotificationCenter.notify(node, '/n_end')
-
-    def _n_off(self, node):  # response to /n_run 0
-        node._is_running = False
-        mdl.NotificationCenter.notify(node, '/n_off')
-
-    def _n_on(self, node):  # response to /n_run 1
-        node._is_running = True
-        mdl.NotificationCenter.notify(node, '/n_on')
-
-    def _n_move(self, node):  # response to /n_before, /n_after, /n_order
-        mdl.NotificationCenter.notify(node, '/n_move')
-
-    def _n_info(self, node):  # response to /n_query
-        mdl.NotificationCenter.notify(node, '/n_info')
-
-
     ### System Actions ###
 
     def __on_cmd_period(self):
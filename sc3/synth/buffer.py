@@ -50,8 +50,11 @@ import pathlib
 import time
 import array
 import uuid
+import sys
 
+from ..base import main as _libsc3
 from ..base import responders as rpd
+from ..base import aio
 from ..base import model as mdl
 from ..base import functions as fn
 from ..base import platform as plf
@@ -59,10 +62,14 @@ from ..base import builtins as bi
 from ..base import utils as utl
 from ..base import stream as stm
 from ..base import clock as clk
+from ..base import _hooks as hks
 from . import _graphparam as gpp
 from . import server as srv
 
 
+np = hks.import_optional_module('numpy')
+
+
 __all__ = ['Buffer']
 
 
@@ -335,8 +342,9 @@ class Buffer(gpp.UGenParameter, gpp.NodeParameter):
 
         Parameters
         ----------
-        lst: list
-            A list of samples. Multichannel data must be interleaved.
+        lst: list | array.array | memoryview | numpy.ndarray
+            A list or buffer-protocol object of samples. Multichannel data
+            must be interleaved. Float arrays are written without copying.
         channels: int
             Number of data channels.
         server: Server
@@ -349,7 +357,7 @@ class Buffer(gpp.UGenParameter, gpp.NodeParameter):
 
         server = server or srv.Server.default
         if server.addr.is_local:
-            lst = list(array.array('f', lst))  # Type check & cast.
+            lst = _as_float_array(lst)  # Type check & cast.
             path = str(
                 plf.Platform.tmp_dir / ('SC_' + uuid.uuid4().hex + '.wav'))
             sample_rate = int(server._status_watcher.sample_rate)
@@ -373,31 +381,35 @@ class Buffer(gpp.UGenParameter, gpp.NodeParameter):
             _logger.warning("cannot call 'new_load' with a non-local Server")
 
     @classmethod
-    def new_send_list(cls, lst, channels=1, server=None, wait=-1, action=None):  # Was send_collection
+    def new_send_list(cls, lst, channels=1, server=None, wait=None,
+                      action=None, *, window=8):  # Was send_collection
         '''
         Allocate a buffer and stream a large collection into the buffer using
         multiple setn messages.
 
         Parameters
         ----------
-        lst: list
-            A list of samples. Multichannel data must be interleaved.
+        lst: list | array.array | memoryview | numpy.ndarray
+            A list or buffer-protocol object of samples. Multichannel data
+            must be interleaved.
         channels: int
             Number of data channels.
         server: Server
             The server on which to allocate the buffer.
-        wait: float | int
-            An optional wait time between sending setn messages. In a high
-            traffic situation it may be safer to set this to something above
-            zero. A value <= to zero means no wait time.
+        wait: float
+            Deprecated and ignored, messages are paced by ``window``.
         action: function
             A function to be evaluated once the file has been read and this
             buffer's instance variables have been updated. The function will
             be passed this Buffer as an argument.
+        window: int
+            Maximum number of setn messages waiting for the server's
+            acknowledgement at a time.
         '''
 
+        _deprecated_wait(wait, 'new_send_list')
         server = server or srv.Server.default
-        lst = list(array.array('f', lst))  # Type check & cast.
+        lst = _as_float_array(lst)  # Type check & cast.
         buffer = cls(
             bi.ceil(len(lst) / channels), channels, server, alloc=False)
         # It was forkIfNeeded, can't be implemented in Python because
@@ -407,7 +419,7 @@ class Buffer(gpp.UGenParameter, gpp.NodeParameter):
         def send_func():
             buffer.alloc()
             yield from server.sync()
-            buffer.send_list(lst, 0, wait, action)
+            buffer.send_list(lst, 0, action=action, window=window)
 
         stm.Routine.run(send_func)
         return buffer
@@ -706,7 +718,7 @@ class Buffer(gpp.UGenParameter, gpp.NodeParameter):
 
     def load_list(self, lst, start_frame=0, action=None):  # Was load_collection
         if self._server.addr.is_local:
-            lst = list(array.array('f', lst))  # Type check & cast.
+            lst = _as_float_array(lst)  # Type check & cast.
             if len(lst) > (self._frames - start_frame) * self._channels:
                 _logger.warning(
                     'lst is larger than available number of frames')
@@ -733,35 +745,31 @@ class Buffer(gpp.UGenParameter, gpp.NodeParameter):
         else:
             _logger.warning("cannot call 'load' with a non-local Server")
 
-    def send_list(self, lst, start_frame=0, wait=-1, action=None):  # Was send_collection
-        lst = list(array.array('f', lst))  # Type check & cast.
+    def send_list(self, lst, start_frame=0, wait=None, action=None, *,
+                  window=8, timeout=0.5, retries=3):  # Was send_collection
+        '''
+        Stream a large collection into the buffer using multiple setn
+        messages, each one followed by a sync request, keeping up to
+        `window` of them in flight. Messages not acknowledged after
+        `timeout` seconds are sent again up to `retries` times. Return the
+        transfer object, its `throughput` is available when done. The
+        `wait` parameter is deprecated and ignored.
+        '''
+
+        _deprecated_wait(wait, 'send_list')
+        lst = _as_float_array(lst)  # Type check & cast.
         size = len(lst)
         if size > (self._frames - start_frame) * self._channels:
             _logger.warning('lst is larger than available number of frames')
-        self._stream_list(
-            lst, size, start_frame * self._channels, float(wait), action)
-
-    def _stream_list(self, lst, size, start_frame, wait, action):  # Was streamCollection
-        def stream_func():
-            # // wait = -1 allows an OSC roundtrip between packets.
-            # // wait = 0 might not be safe in a high traffic situation.
-            # // Maybe okay with tcp.
-            max_bndl_size = 1626  # // Max size for setn under udp.
-            pos = 0
-            sublst = None
-            while pos < size:
-                sublst = lst[pos:pos+max_bndl_size]
-                self._server.addr.send_msg(
-                    '/b_setn', self._bufnum, start_frame + pos,
-                    len(sublst), *sublst)
-                pos += max_bndl_size
-                if wait >= 0:
-                    yield wait
-                else:
-                    yield from self._server.sync()
-            fn.value(action, self)
-
-        stm.Routine.run(stream_func)
+        if self._server.addr.proto == 'tcp':
+            chunk_size = _BufferTransfer.TCP_CHUNK_SIZE
+        else:
+            chunk_size = _BufferTransfer.UDP_SETN_SIZE
+        transfer = _BufferSendTransfer(
+            self, start_frame * self._channels, lst, chunk_size,
+            window, timeout, retries, lambda _: fn.value(action, self))
+        transfer.start()
+        return transfer
 
     def get(self, index, action):
         if self._bufnum is None:
@@ -795,10 +803,40 @@ class Buffer(gpp.UGenParameter, gpp.NodeParameter):
 
         self._server.addr.send_msg('/b_getn', self._bufnum, index, count)
 
+    async def async_get(self, index):
+        '''Coroutine version of ``get`` that returns the value.'''
+        if self._bufnum is None:
+            raise BufferAlreadyFreed('async_get')
+        with _libsc3.main._main_lock:
+            future = aio.osc_reply(
+                '/b_set', self._server.addr, [self._bufnum, index],
+                lambda msg: msg[3])
+            self._server.addr.send_msg('/b_get', self._bufnum, index)
+        return await future
+
+    async def async_getn(self, index, count):
+        '''Coroutine version of ``getn`` that returns the values.'''
+        if self._bufnum is None:
+            raise BufferAlreadyFreed('async_getn')
+        with _libsc3.main._main_lock:
+            future = aio.osc_reply(
+                '/b_setn', self._server.addr, [self._bufnum, index],
+                lambda msg: msg[4:])
+            self._server.addr.send_msg('/b_getn', self._bufnum, index, count)
+        return await future
+
     # // these next two get the data and put it in a float array
     # // which is passed to action
 
-    def load_to_list(self, action, index=0, count=-1):
+    def load_to_list(self, action, index=0, count=-1, as_array=False):
+        '''Get the buffer's data through a temporary file.
+
+        Only works with a local server. The data is passed to `action`
+        along with this buffer as a list, or as an `array.array('f')` if
+        `as_array` is True, which can be wrapped without copying by
+        `numpy.frombuffer(data, 'f')`.
+        '''
+
         def load_fork():
             path = str(
                 plf.Platform.tmp_dir / ('SC_' + uuid.uuid4().hex + '.wav'))
@@ -809,57 +847,43 @@ class Buffer(gpp.UGenParameter, gpp.NodeParameter):
                 pathlib.Path(path).unlink()
             except:
                 _logger.warning(f'could not delete data file: {path}')
+            if not as_array:
+                lst = lst.tolist()
             fn.value(action, lst, self)
 
         stm.Routine.run(load_fork)
 
-    def get_to_list(self, action, index=0, count=None, wait=0.01, timeout=3):
-        # // risky without wait
-        max_udp_size = 1633  # // Max size for getn under udp.
-        pos = index = int(index)
+    def get_to_list(self, action, index=0, count=None, wait=None, *,
+                    window=8, timeout=0.5, retries=3, as_array=False):
+        '''
+        Get the buffer's data using multiple getn messages, keeping up to
+        `window` requests in flight. Requests not replied after `timeout`
+        seconds are sent again up to `retries` times. The data is passed to
+        `action` as a list, or as an `array.array('f')` if `as_array` is
+        True. Return the transfer object, its `throughput` is available
+        when done. The `wait` parameter is deprecated and ignored.
+        '''
+
+        _deprecated_wait(wait, 'get_to_list')
+        index = int(index)
         if count is None:
-            count = int(self._frames * self._channels)
-        array = []  # [0.0] * count
-        ref_count = int(bi.roundup(count / max_udp_size))
-        count += pos
-        done = False
+            count = int(self._frames * self._channels) - index
+        if self._server.addr.proto == 'tcp':
+            chunk_size = _BufferTransfer.TCP_CHUNK_SIZE
+        else:
+            chunk_size = _BufferTransfer.UDP_GETN_SIZE
 
-        def resp_func(msg, *_):
-            nonlocal done, ref_count
-            if msg[1] == self._bufnum:
-                array.extend(msg[4:])
-                ref_count -= 1
-                if ref_count <= 0:
-                    done = True
-                    resp.free()  # *** BUG: clear() ???
-                    fn.value(action, array)  #, self)  # *** NOTE: CHANGEG: because get & getn don't pass self to action, only data
-
-        resp = rpd.OscFunc(resp_func, '/b_setn', self._server.addr)
-
-        def getn_func():
-            nonlocal pos
-            while pos < count:
-                getsize = bi.min(max_udp_size, count - pos)
-                self._server.addr.send_msg(
-                    '/b_getn', self._bufnum, pos, getsize)
-                pos += getsize
-                if wait >= 0:
-                    yield wait
-                else:
-                    yield from self._server.sync()
-
-        stm.Routine.run(getn_func)
-
-        # // Lose the responder if the network choked.
-        def timeout_func():
-            if not done:
-                resp.free()
-                # Can fail for many reasons not only networking time,
-                # for example: 'FAILURE IN SERVER /b_getn index out of range'
-                # if the buffer wasn't allocated.
-                _logger.warning('get_to_list failed')
-
-        clk.SystemClock.sched(timeout, timeout_func)
+        def done_action(data):
+            if not as_array:
+                data = data.tolist()
+            # NOTE: get & getn don't pass self to action, only data.
+            fn.value(action, data)
+
+        transfer = _BufferGetTransfer(
+            self, index, array.array('f', bytes(4 * count)), chunk_size,
+            window, timeout, retries, done_action)
+        transfer.start()
+        return transfer
 
 
     ### Gen commands ###
@@ -1062,6 +1086,149 @@ class Buffer(gpp.UGenParameter, gpp.NodeParameter):
 
 
 
+class _BufferTransfer():
+    # Windowed data transfer engine for /b_getn and /b_setn. Chunks are
+    # requested up to window at a time and their replies are written by
+    # index into a preallocated array. The engine runs in SystemClock.
+
+    UDP_GETN_SIZE = 1633  # Max size for getn reply under udp.
+    UDP_SETN_SIZE = 1624  # Max size for setn plus /sync bundle under udp.
+    TCP_CHUNK_SIZE = 8192
+
+    def __init__(self, buffer, offset, data, chunk_size,
+                 window, timeout, retries, action):
+        self.buffer = buffer
+        self.offset = offset
+        self.data = data
+        self.chunk_size = chunk_size
+        self.window = max(1, int(window))
+        self.timeout = timeout
+        self.retries = retries
+        self.action = action
+        self.retried = 0
+        self.done = False
+        self.failed = False
+        self.start_time = None
+        self.end_time = None
+        self._positions = iter(range(0, len(data), chunk_size))
+        self._pending = dict()  # key: [pos, send time, tries]
+        self._responder = None
+
+    @property
+    def elapsed(self):
+        if self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    @property
+    def throughput(self):
+        '''Samples per second, None until the transfer is done.'''
+        if self.end_time is None:
+            return None
+        return len(self.data) / max(self.elapsed, 1e-9)
+
+    def start(self):
+        clk.SystemClock.sched(0, lambda: self._watchdog())
+
+    def _watchdog(self):
+        if self.done:
+            return None
+        now = _libsc3.main.elapsed_time()
+        if self.start_time is None:
+            self.start_time = now
+            self._responder = self._make_responder()
+            self._fill()
+        else:
+            for key, entry in list(self._pending.items()):
+                if now - entry[1] < self.timeout:
+                    continue
+                if entry[2] >= self.retries:
+                    self._fail()
+                    return None
+                del self._pending[key]
+                self.retried += 1
+                self._send_chunk(entry[0], entry[2] + 1)
+        return None if self.done else self.timeout
+
+    def _fill(self):
+        while len(self._pending) < self.window:
+            pos = next(self._positions, None)
+            if pos is None:
+                break
+            self._send_chunk(pos, 0)
+        if not self._pending:
+            self._finish()
+
+    def _reply(self, key, values=None):
+        entry = self._pending.pop(key, None)
+        if entry is None or self.done:
+            return  # Late reply of a retried chunk.
+        if values is not None:
+            pos = entry[0]
+            self.data[pos:pos+len(values)] = array.array('f', values)
+        self._fill()
+
+    def _finish(self):
+        self.done = True
+        self.end_time = _libsc3.main.elapsed_time()
+        self._responder.free()
+        _logger.debug(
+            f'{type(self).__name__}: {len(self.data)} samples in '
+            f'{self.elapsed:.3f} s ({self.throughput:.0f} samples/s, '
+            f'{self.retried} retries)')
+        self.action(self.data)
+
+    def _fail(self):
+        self.done = self.failed = True
+        self._responder.free()
+        # Can fail for many reasons not only networking time, for example:
+        # 'FAILURE IN SERVER /b_getn index out of range' if the buffer
+        # wasn't allocated.
+        _logger.warning(f'{type(self).__name__} failed')
+
+    def _make_responder(self):
+        raise NotImplementedError
+
+    def _send_chunk(self, pos, tries):
+        raise NotImplementedError
+
+
+class _BufferGetTransfer(_BufferTransfer):
+    def _make_responder(self):
+        def resp_func(msg, *_):
+            # [/b_setn, bufnum, starting index, length, ...sample values].
+            self._reply(msg[2], msg[4:])
+
+        return rpd.OscFunc(
+            resp_func, '/b_setn', self.buffer._server.addr,
+            arg_template=[self.buffer._bufnum])
+
+    def _send_chunk(self, pos, tries):
+        index = self.offset + pos
+        size = min(self.chunk_size, len(self.data) - pos)
+        self._pending[index] = [pos, _libsc3.main.elapsed_time(), tries]
+        self.buffer._server.addr.send_msg(
+            '/b_getn', self.buffer._bufnum, index, size)
+
+
+class _BufferSendTransfer(_BufferTransfer):
+    def _make_responder(self):
+        def resp_func(msg, *_):
+            self._reply(msg[1])
+
+        return rpd.OscFunc(resp_func, '/synced', self.buffer._server.addr)
+
+    def _send_chunk(self, pos, tries):
+        id = bi.uid()
+        sublst = self.data[pos:pos+self.chunk_size].tolist()
+        self._pending[id] = [pos, _libsc3.main.elapsed_time(), tries]
+        self.buffer._server.addr.send_bundle(
+            None,
+            ['/b_setn', self.buffer._bufnum, self.offset + pos,
+             len(sublst), *sublst],
+            ['/sync', id])
+
+
 # Minimal utility functions to avoid depencencies.
 
 import struct
@@ -1085,28 +1252,42 @@ def _wave_header(frames, channels, sample_rate):
         struct.pack('<L', 4 * frames * channels)  # Size
     )
 
+def _deprecated_wait(wait, method):
+    # The wait time between messages was replaced by the request window.
+    if wait is not None:
+        _logger.warning(
+            f"'wait' parameter of Buffer.{method} is deprecated "
+            "and ignored, use 'window'")
+
+
+def _as_float_array(data):
+    # Return data as a one dimensional float32 buffer-protocol object,
+    # float arrays are not copied. Other iterables are cast to array.array.
+    if isinstance(data, array.array) and data.typecode == 'f':
+        return data
+    if isinstance(data, memoryview) and data.format == 'f'\
+    and data.c_contiguous:
+        return data if data.ndim == 1 else data.cast('B').cast('f')
+    if not isinstance(np, hks.OptionalModuleProxy)\
+    and isinstance(data, np.ndarray):
+        return np.ascontiguousarray(data, dtype=np.float32).reshape(-1)
+    return array.array('f', data)
+
+
 def _write_wave_file(path, data, channels, sample_rate):
-    # data is already interleaved.
+    # data is already interleaved and returned by _as_float_array.
+    size = len(data)
+    if sys.byteorder == 'big':
+        data = array.array('f', memoryview(data).cast('B').cast('f'))
+        data.byteswap()
     with open(path, 'w+b') as file:
-        size = len(data)
-        write_size = 256  # Number of floats, 1kb.
-        cs = size // write_size * write_size
-        rs = size % write_size
-        fmt = '<' + 'f' * write_size
-        i = 0
-
         file.write(_wave_header(size // channels, channels, sample_rate))
+        file.write(data)
 
-        while i < cs:
-            file.write(struct.pack(fmt, *data[i:i + write_size]))
-            i += write_size
-
-        if rs > 0:
-            fmt = '<' + 'f' * rs
-            file.write(struct.pack(fmt, *data[i:i + rs]))
 
 def _read_wave_file(path):
-    ret = []
+    # Return the samples as array.array('f').
+    ret = array.array('f')
     with open(path, 'r+b') as file:
         # b'fmt ' chunk length.
         file.seek(16)
@@ -1122,18 +1303,8 @@ def _read_wave_file(path):
             file.seek(file.tell() + ck_len)
 
         size = struct.unpack('<L', file.read(4))[0]
-        read_size = 1024  # Number of bytes.
-        cs = size // read_size * read_size
-        rs = size % read_size
-        fmt = '<' + 'f' * (read_size // 4)
-        i = 0
-
-        while i < cs:
-            ret.extend(struct.unpack(fmt, file.read(read_size)))
-            i += read_size
-
-        if rs > 0:
-            fmt = '<' + 'f' * (rs // 4)
-            ret.extend(struct.unpack(fmt, file.read(rs)))
+        ret.fromfile(file, size // 4)
 
+    if sys.byteorder == 'big':
+        ret.byteswap()
     return ret
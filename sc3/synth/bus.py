@@ -4,8 +4,10 @@ import logging
 
 from . import _graphparam as gpp
 from . import server as srv
+from ..base import main as _libsc3
 from ..base import utils as utl
 from ..base import responders as rpd
+from ..base import aio
 
 
 __all__ = ['AudioBus', 'ControlBus']
@@ -416,6 +418,38 @@ class ControlBus(Bus):
             count = self._channels
         self._server.addr.send_msg('/c_getn', self._index, count)
 
+    async def async_get(self):
+        '''Coroutine version of ``get`` that returns the value.
+
+        The value is a list if the bus has more than one channel.
+
+        '''
+
+        if self._channels == 1:
+            if self._index is None:
+                raise BusAlreadyFreed('async_get')
+            with _libsc3.main._main_lock:
+                future = aio.osc_reply(
+                    '/c_set', self._server.addr, [self._index],
+                    lambda msg: msg[2])
+                self._server.addr.send_msg('/c_get', self._index)
+            return await future
+        else:
+            return await self.async_getn(self._channels)
+
+    async def async_getn(self, count=None):
+        '''Coroutine version of ``getn`` that returns the values.'''
+        if self._index is None:
+            raise BusAlreadyFreed('async_getn')
+        if count is None:
+            count = self._channels
+        with _libsc3.main._main_lock:
+            future = aio.osc_reply(
+                '/c_setn', self._server.addr, [self._index],
+                lambda msg: msg[3:])
+            self._server.addr.send_msg('/c_getn', self._index, count)
+        return await future
+
     def fill(self, value, channels):
         '''Set contiguous buses from this bus index to a single value.
 
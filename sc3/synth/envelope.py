@@ -1,5 +1,7 @@
 """Env.sc"""
 
+import array
+import bisect
 import copy
 import operator
 import math
@@ -7,11 +9,14 @@ import math
 from ..base import main as _libsc3
 from ..base import utils as utl
 from ..base import builtins as bi
+from ..base import _hooks as hks
 from . import _graphparam as gpp
 from .ugens import trig as trg
 from .ugens import oscillators as ocl
 
 
+np = hks.import_optional_module('numpy')
+
 __all__ = ['Env']
 
 
@@ -172,6 +177,7 @@ class Env(gpp.UGenParameter, gpp.NodeParameter):
         self.offset = offset
         self.__envgen_format = None
         self.__interpolation_format = None
+        self.__tables = None
 
     # no newClear
     # no kr
@@ -629,9 +635,56 @@ class Env(gpp.UGenParameter, gpp.NodeParameter):
             bi.lincurve, obj.levels, min, max, lo, hi, curve)
         return obj
 
+    def sample(self, n=400, duration=None):
+        '''Return the values of the envelope at evenly spaced times.
+
+        Parameters
+        ----------
+        n : int
+            Number of values.
+        duration : float | int
+            Time of the last value, the first one is at time zero.
+            Default is the total duration of the envelope.
+
+        Returns
+        -------
+        An ``array.array('d')`` or a list of them if the envelope is
+        multichannel.
+
+        Notes
+        -----
+        Values are the same as those of evaluating the envelope at each
+        time but computed in a single pass, using numpy if available.
+
+        '''
+
+        if duration is None:
+            duration = self.total_duration()
+        step = duration / (n - 1) if n > 1 else 0.0
+        ret = [table.sample(n, step, self.offset) for table in self._tables()]
+        return utl.unbubble(ret)
+
+    def as_signal(self, size=400):
+        '''Return the envelope sampled over its duration as float32.
+
+        The returned ``array.array('f')``, or list of them if the
+        envelope is multichannel, can be loaded into a ``Buffer`` with
+        ``load_list`` or ``send_list`` without conversion.
+
+        Parameters
+        ----------
+        size : int
+            Number of values.
+
+        '''
+
+        ret = self.sample(size)
+        if isinstance(ret, list):
+            return [array.array('f', s) for s in ret]
+        return array.array('f', ret)
+
     # TODO
     # asMultichannelSignal
-    # asSignal
     # discretize
     # storeArgs
     # ==
@@ -735,81 +788,14 @@ class Env(gpp.UGenParameter, gpp.NodeParameter):
         self.__interpolation_format = [tuple(i) for i in utl.flop(contents)]
         return self.__interpolation_format
 
+    def _tables(self):
+        if self.__tables is None:
+            self.__tables = [_EnvTable(d) for d in self._envgen_format()]
+        return self.__tables
+
     def _at(self, time):
-        data = self._envgen_format()
         time = max(0, time - self.offset)
-        return utl.unbubble([self._env_at(d, time) for d in data])
-
-    def _env_at(self, data, time):
-        # Values of data tuple:
-        # (start_level, num_stages, release_node, loop_node, stage1 [, ...])
-        # stage = *(target_level, target_dur, shape, curve)
-        if len(data) < 8:
-            raise ValueError('Env must have at least one stage')
-
-        start_level = float(data[0])  # *** begLevel
-        num_stages = data[1]
-        begin_time = end_time = 0.0  # *** begTime, endTime
-        shape_names = self._SHAPE_NAMES
-
-        for i in range(4, num_stages * 4 + 1, 4):
-            target_level = float(data[i])  # *** endLevel
-            target_dur = data[i + 1]  # *** dur
-            end_time += target_dur
-
-            if time < end_time:
-                shape = data[i + 2]
-                pos = (time - begin_time) / target_dur
-
-                if shape == shape_names['step']:
-                    return target_level
-                elif shape == shape_names['hold']:
-                    return start_level
-                elif shape == shape_names['linear']:
-                    return pos * (target_level - start_level) + start_level
-                elif shape == shape_names['exponential']:
-                    if start_level == 0.0: return 0.0
-                    return start_level * bi.pow(target_level / start_level, pos)
-                elif shape == shape_names['sine']:
-                    return (
-                        start_level + (target_level - start_level) *
-                        (-bi.cos(bi.pi * pos) * 0.5 + 0.5))
-                elif shape == shape_names['welch']:
-                    if start_level < target_level:
-                        return (
-                            start_level + (target_level - start_level) *
-                            bi.sin(bi.pi2 * pos))
-                    else:
-                        return (
-                            target_level - (target_level - start_level) *
-                            bi.sin(bi.pi2 - bi.pi2 * pos))
-                elif shape == 5:  # 'curvature value'
-                    curve = data[i + 3]
-                    if math.fabs(curve) < 0.0001:
-                        return pos * (target_level - start_level) + start_level
-                    else:
-                        fac = (
-                            (1.0 - bi.exp(pos * curve)) /
-                            (1.0 - bi.exp(curve)))
-                        return (
-                            start_level + (target_level - start_level) * fac)
-                elif shape == shape_names['squared']:
-                    sqrt_sl = bi.sqrt(start_level)
-                    sqrt_tl = bi.sqrt(target_level)
-                    sqrt_level = pos * (sqrt_tl - sqrt_sl) + sqrt_sl
-                    return sqrt_level * sqrt_level
-                elif shape == shape_names['cubed']:
-                    cbrt_sl = bi.pow(start_level, 0.3333333)
-                    cbrt_tl = bi.pow(target_level, 0.3333333)
-                    cbrt_level = pos * (cbrt_tl - cbrt_sl) + cbrt_sl
-                    return cbrt_level * cbrt_level * cbrt_level
-                else:
-                    raise ValueError(f'invalid shape number: {shape}')
-            else:
-                start_level = target_level
-                begin_time = end_time
-
-        return start_level
+        return utl.unbubble([table.at(time) for table in self._tables()])
 
     def __repr__(self):
         return (
@@ -825,3 +811,122 @@ class Env(gpp.UGenParameter, gpp.NodeParameter):
 
     def _embed_as_osc_arg(self, lst):
         gpp.node_param(self._as_control_input())._embed_as_osc_arg(lst)
+
+
+class _EnvTable():
+    # Compiled single channel envelope for language side evaluation. Stage
+    # end times are cumulative for binary search and each stage has its
+    # interpolation function of the position within the stage.
+
+    def __init__(self, data):
+        # (start_level, num_stages, release_node, loop_node, stage1 [, ...])
+        # stage = *(target_level, target_dur, shape, curve)
+        if len(data) < 8:
+            raise ValueError('Env must have at least one stage')
+        start_level = float(data[0])
+        end_time = 0.0
+        self.ends = []
+        self.stages = []
+        for i in range(4, data[1] * 4 + 1, 4):
+            target_level = float(data[i])
+            begin_time = end_time
+            end_time += data[i + 1]
+            self.ends.append(end_time)
+            self.stages.append((
+                begin_time, data[i + 1], data[i + 2], data[i + 3],
+                start_level, target_level))
+            start_level = target_level
+        self.end_level = start_level
+        self._funcs = [
+            (begin, dur, self._stage_func(shape, curve, sl, tl, math))
+            for begin, dur, shape, curve, sl, tl in self.stages]
+
+    @staticmethod
+    def _stage_func(shape, curve, start_level, target_level, m):
+        # Functions of pos for the math module or numpy arrays.
+        names = Env._SHAPE_NAMES
+        delta = target_level - start_level
+        if shape == names['step']:
+            return lambda pos: pos * 0 + target_level
+        elif shape == names['hold']:
+            return lambda pos: pos * 0 + start_level
+        elif shape == names['linear']:
+            return lambda pos: pos * delta + start_level
+        elif shape == names['exponential']:
+            if start_level == 0.0:
+                return lambda pos: pos * 0 + 0.0
+            ratio = abs(target_level / start_level)  # Same as bi.pow.
+            return lambda pos: start_level * ratio ** pos
+        elif shape == names['sine']:
+            return lambda pos: (
+                start_level + delta * (-m.cos(bi.pi * pos) * 0.5 + 0.5))
+        elif shape == names['welch']:
+            if start_level < target_level:
+                return lambda pos: start_level + delta * m.sin(bi.pi2 * pos)
+            else:
+                return lambda pos: (
+                    target_level - delta * m.sin(bi.pi2 - bi.pi2 * pos))
+        elif shape == 5:  # 'curvature value'
+            if math.fabs(curve) < 0.0001:
+                return lambda pos: pos * delta + start_level
+            denom = 1.0 - bi.exp(curve)
+            return lambda pos: (
+                start_level + delta * ((1.0 - m.exp(pos * curve)) / denom))
+        elif shape == names['squared']:
+            sqrt_sl = bi.sqrt(start_level)
+            sqrt_tl = bi.sqrt(target_level)
+            def squared(pos):
+                sqrt_level = pos * (sqrt_tl - sqrt_sl) + sqrt_sl
+                return sqrt_level * sqrt_level
+            return squared
+        elif shape == names['cubed']:
+            cbrt_sl = bi.pow(start_level, 0.3333333)
+            cbrt_tl = bi.pow(target_level, 0.3333333)
+            def cubed(pos):
+                cbrt_level = pos * (cbrt_tl - cbrt_sl) + cbrt_sl
+                return cbrt_level * cbrt_level * cbrt_level
+            return cubed
+        else:
+            raise ValueError(f'invalid shape number: {shape}')
+
+    def at(self, time):
+        i = bisect.bisect_right(self.ends, time)
+        if i == len(self.ends):
+            return self.end_level
+        begin, dur, func = self._funcs[i]
+        return func((time - begin) / dur)
+
+    def sample(self, n, step, offset):
+        # Times are i * step - offset, clipped at zero, as in Env._at.
+        if isinstance(np, hks.OptionalModuleProxy):
+            return self._sample(n, step, offset)
+        times = np.maximum(np.arange(n) * step - offset, 0)
+        out = np.full(n, self.end_level)
+        bounds = np.searchsorted(times, self.ends, 'left')
+        start = 0
+        with np.errstate(all='ignore'):
+            for stop, stage in zip(bounds, self.stages):
+                if stop > start:
+                    begin, dur, shape, curve, sl, tl = stage
+                    func = self._stage_func(shape, curve, sl, tl, np)
+                    out[start:stop] = func((times[start:stop] - begin) / dur)
+                    start = stop
+        return array.array('d', out.tobytes())
+
+    def _sample(self, n, step, offset):
+        # Stages and times are both sorted, each stage is found once.
+        out = array.array('d', bytes(8 * n))
+        ends = self.ends
+        funcs = self._funcs
+        last = len(ends)
+        i = 0
+        for j in range(n):
+            time = max(j * step - offset, 0)
+            while i < last and ends[i] <= time:
+                i += 1
+            if i == last:
+                out[j] = self.end_level
+            else:
+                begin, dur, func = funcs[i]
+                out[j] = func((time - begin) / dur)
+        return out
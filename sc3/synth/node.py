@@ -1,5 +1,6 @@
 """Node.sc"""
 
+import array
 import logging
 
 from ..base import utils as utl
@@ -8,12 +9,14 @@ from ..base import functions as fn
 from ..base import model as mdl
 from ..base import stream as stm
 from ..base import clock as clk
+from ..base import main as _libsc3
+from ..base import aio
 from . import server as srv
 from . import synthdesc as sdc
 from . import _graphparam as gpp
 
 
-__all__ = ['Group', 'ParGroup', 'Synth']
+__all__ = ['Group', 'ParGroup', 'Synth', 'NodeSet']
 
 
 _logger = logging.getLogger(__name__)
@@ -445,6 +448,20 @@ class Node(gpp.NodeParameter):
             arg_template=[self.node_id]).one_shot()
         self.server.addr.send_msg('/n_query', self.node_id)
 
+    async def async_query(self):
+        '''Coroutine version of ``query``.
+
+        Returns the '/n_info' reply as a list with the values that
+        ``query`` passes to its action.
+
+        '''
+
+        with _libsc3.main._main_lock:
+            future = aio.osc_reply(
+                '/n_info', self.server.addr, [self.node_id])
+            self.server.addr.send_msg('/n_query', self.node_id)
+        return await future
+
     def register(self, playing=True, running=True):
         '''Registers the node at the ``NodeWatcher`` object.
 
@@ -668,6 +685,18 @@ class AbstractGroup(Node):
 
         return cls(target, 'addReplace')
 
+    def spawn_many(self, def_name, args, add_action='addToTail',
+                   register=False, latency=None):
+        '''Create many synth nodes of the same definition in this group.
+
+        See ``Synth.new_many`` for the description of the parameters,
+        this group is the target.
+
+        '''
+
+        return Synth.new_many(
+            def_name, args, self, add_action, register, latency)
+
     # // move Nodes to this group
 
     def _move_node_to_head(self, node):
@@ -993,6 +1022,111 @@ class Synth(Node):
         )
         return synth
 
+    @classmethod
+    def new_many(cls, def_name, args, target=None, add_action='addToHead',
+                 register=False, latency=None):
+        '''Create many synth nodes of the same definition at once.
+
+        Node IDs are allocated as a contiguous run and all '/s_new'
+        messages are sent within as few bundles as the datagram size
+        allows.
+
+        This method returns full ``Synth`` objects so that each node can
+        be registered at the ``NodeWatcher``, track its group and be
+        used wherever a ``Node`` is expected. Use ``NodeSet.new``, which
+        takes the same parameters except `register`, to get a compact
+        array backed handle for large numbers of nodes instead.
+
+        Parameters
+        ----------
+        def_name : str
+            The name of the synthesis definition used by the server
+            to create synth nodes.
+        args : list | dict
+            Either a list with the arguments of each synth, as dict
+            or list of name value pairs, or a dict of columns that maps
+            control names to sequences of values, one per synth.
+            Column values that are not sequences are used for all the
+            synths.
+        target : Server | Node
+            The target server or node. If `None` default node of the
+            default server will be used.
+        add_action : str | int
+            Add action for each synth, 'addReplace' is not valid.
+        register : bool
+            Register the nodes at the ``NodeWatcher`` object.
+            Default is `False`.
+        latency : float | None
+            Bundle time. If `None` bundles are sent for immediate
+            execution.
+
+        Returns
+        -------
+        list
+            The new ``Synth`` objects in creation order.
+
+        '''
+
+        server, group, node_ids, msgs = cls._new_many_msgs(
+            def_name, args, target, add_action)
+        register = register or Node._register_all
+        synths = []
+        for node_id in node_ids:
+            synth = cls.basic_new(def_name, server, node_id)
+            synth.group = group
+            if register:
+                synth.register()
+            synths.append(synth)
+        if msgs:
+            server.addr.send_clumped_bundles(latency, *msgs)
+        return synths
+
+    @classmethod
+    def _new_many_msgs(cls, def_name, args, target, add_action):
+        target = gpp.node_param(target)._as_target()
+        server = target.server
+        add_action_id = cls.add_actions[add_action]
+        if add_action_id == 4:
+            raise ValueError("add action 'addReplace' is not valid for new_many")
+        group = target if add_action_id < 2 else target.group
+        if isinstance(args, dict):
+            arg_lists = cls._columns_to_arg_lists(args)
+        else:
+            arg_lists = [gpp.node_param(a or [])._as_osc_arg_list() for a in args]
+        node_ids = server._next_node_ids(len(arg_lists))
+        msgs = [
+            [
+                '/s_new', # 9
+                def_name, node_id, add_action_id, target.node_id,
+                *arg_list
+            ]
+            for node_id, arg_list in zip(node_ids, arg_lists)]
+        return server, group, node_ids, msgs
+
+    @staticmethod
+    def _columns_to_arg_lists(columns):
+        names = list(columns)
+        cols = [columns[n] for n in names]
+        count = None
+        for value in cols:
+            if isinstance(value, str) or not hasattr(value, '__len__'):
+                continue
+            if count is None:
+                count = len(value)
+            elif len(value) != count:
+                raise ValueError('columns must have the same length')
+        if count is None:
+            raise ValueError('at least one column must be a sequence')
+        cols = [
+            [value] * count
+            if isinstance(value, str) or not hasattr(value, '__len__')
+            else value for value in cols]
+        res = []
+        for values in zip(*cols):
+            pairs = [x for pair in zip(names, values) for x in pair]
+            res.append(gpp.node_param(pairs)._as_osc_arg_list())
+        return res
+
     @classmethod
     def grain(cls, def_name, args=None, target=None, add_action='addToHead'):
         '''Create a transitory synth node.
@@ -1153,3 +1287,222 @@ class Synth(Node):
 
     def __repr__(self):
         return f'{type(self).__name__}({self.def_name} : {self.node_id})'
+
+
+class NodeSet():
+    '''Compact client-side representation of many synth nodes.
+
+    Node IDs, synthdef names and local states are stored in parallel
+    arrays instead of individual ``Synth`` objects, messages for all
+    the nodes are sent in bulk. Indexing or iterating creates ``Synth``
+    objects on demand, slicing returns a new independent node set.
+
+    Each node takes about 7 bytes against 176 bytes as a ``Synth``
+    object (measured with tracemalloc for 100,000 nodes, see
+    tests/benchmarks/bench_node_memory.py).
+
+    As with ``Node``, the local state of the nodes only changes
+    through the methods of this object, nodes freed by the server are
+    not tracked.
+
+    '''
+
+    __slots__ = ('server', '_node_ids', '_def_names', '_def_index', '_states')
+
+    _FREED = 0
+    _RUNNING = 1
+    _PAUSED = 2
+    _IDS_PER_MSG = 1024  # For messages that take many node IDs.
+
+    def __init__(self, node_ids, def_name, server=None):
+        '''
+        Parameters
+        ----------
+        node_ids : iterable(int)
+            IDs of existing nodes.
+        def_name : str | list(str)
+            The synthdef name of all the nodes or a list of names, one
+            for each node.
+        server : Server
+            The target server. If `None` default server will be used.
+
+        '''
+
+        self.server = server or srv.Server.default
+        self._node_ids = array.array('i', node_ids)
+        n = len(self._node_ids)
+        if isinstance(def_name, str):
+            self._def_names = [def_name]
+            self._def_index = array.array('H', bytes(2 * n))
+        else:
+            names = dict()
+            self._def_index = array.array(
+                'H', [names.setdefault(x, len(names)) for x in def_name])
+            if len(self._def_index) != n:
+                raise ValueError('def_name must have one name for each node')
+            self._def_names = list(names)
+        self._states = bytearray([self._RUNNING]) * n
+
+    @classmethod
+    def new(cls, def_name, args, target=None, add_action='addToHead',
+            latency=None):
+        '''Create many synth nodes of the same definition at once.
+
+        Parameters are the same as ``Synth.new_many`` but no ``Synth``
+        objects are created.
+
+        '''
+
+        server, _, node_ids, msgs = Synth._new_many_msgs(
+            def_name, args, target, add_action)
+        if msgs:
+            server.addr.send_clumped_bundles(latency, *msgs)
+        return cls(node_ids, def_name, server)
+
+    @classmethod
+    def from_nodes(cls, nodes):
+        '''Create a node set from a list of ``Synth`` objects.'''
+        nodes = list(nodes)
+        server = nodes[0].server if nodes else None
+        return cls(
+            [x.node_id for x in nodes], [x.def_name for x in nodes], server)
+
+    @property
+    def node_ids(self):
+        '''array : The node IDs as an array of int32.'''
+        return self._node_ids
+
+    def is_running(self, index):
+        '''Return `True` if the node at index was not paused or freed.'''
+        return self._states[index] == self._RUNNING
+
+    def is_playing(self, index):
+        '''Return `True` if the node at index was not freed.'''
+        return self._states[index] != self._FREED
+
+    def _live(self):
+        return [i for i, x in zip(self._node_ids, self._states) if x]
+
+    def _send(self, latency, msgs):
+        if msgs:
+            self.server.addr.send_clumped_bundles(latency, *msgs)
+
+    def set(self, *args, latency=None):
+        '''Set the same controls' values for all the nodes.
+
+        Parameters are the same as ``Node.set``, latency is the bundle
+        time, if `None` bundles are sent for immediate execution.
+
+        '''
+
+        arg_list = gpp.node_param(args)._as_osc_arg_list()
+        self._send(latency, [
+            ['/n_set', node_id, *arg_list]  # 15
+            for node_id in self._live()])
+
+    def set_many(self, args, latency=None):
+        '''Set different controls' values for each node.
+
+        Parameters
+        ----------
+        args : list | dict
+            Either a list with the arguments of each node or a dict
+            of columns as in ``Synth.new_many``, the number of items
+            must be the same as the number of nodes.
+        latency : float | None
+            Bundle time. If `None` bundles are sent for immediate
+            execution.
+
+        '''
+
+        if isinstance(args, dict):
+            arg_lists = Synth._columns_to_arg_lists(args)
+        else:
+            arg_lists = [gpp.node_param(a or [])._as_osc_arg_list() for a in args]
+        if len(arg_lists) != len(self._node_ids):
+            raise ValueError('args must have one item for each node')
+        self._send(latency, [
+            ['/n_set', node_id, *arg_list]  # 15
+            for node_id, arg_list, state
+            in zip(self._node_ids, arg_lists, self._states) if state])
+
+    def map(self, *args, latency=None):
+        '''Map controls of all the nodes to read from control rate buses.
+
+        Parameters are the same as ``Node.map``.
+
+        '''
+
+        arg_list = gpp.node_param(args)._as_control_input()
+        self._send(latency, [
+            ['/n_map', node_id, *arg_list]
+            for node_id in self._live()])
+
+    def run(self, flag=True, latency=None):
+        '''Set the running state of all the nodes.'''
+        flag = int(flag)
+        ids = self._live()
+        msgs = []
+        for j in range(0, len(ids), self._IDS_PER_MSG):
+            msg = ['/n_run']  # 12
+            for node_id in ids[j:j + self._IDS_PER_MSG]:
+                msg.extend((node_id, flag))
+            msgs.append(msg)
+        self._send(latency, msgs)
+        state = self._RUNNING if flag else self._PAUSED
+        states = self._states
+        for i, x in enumerate(states):
+            if x:
+                states[i] = state
+
+    def release(self, time=None, latency=None):
+        '''Release all the nodes using the `'gate'` control.
+
+        Parameters are the same as ``Node.release``, bundles are sent
+        with the server's latency if latency is `None`.
+
+        '''
+
+        if time is not None:
+            if time <= 0:
+                time = -1
+            else:
+                time = -(time + 1)
+        else:
+            time = 0
+        if latency is None:
+            latency = self.server.latency
+        self._send(latency, [
+            ['/n_set', node_id, 'gate', time]  # 15
+            for node_id in self._live()])
+
+    def free(self, latency=None):
+        '''Free all the nodes from the server.'''
+        ids = self._live()
+        self._send(latency, [
+            ['/n_free', *ids[j:j + self._IDS_PER_MSG]]  # 11
+            for j in range(0, len(ids), self._IDS_PER_MSG)])
+        self._states[:] = bytes(len(self._states))
+
+    def __len__(self):
+        return len(self._node_ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            obj = type(self).__new__(type(self))
+            obj.server = self.server
+            obj._node_ids = self._node_ids[index]
+            obj._def_names = self._def_names
+            obj._def_index = self._def_index[index]
+            obj._states = self._states[index]
+            return obj
+        return Synth.basic_new(
+            self._def_names[self._def_index[index]],
+            self.server, self._node_ids[index])
+
+    def __iter__(self):
+        for i in range(len(self._node_ids)):
+            yield self[i]
+
+    def __repr__(self):
+        return f'{type(self).__name__}({len(self._node_ids)} nodes)'
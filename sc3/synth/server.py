@@ -544,8 +544,8 @@ class MetaServer(type):
 
             cls._node_alloc_class = eng.NodeIDAllocator
             # // cls._node_alloc_class = ReadableNodeIDAllocator;
-            cls._buffer_alloc_class = eng.ContiguousBlockAllocator
-            cls._bus_alloc_class = eng.ContiguousBlockAllocator
+            cls._buffer_alloc_class = eng.BestFitBlockAllocator
+            cls._bus_alloc_class = eng.BestFitBlockAllocator
 
             cls.default = cls('localhost', cls.DEFAULT_ADDRESS)
             # cls.internal = cls(
@@ -897,6 +897,10 @@ class Server(gpp.NodeParameter, metaclass=MetaServer):
 
         return self._node_allocator.alloc()
 
+    def _next_node_ids(self, count):
+        '''Return a range of ``count`` consecutive node IDs.'''
+        return self._node_allocator.alloc_many(count)
+
     # def next_perm_node_id(self):
     #     '''Next avaiable permanent (default) node ID.'''
     #     return self._node_allocator.alloc_perm()
@@ -987,6 +991,18 @@ class Server(gpp.NodeParameter, metaclass=MetaServer):
         else:
             yield from self.addr.sync(condition, latency, elements)
 
+    async def async_sync(self, latency=None, elements=None):
+        '''Wait for previous asynchronous commands to finish.
+
+        Coroutine version of ``sync`` to be awaited from an asyncio
+        event loop, as ``await s.async_sync()``. Parameters are the same
+        except for the condition.
+
+        '''
+
+        if _libsc3.main is not _libsc3.NrtMain:
+            await self.addr.async_sync(latency, elements)
+
     def bind(self):
         '''Return a BundleNetAddr context manager that collects generated
         messages into a bundle and send it to the server.
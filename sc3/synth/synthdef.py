@@ -4,6 +4,8 @@ import inspect
 import logging
 import io
 import pathlib
+import importlib.util
+import uuid
 from collections.abc import Container
 
 from ..base import classlibrary as clb
@@ -16,6 +18,7 @@ from . import ugen as ugn
 from . import server as srv
 from . import synthdesc as sdc
 from . import _fmtrw as frw
+from . import _defcache as dfc
 from . import node as nod
 from . import synthdef as sdf
 from .ugens import inout as iou
@@ -84,12 +87,27 @@ class SynthDef(metaclass=MetaSynthDef):
     metadata : dict
         An user defined JSON serializable dictionary to
         provide information about the synthesis definition.
+    cache : bool
+        If `True` the binary definition is loaded from, or saved to,
+        an on-disk cache keyed by a hash of ``func`` (code, defaults,
+        referenced globals and closures), the other parameters and the
+        library version. A cache hit doesn't build the UGen graph. The
+        source of referenced modules and classes that are not part of
+        the library is hashed. Definitions that reference one without
+        source, or values other than literals, their containers, enums
+        and numpy arrays, are built without cache. If `None` (default)
+        the value of ``SynthDef.cache_enabled`` is used.
 
     '''
 
     _SUFFIX = 'scsyndef'
     _RATE_NAMES = ('ar', 'kr', 'ir', 'tr')
 
+    cache_enabled = False
+    '''Default value of the ``cache`` parameter.'''
+    cache_max_size = 64 * 1024 ** 2
+    '''Cache size limit in bytes, least recently used entries are evicted.'''
+
     @classmethod
     def _dummy(cls, name):
         # Creates an empty object used by SynthDesc.
@@ -115,11 +133,12 @@ class SynthDef(metaclass=MetaSynthDef):
         obj._available = []
         obj._width_first_ugens = []
         obj._rewrite_in_progress = False
+        obj._consumers = None
 
         return obj
 
     def __init__(self, name, func, rates=None, prepend=None,
-                 variants=None, metadata=None):
+                 variants=None, metadata=None, *, cache=None):
         self._name = name
         self._func = None
         self._variants = variants or dict()
@@ -141,11 +160,87 @@ class SynthDef(metaclass=MetaSynthDef):
         self._available = []
         self._width_first_ugens = []
         self._rewrite_in_progress = False
+        self._consumers = None  # Reverse edges, only while optimizing.
 
         # callable interface
         # self._callable_args = None
 
+        if cache is None:
+            cache = type(self).cache_enabled
+        if cache:
+            key = dfc.make_key(name, func, rates, prepend, self._variants)
+            cache = key is not None
+        if cache:
+            data = dfc.load(key)
+            if data is not None:
+                self._init_from_bytes(
+                    data, list(inspect.signature(func).parameters.keys()),
+                    func)
+                return
         self._build(func, rates or [], prepend or [])
+        if cache:
+            dfc.store(key, self.as_bytes(), type(self).cache_max_size)
+
+    def _init_from_bytes(self, data, callable_args, func=None):
+        # The graph is not built, the object only has the binary
+        # definition. SynthDesc is created from it as for any definition.
+        self._constants = dict()
+        self._constant_set = set()
+        self._controls = []
+        self._max_local_bufs = None
+        self._consumers = None
+        self._callable_args = callable_args
+        self._func = func
+        self._bytes = data
+
+    @classmethod
+    def _from_build_result(cls, result, func=None):
+        name, data, callable_args, variants, metadata = result
+        obj = cls._dummy(name)
+        obj._variants = variants
+        obj._metadata = metadata
+        obj._init_from_bytes(data, callable_args, func)
+        return obj
+
+    @classmethod
+    def build_many(cls, defs, workers=None):
+        '''Build independent definitions in parallel worker processes.
+
+        Parameters
+        ----------
+        defs : list
+            A list of graph functions, named after their definition, or
+            tuples ``(name, func, kwargs)`` where ``kwargs`` is a dict
+            of SynthDef's keyword arguments. Functions are sent to the
+            workers by reference so they must be defined at module level.
+        workers : int
+            Number of worker processes, by default the number of CPUs.
+            If it is 1 the definitions are built in this process.
+
+        Returns
+        -------
+        A list of SynthDef objects, in the same order, that only contain
+        the binary definition (the graph is not rebuilt). They can be
+        added, sent or stored as any other definition.
+
+        '''
+
+        jobs = []
+        for item in defs:
+            if callable(item):
+                jobs.append((item.__name__, item, dict()))
+            else:
+                name, func, kwargs = item
+                jobs.append((name, func, kwargs or dict()))
+        results = _run_build_jobs(_build_worker, jobs, workers)
+        return [
+            cls._from_build_result(result, job[1])
+            for result, job in zip(results, jobs)]
+
+    @classmethod
+    def clear_cache(cls):
+        '''Remove all the definitions saved in the on-disk cache.'''
+        dfc.clear()
 
     def _build(self, func, rates, prepend):
         with _libsc3.main._def_build_lock:
@@ -452,11 +547,15 @@ class SynthDef(metaclass=MetaSynthDef):
 
     def _optimize_graph(self):  # ping
         self._init_topo_sort()
+        self._consumers = dict()
+        for ugen in self._children:
+            self._add_consumer(ugen)
 
         self._rewrite_in_progress = True
         for ugen in self._children[:]:
             ugen._optimize_graph()  # pong
         self._rewrite_in_progress = False
+        self._consumers = None
 
         # // Fixup removed ugens.
         old_size = len(self._children)
@@ -468,7 +567,9 @@ class SynthDef(metaclass=MetaSynthDef):
         self._available = []
         for ugen in self._children:
             ugen._antecedents = set()
-            ugen._descendants = set()
+            # Used as an ordered set, descendants are inserted in synth
+            # index order so _arrange doesn't need to sort them.
+            ugen._descendants = dict()
         for ugen in self._children:
             # // This populates the _descendants and _antecedents.
             ugen._init_topo_sort()  # pong
@@ -511,7 +612,7 @@ class SynthDef(metaclass=MetaSynthDef):
     def _cleanup_topo_sort(self):
         for ugen in self._children:
             ugen._antecedents = set()
-            ugen._descendants = set()
+            ugen._descendants = dict()
             ugen._width_first_antecedents = []
 
 
@@ -535,14 +636,22 @@ class SynthDef(metaclass=MetaSynthDef):
         b._descendants = a._descendants
         b._synth_index = a._synth_index
         self._children[a._synth_index] = b
-
-        for item in self._children:
-            if item is not None:
-                for i, input in enumerate(item.inputs):
-                    if input is a:
-                        aux = list(item.inputs)
-                        aux[i] = b
-                        item._inputs = tuple(aux)
+        self._add_consumer(b)
+
+        # Only the actual consumers of a, still in the graph, are visited.
+        b_consumers = self._consumers.setdefault(b, [])
+        for item, i in self._consumers.pop(a, ()):
+            if self._children[item._synth_index] is item\
+            and item.inputs[i] is a:
+                aux = list(item.inputs)
+                aux[i] = b
+                item._inputs = tuple(aux)
+                b_consumers.append((item, i))
+
+    def _add_consumer(self, ugen):
+        for i, input in enumerate(ugen.inputs):
+            if isinstance(input, ugn.UGen):
+                self._consumers.setdefault(input, []).append((ugen, i))
 
     def _add_constant(self, value):
         if value not in self._constant_set:
@@ -649,7 +758,7 @@ class SynthDef(metaclass=MetaSynthDef):
         try:
             # Should write if file doesn't exists or overwrite is True.
             with open(path, mode) as file:
-                self._write_def_list([self], file)
+                file.write(self.as_bytes())
             desc = sdc.SynthDesc.new_from(self)
             sdc.SynthDesc.populate_metadata_func(desc)
             desc.write_metadata(dir, md_plugin)
@@ -862,7 +971,7 @@ class SynthDef(metaclass=MetaSynthDef):
         path = dir / f'{self._name}.{self._SUFFIX}'
         if not self._metadata.get('reconstructed', False):
             with open(path, 'wb') as file:
-                self._write_def_list([self], file)
+                file.write(self.as_bytes())
             desc = sdc.SynthDesc.new_from(self)
             desc.metadata = self._metadata
             sdc.SynthDesc.populate_metadata_func(desc)
@@ -971,6 +1080,38 @@ class SynthDef(metaclass=MetaSynthDef):
             '/d_loadDir', dir, fn.value(completion_msg, server))
 
 
+### Parallel builds ###
+
+def _build_result(sdef):
+    return (
+        sdef.name, bytes(sdef.as_bytes()), sdef._callable_args,
+        sdef.variants, sdef.metadata)
+
+
+def _build_worker(name, func, kwargs):
+    return _build_result(SynthDef(name, func, **kwargs))
+
+
+def _build_module_worker(path):
+    # Import a module file and return the definitions created at
+    # module level (e.g. by the synthdef decorator).
+    spec = importlib.util.spec_from_file_location(
+        f'_sc3_build_{uuid.uuid4().hex}', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return [
+        _build_result(value) for value in vars(module).values()
+        if isinstance(value, SynthDef)]
+
+
+def _run_build_jobs(func, jobs, workers):
+    if workers == 1 or len(jobs) <= 1:
+        return [func(*job) for job in jobs]
+    import sc3
+    with sc3._nrt_pool(workers) as pool:
+        return pool.starmap(func, jobs)
+
+
 ### Decorator syntax ###
 
 def _create_synthdef(func, **kwargs):
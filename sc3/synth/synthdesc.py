@@ -465,3 +465,24 @@ class SynthDescLib(metaclass=MetaSynthDescLib):
         for desc in SynthDesc.read(path, keep_defs):
             self.add(desc)
             mdl.NotificationCenter.notify(self, 'sdesc_added', desc)
+
+    def build_directory(self, path, workers=None, pattern='*.py'):
+        '''Build the definitions of a directory of Python modules in
+        parallel worker processes and add their descriptions to the library.
+
+        Each module file matching ``pattern`` is imported in a worker and
+        the SynthDef objects at its module level are sent back as binary
+        definitions, the graphs are not rebuilt in this process. See
+        ``SynthDef.build_many``. Return the list of added SynthDesc.
+
+        '''
+
+        jobs = [(str(p),) for p in sorted(pathlib.Path(path).glob(pattern))]
+        results = sdf._run_build_jobs(sdf._build_module_worker, jobs, workers)
+        ret = []
+        for result in (r for lst in results for r in lst):
+            desc = SynthDesc.new_from(sdf.SynthDef._from_build_result(result))
+            self.add(desc)
+            mdl.NotificationCenter.notify(self, 'sdesc_added', desc)
+            ret.append(desc)
+        return ret
@@ -222,7 +222,7 @@ class SynthObject(gpp.UGenParameter, metaclass=MetaSynthObject):
 
         # Topo sort.
         obj._antecedents = None  # set()  # _init_topo_sort
-        obj._descendants = None  # set()  # _init_topo_sort
+        obj._descendants = None  # dict()  # _init_topo_sort, ordered set.
         obj._width_first_antecedents = None  # list()  # _width_first_ugens[:].
 
         return obj
@@ -488,10 +488,10 @@ class SynthObject(gpp.UGenParameter, metaclass=MetaSynthObject):
                 else:
                     ugen = input
                 self._antecedents.add(ugen)
-                ugen._descendants.add(self)
+                ugen._descendants[self] = None
         for ugen in self._width_first_antecedents:
             self._antecedents.add(ugen)
-            ugen._descendants.add(self)
+            ugen._descendants[self] = None
 
     def _make_available(self):
         if not self._antecedents:
@@ -502,9 +502,8 @@ class SynthObject(gpp.UGenParameter, metaclass=MetaSynthObject):
         self._make_available()
 
     def _arrange(self, out_stack):  # Was schedule.
-        descendants = list(self._descendants)
-        descendants.sort(key=lambda x: x._synth_index)
-        for ugen in reversed(descendants):
+        # Descendants are already in synth index order (_init_topo_sort).
+        for ugen in reversed(list(self._descendants)):
             ugen._remove_antecedent(self)
         out_stack.append(self)
 
@@ -516,7 +515,7 @@ class SynthObject(gpp.UGenParameter, metaclass=MetaSynthObject):
             # for input in self._antecedents:  # ?
             for input in self.inputs:
                 if isinstance(input, UGen) and input._descendants:
-                    input._descendants.remove(self)
+                    del input._descendants[self]
                     input._optimize_graph()
             self._synthdef._remove_ugen(self)
             return True
@@ -1255,9 +1254,9 @@ class BinaryOpUGen(BasicOpUGen):
                     input = input.source_ugen
                 if input._descendants is None:
                     return
-                input._descendants.add(replacement)
-                input._descendants.discard(self)
-                input._descendants.discard(deleted_unit)
+                input._descendants[replacement] = None
+                input._descendants.pop(self, None)
+                input._descendants.pop(deleted_unit, None)
 
     # def _constant_folding(self):  # Usage commented out in sclang.
     #     ...
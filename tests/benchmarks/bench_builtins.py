@@ -0,0 +1,34 @@
+'''Builtins over many values, scalar calls vs sequence arguments, values
+per second, run as:
+python tests/benchmarks/bench_builtins.py
+
+Sequences use the vectorized kernels if numpy is installed.'''
+
+import timeit
+
+import sc3
+sc3.init()
+
+from sc3.base import builtins as bi
+
+
+N = 100_000
+VALUES = [i * 0.001 for i in range(N)]
+
+
+def scalar_calls():
+    [bi.midicps(x) for x in VALUES]
+    [bi.lincurve(x, 0, 100, 0, 1) for x in VALUES]
+    [bi.wrap(x, 0, 12) for x in VALUES]
+
+
+def sequence_calls():
+    bi.midicps(VALUES)
+    bi.lincurve(VALUES, 0, 100, 0, 1)
+    bi.wrap(VALUES, 0, 12)
+
+
+if __name__ == '__main__':
+    for func in (scalar_calls, sequence_calls):
+        t = min(timeit.repeat(func, number=1, repeat=3))
+        print(f'{func.__name__}: {3 * N / t:,.0f} values/s')
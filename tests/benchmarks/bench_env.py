@@ -0,0 +1,33 @@
+'''Envelope evaluation point by point and in bulk, values per second,
+run as:
+python tests/benchmarks/bench_env.py
+
+Bulk sampling uses numpy if installed.'''
+
+import timeit
+
+import sc3
+sc3.init()
+
+from sc3.synth.envelope import Env
+
+
+N = 50_000
+ENV = Env(
+    [0, 1, 0.3, 0.8, 0.2, 0.6, 0] * 4, [0.1, 0.2, 0.3, 0.2, 0.1, 0.5] * 4 + [1] * 3,
+    ['lin', 'exp', 'sin', -4, 'wel', 'lin'])
+
+
+def at_points():
+    step = ENV.duration / (N - 1)
+    [ENV._at(i * step) for i in range(N)]
+
+
+def sample():
+    ENV.sample(N)
+
+
+if __name__ == '__main__':
+    for func in (at_points, sample):
+        t = min(timeit.repeat(func, number=1, repeat=3))
+        print(f'{func.__name__}: {N / t:,.0f} values/s')
@@ -0,0 +1,43 @@
+'''Memory used to keep many synth nodes as Synth objects and as a
+NodeSet, run as:
+python tests/benchmarks/bench_node_memory.py
+
+Messages are sent to the default server address, it doesn't need to be
+running.'''
+
+import tracemalloc
+
+import sc3
+sc3.init()
+
+from sc3.synth.server import s
+from sc3.synth.node import Group, Synth, NodeSet
+
+
+N = 100_000
+
+
+def synth_objects():
+    g = Group.basic_new(s, 1)
+    return Synth.new_many('default', {'freq': [440] * N}, g)
+
+
+def node_set():
+    g = Group.basic_new(s, 1)
+    return NodeSet.new('default', {'freq': [440] * N}, g)
+
+
+def measure(func):
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    nodes = func()
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del nodes
+    return size
+
+
+if __name__ == '__main__':
+    for func in (synth_objects, node_set):
+        size = measure(func)
+        print(f'{func.__name__}: {size / 2**20:.2f} MiB, {size / N:.0f} bytes/node')
@@ -0,0 +1,40 @@
+'''Synth creation one by one and in bulk, synths per second, run as:
+python tests/benchmarks/bench_node_new.py
+
+Messages are sent to the default server address, it doesn't need to be
+running.'''
+
+import timeit
+
+import sc3
+sc3.init()
+
+from sc3.synth.server import s
+from sc3.synth.node import Group, Synth
+
+
+N = 20_000
+
+
+def synth_init():
+    g = Group.basic_new(s, 1)
+    for i in range(N):
+        Synth('default', {'freq': 440 + i, 'amp': 0.1, 'pan': 0}, g)
+
+
+def new_many_rows():
+    g = Group.basic_new(s, 1)
+    args = [{'freq': 440 + i, 'amp': 0.1, 'pan': 0} for i in range(N)]
+    Synth.new_many('default', args, g)
+
+
+def new_many_columns():
+    g = Group.basic_new(s, 1)
+    args = {'freq': [440 + i for i in range(N)], 'amp': 0.1, 'pan': 0}
+    Synth.new_many('default', args, g)
+
+
+if __name__ == '__main__':
+    for func in (synth_init, new_many_rows, new_many_columns):
+        t = min(timeit.repeat(func, number=1, repeat=3))
+        print(f'{func.__name__}: {N / t:,.0f} synths/s')
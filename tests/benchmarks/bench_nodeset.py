@@ -0,0 +1,47 @@
+'''Node.set and parameter conversion calls per second, run as:
+python tests/benchmarks/bench_nodeset.py
+
+Messages are sent to the default server address, it doesn't need to be
+running.'''
+
+import timeit
+
+import sc3
+sc3.init()
+
+from sc3.synth.node import Synth
+from sc3.synth import _graphparam as gpp
+
+
+N = 20_000
+
+
+def node_set():
+    synth = Synth.basic_new('default', node_id=1000)
+    for i in range(N):
+        synth.set('freq', 440 + i, 'amp', 0.1, 'pan', 0, 'gate', 1)
+
+
+def node_set_array():
+    synth = Synth.basic_new('default', node_id=1000)
+    for i in range(N):
+        synth.set('freqs', [440, 550, 660, 770], 'amp', 0.1)
+
+
+def osc_arg_list():
+    args = ('freq', 440, 'amp', 0.1, 'pan', 0, 'gate', 1, 'out', 0)
+    for _ in range(N):
+        gpp.node_param(args)._as_osc_arg_list()
+
+
+def ugen_input():
+    args = [440, 0.5, 'scalar', [1, 2, 3]]
+    for _ in range(N):
+        gpp.ugen_param(args)._as_ugen_input()
+        gpp.ugen_param(args)._as_ugen_rate()
+
+
+if __name__ == '__main__':
+    for func in (node_set, node_set_array, osc_arg_list, ugen_input):
+        t = min(timeit.repeat(func, number=1, repeat=3))
+        print(f'{func.__name__}: {N / t:,.0f} calls/s')
@@ -0,0 +1,50 @@
+'''NodeWatcher /n_go and /n_end replies processed per second, run as:
+python tests/benchmarks/bench_nodewatcher.py
+
+The replies are sent by the library to itself, no server is needed.'''
+
+import time
+
+import sc3
+sc3.init()
+
+from sc3.base.main import main
+from sc3.base.netaddr import NetAddr
+from sc3.synth.server import Server
+from sc3.synth.node import Synth
+
+
+N = 2000
+OBSERVED = 20  # Nodes with on_free actions.
+
+
+def run(server):
+    synths = [Synth.basic_new('default', server) for _ in range(N)]
+    for synth in synths:
+        synth.register()
+    count = 0
+
+    def action():
+        nonlocal count
+        count += 1
+        if count == OBSERVED:
+            main.resume()
+
+    for synth in synths[-OBSERVED:]:
+        synth.on_free(action)
+    t0 = time.perf_counter()
+    server.addr.send_clumped_bundles(
+        None, *(['/n_go', x.node_id] for x in synths))
+    server.addr.send_clumped_bundles(
+        None, *(['/n_end', x.node_id] for x in synths))
+    main.wait(timeout=5)
+    t = time.perf_counter() - t0
+    print(f'{2 * N / t:,.0f} replies/s ({count} of {OBSERVED} actions)')
+
+
+if __name__ == '__main__':
+    server = Server('bench', NetAddr('127.0.0.1', NetAddr.lang_port()))
+    server._status_watcher._has_booted = True  # Fake running server.
+    server._status_watcher._notified = True
+    for _ in range(3):
+        run(server)
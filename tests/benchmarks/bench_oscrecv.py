@@ -0,0 +1,52 @@
+'''Incoming OSC messages per second, run as: python tests/benchmarks/bench_oscrecv.py'''
+
+import socket
+import time
+
+import sc3
+sc3.init()
+
+from sc3.base.main import main
+from sc3.base.netaddr import NetAddr
+from sc3.base.responders import OscFunc
+from sc3.base._oscinterface import OscInterface
+from sc3.base._osclib import encode_message, encode_bundle, IMMEDIATELY
+
+
+N_PACKETS = 500
+MSGS_PER_PACKET = 64
+
+
+def run(batch):
+    OscInterface.batch_dispatch = batch
+    total = N_PACKETS * MSGS_PER_PACKET
+    count = 0
+    last = None
+
+    def func(msg, *_):
+        nonlocal count, last
+        count += 1
+        last = time.perf_counter()
+        if count == total:
+            main.resume()
+
+    o = OscFunc(func, '/tr')
+    msg = encode_message('/tr', [1000, 0, 0.5])
+    dgram = encode_bundle(IMMEDIATELY, [msg] * MSGS_PER_PACKET).dgram
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    target = ('127.0.0.1', NetAddr.lang_port())
+    t0 = time.perf_counter()
+    for _ in range(N_PACKETS):
+        sock.sendto(dgram, target)
+        time.sleep(0.001)  # Don't overflow the socket's buffer.
+    main.wait(timeout=5)  # UDP packets may be lost.
+    o.free()
+    sock.close()
+    print(
+        f'batch_dispatch={batch}: {count / (last - t0):.0f} msgs/s '
+        f'({count} of {total} received)')
+
+
+if __name__ == '__main__':
+    run(False)
+    run(True)
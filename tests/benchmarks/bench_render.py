@@ -0,0 +1,55 @@
+'''Event pattern rendering, event by event and as columns, and adding
+the notes to an nrt score, events per second, run as:
+python tests/benchmarks/bench_render.py'''
+
+import timeit
+
+import sc3
+sc3.init('nrt')
+
+from sc3.base.main import main
+from sc3.base.stream import stream
+from sc3.synth.systemdefs import SystemDefs
+from sc3.seq import event as evt
+from sc3.seq.patterns.eventpatterns import Pbind, Pkey
+from sc3.seq.patterns.listpatterns import Pseq
+from sc3.seq.patterns.valuepatterns import Pseries, Pwhite
+
+
+SystemDefs.add_synthdef('default')
+N = 20_000
+PATTERN = Pbind({
+    'degree': Pseq([0, 2, 4, 5, 7, 9, 11, evt.Rest()], float('inf')),
+    'dur': Pseq([0.25, 0.125, 0.125], float('inf')),
+    'amp': Pwhite(0.05, 0.2),
+    'pan': Pseries(-1, 0.0001, N),
+    'legato': Pkey('dur') * 4})
+
+
+def pull_events():
+    s = stream(PATTERN)
+    for _ in range(N):
+        e = s.next(evt.event())
+        e._detuned_freq(), e('amp'), e('delta'), e('sustain')
+
+
+def render():
+    PATTERN.render(N)
+
+
+def play_nrt():
+    PATTERN.play()
+    main.process()
+    main.reset()
+
+
+def render_to_score():
+    PATTERN.render(N).to_score()
+    main.process()
+    main.reset()
+
+
+if __name__ == '__main__':
+    for func in (pull_events, render, play_nrt, render_to_score):
+        t = min(timeit.repeat(func, number=1, repeat=3))
+        print(f'{func.__name__}: {N / t:,.0f} events/s')
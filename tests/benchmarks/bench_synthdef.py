@@ -0,0 +1,41 @@
+'''SynthDef build time against UGen count, run as:
+python tests/benchmarks/bench_synthdef.py'''
+
+import timeit
+
+import sc3
+sc3.init()
+
+from sc3.synth.synthdef import SynthDef
+from sc3.synth.ugens.oscillators import SinOsc
+from sc3.synth.ugens.noise import WhiteNoise
+from sc3.synth.ugens.filter import LPF
+from sc3.synth.ugens.inout import Out
+from sc3.synth.ugens.mix import Mix
+
+
+SIZES = (64, 256, 1024, 4096)
+
+
+def mix_graph(n):
+    # Each voice is SinOsc * amp + offset (MulAdd) summed by Mix (Sum4),
+    # plus a neg to exercise the subtraction rewrites.
+    def graph(freq=440, amp=0.1):
+        voices = [
+            LPF.ar(SinOsc.ar(freq * (i + 1)) * amp + WhiteNoise.ar() * 0.01,
+                   1000 + i) - (-SinOsc.kr(i * 0.1))
+            for i in range(n // 8)]
+        Out.ar(0, Mix.new(voices))
+    return graph
+
+
+def build(n):
+    sd = SynthDef('bench', mix_graph(n))
+    return len(sd._children)
+
+
+if __name__ == '__main__':
+    for n in SIZES:
+        ugens = build(n)
+        t = min(timeit.repeat(lambda: build(n), number=1, repeat=3))
+        print(f'{ugens} ugens: {t:.3f} s')
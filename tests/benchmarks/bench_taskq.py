@@ -0,0 +1,38 @@
+'''Micro-benchmark for TaskQueue, run as: python tests/benchmarks/bench_taskq.py'''
+
+import random
+import timeit
+
+from sc3.base._taskq import TaskQueue
+
+
+N = 100_000
+
+
+def schedule_and_dispatch():
+    # Emulates a clock loop: peek before each pop and reschedule half of
+    # the tasks, with some lazy removals as done by TaskQueue.add updates.
+    q = TaskQueue()
+    rnd = random.Random(0)
+    for i in range(N):
+        q.add(rnd.random() * 100, i)
+    for i in range(0, N, 10):
+        q.remove(i)
+    while not q.empty():
+        time = q.peek()[0]
+        time, task = q.pop()
+        if task > 0 and task % 2:
+            q.add(time + 100 + rnd.random(), -task)
+
+
+def peek_largest():
+    q = TaskQueue()
+    for i in range(N):
+        q.add(float(i), i)
+        q.peek(False)
+
+
+if __name__ == '__main__':
+    for func in (schedule_and_dispatch, peek_largest):
+        t = min(timeit.repeat(func, number=1, repeat=3))
+        print(f'{func.__name__}: {t:.3f} s ({N} tasks)')
@@ -0,0 +1,135 @@
+
+import unittest
+import asyncio
+
+import sc3
+sc3.init()
+
+from sc3.base.main import main
+from sc3.base.netaddr import NetAddr
+from sc3.base.responders import OscFunc
+from sc3.base import aio
+from sc3.synth.server import Server
+from sc3.synth.buffer import Buffer
+from sc3.synth.bus import ControlBus
+
+
+class AioTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # A server at the library's own address, replies are sent by
+        # the responders below as scsynth would.
+        cls.server = Server('aio', NetAddr('127.0.0.1', NetAddr.lang_port()))
+        addr = cls.server.addr
+        cls.responders = [
+            OscFunc(lambda msg, *_: addr.send_msg('/synced', msg[1]), '/sync'),
+            OscFunc(
+                lambda msg, *_: addr.send_msg(
+                    '/b_setn', msg[1], msg[2], msg[3],
+                    *(float(i) for i in range(msg[3]))),
+                '/b_getn'),
+            OscFunc(
+                lambda msg, *_: addr.send_msg('/c_setn', msg[1], msg[2],
+                    *(float(msg[1] + i) for i in range(msg[2]))),
+                '/c_getn'),
+            OscFunc(lambda msg, *_: addr.send_msg('/c_set', msg[1], 0.5), '/c_get')]
+
+    @classmethod
+    def tearDownClass(cls):
+        for o in cls.responders:
+            o.free()
+
+    def run_async(self, coro):
+        # Without asyncio.run, new in Python 3.7.
+        async def main():
+            return await asyncio.wait_for(coro, 5)
+
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(main())
+        finally:
+            loop.close()
+
+    def test_requests(self):
+        server = self.server
+        buffer = Buffer(8, server=server)
+        bus = ControlBus(1, server)
+        bus2 = ControlBus(2, server)
+
+        async def requests():
+            return await asyncio.gather(
+                server.async_sync(),
+                server.async_sync(elements=[['/msg', i] for i in range(5000)]),
+                buffer.async_getn(0, 4),
+                bus.async_get(),
+                bus2.async_get())
+
+        results = self.run_async(requests())
+        self.assertEqual(results[2], [0.0, 1.0, 2.0, 3.0])
+        self.assertEqual(results[3], 0.5)
+        self.assertEqual(results[4], [bus2.index, bus2.index + 1.0])
+
+    def test_cancel(self):
+        async def request():
+            future = aio.osc_reply('/never')
+            try:
+                await asyncio.wait_for(future, 0.05)
+            except asyncio.TimeoutError:
+                pass
+            return future
+
+        before = len(OscFunc._all_func_proxies)
+        future = self.run_async(request())
+        self.assertTrue(future.cancelled())
+        self.assertEqual(len(OscFunc._all_func_proxies), before)
+
+    def test_udp_endpoint(self):
+        async def ping():
+            interface = await aio.open_udp_endpoint(57160, 10)
+            try:
+                addr = NetAddr('127.0.0.1', NetAddr.lang_port())
+                addr.change_output_port(interface.port)
+                replies = [
+                    aio.osc_reply('/ping', arg_template=[1]),
+                    aio.osc_reply(
+                        '/ping', arg_template=[2],
+                        transform=lambda msg: msg[1])]
+                with main._main_lock:
+                    addr.send_msg('/ping', 1)  # From the async endpoint.
+                    NetAddr('127.0.0.1', interface.port).send_msg('/ping', 2)
+                return await asyncio.gather(*replies)
+            finally:
+                interface.stop()
+
+        self.assertEqual(self.run_async(ping()), [['/ping', 1], 2])
+
+    def test_tcp_connection(self):
+        async def echo(reader, writer):
+            # Sent back in two parts to test the framing.
+            size = await reader.readexactly(4)
+            data = await reader.readexactly(int.from_bytes(size, 'big'))
+            writer.write(size + data[:6])
+            await writer.drain()
+            writer.write(data[6:])
+            await writer.drain()
+
+        async def ping():
+            server = await asyncio.start_server(echo, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            addr = NetAddr('127.0.0.1', port)
+            await addr.async_connect(57190)
+            try:
+                self.assertTrue(addr.is_connected)
+                reply = aio.osc_reply('/ping', transform=lambda msg: msg[1])
+                with main._main_lock:
+                    addr.send_msg('/ping', 3)
+                return await reply
+            finally:
+                addr.disconnect()
+                server.close()
+
+        self.assertEqual(self.run_async(ping()), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
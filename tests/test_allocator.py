@@ -0,0 +1,140 @@
+
+import unittest
+import random
+
+import sc3
+sc3.init()
+
+from sc3.synth._engine import (
+    ContiguousBlockAllocator, BestFitBlockAllocator, NodeIDAllocator)
+
+
+class BlockAllocatorTestCase(unittest.TestCase):
+    SIZE = 200
+    POS = 8
+
+    def check_state(self, allocator, used):
+        # Blocks must match the model, be within bounds and not overlap.
+        occupied = set()
+        for start, size in sorted(used.items()):
+            self.assertTrue(start >= allocator.pos)
+            self.assertTrue(start + size <= allocator.size + allocator.addr_offset)
+            span = set(range(start, start + size))
+            self.assertFalse(occupied & span)
+            occupied |= span
+        self.assertEqual(
+            sorted((b.start, b.size) for b in allocator.blocks()),
+            sorted(used.items()))
+        return occupied
+
+    def max_free_run(self, allocator, occupied):
+        best = run = 0
+        for i in range(allocator.pos, allocator.size + allocator.addr_offset):
+            run = 0 if i in occupied else run + 1
+            best = max(best, run)
+        return best
+
+    def random_ops(self, allocator, seed, ops=600, sizes=None):
+        rnd = random.Random(seed)
+        used = dict()
+        results = []
+        for _ in range(ops):
+            if rnd.random() < 0.55:
+                if sizes is None:
+                    n = rnd.choice([1, 1, 2, 4, 8, 16, rnd.randint(1, 40)])
+                else:
+                    n = rnd.choice(sizes)
+                occupied = self.check_state(allocator, used)
+                addr = allocator.alloc(n)
+                results.append(addr is not None)
+                if addr is None:
+                    if isinstance(allocator, BestFitBlockAllocator):
+                        self.assertLess(
+                            self.max_free_run(allocator, occupied), n)
+                else:
+                    used[addr] = n
+            elif used:
+                addr = rnd.choice(sorted(used))
+                del used[addr]
+                allocator.free(addr)
+                allocator.free(addr)  # Double free is ignored.
+        self.check_state(allocator, used)
+        for addr in used:
+            allocator.free(addr)
+        # Everything was merged back.
+        self.assertEqual(
+            allocator.alloc(allocator.size - allocator.pos + allocator.addr_offset),
+            allocator.pos)
+        return results
+
+    def test_random_against_contiguous(self):
+        for seed in range(10):
+            with self.subTest(seed=seed):
+                old = ContiguousBlockAllocator(self.SIZE, self.POS)
+                new = BestFitBlockAllocator(self.SIZE, self.POS)
+                self.random_ops(old, seed)
+                self.random_ops(new, seed)
+                # Without fragmentation both must succeed or fail alike.
+                old = ContiguousBlockAllocator(self.SIZE, self.POS)
+                new = BestFitBlockAllocator(self.SIZE, self.POS)
+                self.assertEqual(
+                    self.random_ops(old, seed, sizes=[1]),
+                    self.random_ops(new, seed, sizes=[1]))
+
+    def test_deterministic(self):
+        a = BestFitBlockAllocator(self.SIZE, self.POS, 1000)
+        b = BestFitBlockAllocator(self.SIZE, self.POS, 1000)
+        self.assertEqual(self.random_ops(a, 0), self.random_ops(b, 0))
+        self.assertEqual(
+            [a.alloc(n) for n in (4, 4)], [b.alloc(n) for n in (4, 4)])
+
+    def test_best_fit_and_reserve(self):
+        a = BestFitBlockAllocator(100, 0, 1000)
+        addrs = [a.alloc(10) for _ in range(6)]
+        self.assertEqual(addrs, list(range(1000, 1060, 10)))
+        a.free(1010)  # 10 free.
+        a.free(1030)
+        a.free(1040)  # 20 free, merged.
+        self.assertEqual(a.alloc(15), 1030)
+        self.assertEqual(a.alloc(5), 1045)
+        self.assertEqual(a.alloc(10), 1010)
+        self.assertIsNone(a.alloc(41))
+        self.assertEqual(a.alloc(40), 1060)
+
+        a = BestFitBlockAllocator(100, 0, 1000)
+        rnd = random.Random(0)
+        used = dict()
+        for _ in range(500):
+            addr = rnd.randint(1000, 1099)
+            size = rnd.randint(1, 8)
+            occupied = self.check_state(a, used)
+            free = addr + size <= 1100\
+                and not occupied & set(range(addr, addr + size))
+            block = a.reserve(addr, size, False)
+            self.assertEqual(block is not None, free)
+            if block is not None:
+                self.assertEqual((block.start, block.size), (addr, size))
+                used[addr] = size
+            if used and rnd.random() < 0.3:
+                addr = rnd.choice(sorted(used))
+                del used[addr]
+                a.free(addr)
+        self.check_state(a, used)
+
+
+class NodeIDAllocatorTestCase(unittest.TestCase):
+    def test_alloc_many(self):
+        allocator = NodeIDAllocator(1)
+        first = allocator.alloc()
+        ids = allocator.alloc_many(10)
+        self.assertEqual(list(ids), list(range(first + 1, first + 11)))
+        self.assertEqual(allocator.alloc(), first + 11)
+        allocator._temp = 0x03FFFFFF - 5
+        ids = allocator.alloc_many(10)  # Would wrap, starts over.
+        self.assertEqual(ids[0], 1000 | 1 << 26)
+        self.assertEqual(len(ids), 10)
+        self.assertEqual(allocator.alloc(), ids[-1] + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,21 @@
 
 import unittest
 import shutil
+import array
+import tempfile
+import pathlib
+import socket
+import threading
 
 import sc3
 sc3.init()
 
 from sc3.base.main import main
-from sc3.synth.server import s
-from sc3.synth.buffer import Buffer
+from sc3.base.netaddr import NetAddr
+from sc3.base._osclib import OscPacket, encode_message
+from sc3.synth.server import s, Server
+from sc3.synth.buffer import (
+    Buffer, _as_float_array, _write_wave_file, _read_wave_file)
 from sc3.synth.synthdef import synthdef
 from sc3.synth.ugens import PlayBuf, RecordBuf
 
@@ -123,5 +131,112 @@ class BufferTestCase(unittest.TestCase):
             b3.free()
 
 
+class FakeServer():
+    # Answers /b_getn, /b_setn and /sync, dropping the first request of
+    # each chunk index in drop.
+    def __init__(self, size, drop=()):
+        self.data = [0.0] * size
+        self.drop = set(drop)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.port = self.sock.getsockname()[1]
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while True:
+            dgram, addr = self.sock.recvfrom(65536)
+            msgs = [m.message for m in OscPacket(dgram).messages]
+            if msgs[0].address == '/quit':
+                break
+            index = msgs[0].params[1]
+            if index in self.drop:
+                self.drop.remove(index)
+                continue
+            for msg in msgs:
+                args = msg.params
+                if msg.address == '/b_getn':
+                    reply = self.data[args[1]:args[1]+args[2]]
+                    self.sock.sendto(encode_message(
+                        '/b_setn', [args[0], args[1], len(reply), *reply]
+                    ).dgram, addr)
+                elif msg.address == '/b_setn':
+                    self.data[args[1]:args[1]+args[2]] = args[3:]
+                elif msg.address == '/sync':
+                    self.sock.sendto(
+                        encode_message('/synced', [args[0]]).dgram, addr)
+
+    def quit(self):
+        self.sock.sendto(
+            encode_message('/quit').dgram, ('127.0.0.1', self.port))
+        self.thread.join()
+        self.sock.close()
+
+
+class BufferTransferTestCase(unittest.TestCase):
+    def test_windowed_transfer(self):
+        size = 10000
+        data = [float(i) for i in range(size)]
+        fake = FakeServer(size, drop=[1633 * 2, 1624 * 3])
+        server = Server('fake', NetAddr('127.0.0.1', fake.port))
+        buf = Buffer(size, 1, server, 0, alloc=False, cache=False)
+        result = None
+
+        def action(lst):
+            nonlocal result
+            result = lst
+            main.resume()
+
+        transfer = buf.send_list(data, window=4, timeout=0.1,
+                                 action=lambda: main.resume())
+        main.wait(timeout=5)
+        self.assertTrue(transfer.done)
+        self.assertEqual(transfer.retried, 1)
+        self.assertEqual(fake.data, data)
+        self.assertTrue(transfer.throughput > 0)
+
+        transfer = buf.get_to_list(action, window=4, timeout=0.1)
+        main.wait(timeout=5)
+        self.assertEqual(result, data)
+        self.assertEqual(transfer.retried, 1)
+
+        transfer = buf.get_to_list(
+            action, 100, 3000, timeout=0.1, as_array=True)
+        main.wait(timeout=5)
+        self.assertEqual(result, array.array('f', data[100:3100]))
+
+        with self.assertLogs('sc3.synth.buffer', 'WARNING'):
+            buf.get_to_list(action, 0, 10, 0.01)  # Deprecated wait.
+        main.wait(timeout=5)
+        self.assertEqual(result, data[:10])
+
+        fake.drop.update([500] * 4)
+        transfer = buf.get_to_list(action, 500, 1, timeout=0.05, retries=0)
+        main.wait(0.3)
+        self.assertTrue(transfer.failed)
+        fake.quit()
+
+
+class WaveFileTestCase(unittest.TestCase):
+    def test_wave_file_roundtrip(self):
+        data = [i / 64 for i in range(-64, 64)]
+        fdata = array.array('f', data)
+        cases = [
+            (data, data), (range(4), [0, 1, 2, 3]), (fdata, data),
+            (memoryview(fdata), data),
+            (memoryview(fdata).cast('B').cast('f', (64, 2)), data)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(pathlib.Path(tmp) / 'test.wav')
+            for i, (lst, expected) in enumerate(cases):
+                with self.subTest(case=i):
+                    arr = _as_float_array(lst)
+                    self.assertEqual(arr.tolist(), expected)
+                    _write_wave_file(path, arr, 2, 48000)
+                    result = _read_wave_file(path)
+                    self.assertIsInstance(result, array.array)
+                    self.assertEqual(result.tolist(), expected)
+        self.assertIs(_as_float_array(fdata), fdata)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,121 @@
+
+import unittest
+import array
+import math
+
+import sc3
+sc3.init()
+
+from sc3.base import builtins as bi
+from sc3.base import _hooks as hks
+
+
+np = hks.import_optional_module('numpy')
+has_numpy = not isinstance(np, hks.OptionalModuleProxy)
+
+
+INTS = [-13, -7, -6, -5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5, 6, 7, 12, 127, 128]
+FLOATS = [
+    -13.25, -7.0, -5.5, -3.0, -2.75, -1.0, -0.5, -0.0, 0.0, 0.1, 0.25, 0.5,
+    0.999, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.75, 10.3, 60.0, 69.0, 127.5]
+
+# name, arguments, exact (transcendental functions may differ in the ulp).
+CASES = [
+    ('midicps', (), False),
+    ('midiratio', (), False),
+    ('dbamp', (), False),
+    ('mod', (3,), True),
+    ('mod', (-3,), True),
+    ('mod', (2.5,), True),
+    ('mod', (0,), True),
+    ('wrap', (0, 3), True),
+    ('wrap', (-1.5, 2.5), True),
+    ('wrap', (1, 1), True),
+    ('wrap', (0, 3, 2), True),
+    ('fold', (0, 3), True),
+    ('fold', (-1.5, 2.5), True),
+    ('fold', (2, 2), True),
+    ('round', (), True),
+    ('round', (1,), True),
+    ('round', (0.25,), True),
+    ('round', (3,), True),
+    ('round', (-2,), True),
+    ('round', (0,), True),
+    ('clip', (0, 3), True),
+    ('clip', (-1.5, 2.5), True),
+    ('linlin', (0, 4, 10, 20), True),
+    ('linlin', (0, 4, 10, 20, 'min'), True),
+    ('linlin', (0, 4, 10, 20, 'max'), True),
+    ('linlin', (0, 4, 10, 20, None), True),
+    ('linlin', (1, 1, 0, 1), True),  # Mapped, division by zero.
+    ('lincurve', (0, 4, 10, 20), False),
+    ('lincurve', (0, 4, 10, 20, 3, 'max'), False),
+    ('lincurve', (0, 4, 10, 20, 0.0001), True),
+]
+
+
+class BuiltinsParityTestCase(unittest.TestCase):
+    def scalar(self, func, values, args):
+        results = []
+        for value in values:
+            try:
+                results.append(func(value, *args))
+            except ZeroDivisionError:
+                results.append(ZeroDivisionError)
+        return results
+
+    def assert_same(self, res, exp, exact, msg):
+        self.assertEqual(len(res), len(exp), msg)
+        for r, e in zip(res, exp):
+            if exact:
+                self.assertEqual(r, e, msg)
+            else:
+                self.assertTrue(math.isclose(r, e, rel_tol=1e-12), msg)
+
+    def check(self, values, make_seq):
+        seq = make_seq(values)
+        if not isinstance(seq, (list, tuple)):
+            values = seq.tolist()  # Element values as Python numbers.
+        for name, args, exact in CASES:
+            func = getattr(bi, name)
+            expected = self.scalar(func, values, args)
+            if ZeroDivisionError in expected:
+                self.assertRaises(ZeroDivisionError, func, make_seq(values), *args)
+                continue
+            msg = f'{name}{args} {type(make_seq(values)).__name__}'
+            result = func(make_seq(values), *args)
+            self.assert_same(list(result), expected, exact, msg)
+
+    def test_list(self):
+        self.check(INTS, list)
+        self.check(FLOATS, list)
+        self.check(INTS, tuple)
+        self.check(FLOATS + INTS, list)  # Mixed types are always mapped.
+
+    def test_array(self):
+        self.check(INTS, lambda v: array.array('i', v))
+        self.check(FLOATS, lambda v: array.array('d', v))
+        self.assertEqual(bi.clip(array.array('h', [1, 5]), 0, 3).typecode, 'h')
+        self.assertEqual(bi.midicps(array.array('h', [69])).typecode, 'd')
+
+    @unittest.skipUnless(has_numpy, 'numpy is not installed')
+    def test_numpy(self):
+        self.check(INTS, np.array)
+        self.check(FLOATS, np.array)
+        self.check(FLOATS, lambda v: np.array(v, np.float32))
+        result = bi.midicps(np.arange(128))
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(result.shape, (128,))
+        self.assertIsNotNone(bi.midicps.kernel)
+
+    def test_nested(self):
+        self.assertEqual(bi.mod([[5, 6], (7,)], 3), [[2, 0], [1]])
+        self.assertEqual(bi.clip([], 0, 1), [])
+
+    def test_lincurve_scalar(self):
+        self.assertTrue(math.isclose(
+            bi.lincurve(0.5, 0, 1, 0, 1, -4), 0.8807970779778823))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,7 +10,9 @@ sc3.init()
 from sc3.base.main import main
 from sc3.base.netaddr import NetAddr
 from sc3.base.responders import OscFunc
-from sc3.base._osclib import OscPacket
+from sc3.base._osclib import (
+    OscPacket, OscMessageBuilder, OscBundleBuilder, OscMessageBuildError,
+    encode_message, encode_bundle)
 from sc3.base.clock import SystemClock
 
 
@@ -53,6 +55,38 @@ class BundleTestCase(unittest.TestCase):
 
         o.free()
 
+    def test_encoder(self):
+        args = [
+            1, -2, 0.5, 'str', '', 'four', b'\x01\x02\x03',
+            bytearray(b'\x01\x02\x03\x04'), memoryview(b'\x05'),
+            True, False, (0, 144, 60, 100), [1, 'a', [0.25]]]
+        builder = OscMessageBuilder('/msg')
+        for arg in args:
+            builder.add_arg(arg)
+        expected = builder.build()
+        result = encode_message('/msg', args)
+        self.assertEqual(result.dgram, expected.dgram)
+        self.assertEqual(result.content.params, expected.params)
+        self.assertEqual(encode_message('/m').dgram, b'/m\x00\x00,\x00\x00\x00')
+
+        builder = OscBundleBuilder(1)
+        builder.add_content(expected)
+        builder.add_content(expected)
+        self.assertEqual(
+            encode_bundle(1, [result, expected]).dgram,
+            builder.build().dgram)
+
+        n = NetAddr('127.0.0.1', NetAddr.lang_port())
+        msg = n._osc_interface._build_msg(
+            0, ['/msg', 1, '[', 2, '[', 3, ']', ']', ['/x'], None])
+        self.assertEqual(
+            msg.content.params, [1, [2, [3]], b'/x\x00\x00,\x00\x00\x00', 0])
+        self.assertRaises(
+            ValueError, n._osc_interface._build_msg, 0, ['/msg', '[', 1])
+        self.assertRaises(
+            ValueError, n._osc_interface._build_msg, 0, ['/msg', 1, ']'])
+        self.assertRaises(OscMessageBuildError, encode_message, '/msg', [2**32])
+
     def test_calc_dgram_size(self):
         test_data = [0, ['/m1', 0.5], [1, ['/m2', 1]], ['/m3', 'string']]
         n = NetAddr('127.0.0.1', NetAddr.lang_port())
@@ -60,6 +94,14 @@ class BundleTestCase(unittest.TestCase):
             n._calc_bndl_dgram_size(test_data[1:]),
             len(n._osc_interface._build_bundle(0, test_data).dgram))
 
+    def test_clump_bundle(self):
+        n = NetAddr('127.0.0.1', NetAddr.lang_port())
+        elements = [['/n_free', i] for i in range(1000)]
+        clumps = n._clump_bundle(elements, 1024)
+        self.assertEqual(sum(clumps, []), elements)
+        for clump in clumps:
+            self.assertLess(n._calc_bndl_dgram_size(clump), 1024)
+
     @unittest.skipIf(sys.platform.startswith('darwin'), "OSX's UDP packet size is known to be shorter")
     def test_max_dgram_size(self):
         oscaddr = '/'
@@ -127,6 +169,30 @@ class BundleTestCase(unittest.TestCase):
         for o in funcs:
             o.free()
 
+    def test_packet_dispatch(self):
+        n = NetAddr('127.0.0.1', NetAddr.lang_port())
+        msgs = [['/msg', i] for i in range(64)]
+
+        for batch in (True, False):
+            with self.subTest(batch_dispatch=batch):
+                results = []
+
+                def func(msg, time, addr, *_):
+                    results.append((msg[1], time, addr))
+                    if len(results) == len(msgs):
+                        main.resume()
+
+                type(n._osc_interface).batch_dispatch = batch
+                o = OscFunc(func, '/msg')
+                n.send_bundle(0.5, *msgs[:32], [1, *msgs[32:]])
+                main.wait()
+                o.free()
+                self.assertEqual([r[0] for r in results], list(range(64)))
+                self.assertTrue(results[0][1] < results[32][1])
+                self.assertTrue(all(r[2] is results[0][2] for r in results))
+
+        type(n._osc_interface).batch_dispatch = True
+
     # FIXME: This shouldn't happen in Windows.
     @unittest.skipIf(sys.platform.startswith('win32'), "Windows fails the test, I can't check why")
     def test_bndl_msg_recv_time(self):
@@ -106,6 +106,62 @@ class ClockTestCase(unittest.TestCase):
                 self.assertTrue(math.isclose(l, b, abs_tol=1e-9))
         ofunc.free()
 
+    def test_shared_scheduler(self):
+        n = 20
+        results = [[] for _ in range(n)]
+        tempo_result = []
+
+        @routine
+        def test():
+            clocks = [TempoClock(10 + i, shared=True) for i in range(n)]
+            self.assertIs(clocks[0]._thread, clocks[-1]._thread)
+
+            def make_task(i):
+                def task():
+                    clock = clocks[i]
+                    results[i].append((clock.beats, clock.seconds))
+                    if len(results[i]) == 5:
+                        main.resume()
+                        return None
+                    return 1
+                return task
+
+            for i, clock in enumerate(clocks):
+                clock.sched_abs(1, make_task(i))
+
+            slow = TempoClock(100, shared=True)
+
+            @routine
+            def r():
+                yield 10
+                slow.tempo = 1000  # Updates the shared deadline.
+                tempo_result.append(slow.beats)
+                yield 100
+                tempo_result.append(slow.beats)
+                main.resume()
+
+            r.play(slow)
+            clocks.append(slow)
+            main.resume()
+            yield 1.0
+            for clock in clocks:
+                clock.stop()
+
+        test.play()
+        main.wait(tasks=n + 2)
+        for i, res in enumerate(results):
+            with self.subTest(clock=i):
+                for (b, _), beat in zip(res, [1, 2, 3, 4, 5]):
+                    self.assertTrue(math.isclose(b, beat))
+                dt = 1 / (10 + i)
+                for (_, s1), (_, s2) in zip(res, res[1:]):
+                    self.assertTrue(math.isclose(s2 - s1, dt))
+        self.assertTrue(math.isclose(tempo_result[1] - tempo_result[0], 100))
+        metrics = TempoClock.shared_metrics(reset=True)
+        self.assertTrue(metrics['wakeups'] >= n * 5)
+        self.assertTrue(0 <= metrics['mean_jitter'] <= metrics['max_jitter'])
+        self.assertEqual(TempoClock.shared_metrics()['wakeups'], 0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,51 @@
+
+import unittest
+import array
+import math
+
+import sc3
+sc3.init()
+
+from sc3.synth.envelope import Env
+
+
+class EnvTestCase(unittest.TestCase):
+    def test_at(self):
+        env = Env([0, 1, 0.5, 0.5], [1, 0, 2], ['lin', 'step', 'exp'])
+        self.assertEqual(env._at(-1), 0.0)
+        self.assertEqual(env._at(0.25), 0.25)
+        self.assertEqual(env._at(1), 0.5)  # Zero duration stage skipped.
+        self.assertEqual(env._at(2), 0.5)
+        self.assertEqual(env._at(10), 0.5)
+        env = Env([0, 1], [2], 'sin')
+        self.assertTrue(math.isclose(env._at(1), 0.5))
+        env = Env([1, 2], [1], 4, offset=0.5)
+        self.assertEqual(env._at(0.5), 1.0)
+        self.assertTrue(math.isclose(
+            env._at(1), 1 + (1 - math.exp(2)) / (1 - math.exp(4))))
+
+    def test_sample(self):
+        curves = ['lin', 'exp', 'sin', 'wel', 'sqrt', 'cub', 'hold', -3]
+        env = Env([0.1, 1, 0.2, 0.8, 0.3, 0.9, 0.4, 0.7, 0.5], [0.5] * 8,
+                  curves, offset=0.25)
+        values = env.sample(101)
+        self.assertIsInstance(values, array.array)
+        self.assertEqual(values.typecode, 'd')
+        for i, value in enumerate(values):
+            self.assertTrue(math.isclose(
+                value, env._at(i * env.duration / 100), rel_tol=1e-12))
+        self.assertEqual(list(env.sample(3, 10)), [env._at(t) for t in (0, 5, 10)])
+        self.assertEqual(list(env.sample(1)), [0.1])
+
+    def test_multichannel(self):
+        env = Env([0, [1, 2], 0], [1, 1])
+        signal = env.as_signal(5)
+        self.assertEqual(len(signal), 2)
+        self.assertEqual(signal[0].typecode, 'f')
+        self.assertEqual(list(signal[0]), [0, 0.5, 1, 0.5, 0])
+        self.assertEqual(list(signal[1]), [0, 1, 2, 1, 0])
+        self.assertEqual(env._at(0.5), [0.5, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
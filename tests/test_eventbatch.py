@@ -0,0 +1,117 @@
+
+import unittest
+
+import sc3
+sc3.init('nrt')
+
+from sc3.base.main import main
+from sc3.base.stream import stream, StopStream
+from sc3.synth.systemdefs import SystemDefs
+from sc3.seq import event as evt
+from sc3.seq.patterns.eventpatterns import Pbind, Pmono, Ppar, Pkey
+from sc3.seq.patterns.listpatterns import Pseq, Pser
+from sc3.seq.patterns.valuepatterns import Pseries, Pgeom, Pwhite
+
+
+def pull(p, n):
+    # Events and computed keys of the event stream.
+    ret = []
+    s = stream(p)
+    try:
+        while len(ret) < n:
+            e = s.next(evt.event())
+            ret.append((
+                e._detuned_freq(), e('amp'), float(e('delta')),
+                float(e('sustain')), evt.is_rest(e)))
+    except StopStream:
+        pass
+    return ret
+
+
+class EventBatchTestCase(unittest.TestCase):
+    def assert_batch(self, p, n):
+        events = pull(p, n)
+        batch = p.render(n)
+        self.assertEqual(len(batch), len(events))
+        onset = 0.0
+        for i, (freq, amp, delta, sustain, rest) in enumerate(events):
+            self.assertAlmostEqual(batch['freq'][i], freq)
+            self.assertAlmostEqual(batch['amp'][i], amp)
+            self.assertAlmostEqual(batch['delta'][i], delta)
+            self.assertAlmostEqual(batch['sustain'][i], sustain)
+            self.assertAlmostEqual(batch['onset'][i], onset)
+            self.assertEqual(batch.rests[i], rest)
+            onset += delta
+
+    def test_columns(self):
+        patterns = [
+            Pbind({
+                'degree': Pseq([0, 2, evt.Rest(), 4], 3),
+                'dur': Pseq([0.5, 0.25], float('inf')),
+                'db': Pseries(-20, -1),
+                'pan': Pkey('db') * 0.01}),
+            Pbind({
+                'midinote': Pser([60, 62.5], 9),
+                'ctranspose': Pgeom(1, 1.5),
+                'velocity': 64,
+                'stretch': 0.5}),
+            Pbind({
+                'freq': Pseq([Pseq([220, 330]), 440], 2),
+                'harmonic': 2, 'detune': 1.5, 'legato': 0.5}),
+            Pbind({
+                ('degree', 'dur'): Pseq([(1, 0.5), (3, 0.25)], 2),
+                'octave': 4, 'mtranspose': 1}),
+            Pbind({'note': Pseries(0, 3), 'root': 2, 'amp': 0.3}),
+            Ppar(
+                Pbind({'degree': Pseq(range(5)), 'dur': 1}),
+                Pbind({'degree': Pseq(range(5)), 'dur': 0.75}))]
+        for p in patterns:
+            for n in (0, 1, 5, 50):
+                with self.subTest(pattern=p, n=n):
+                    self.assert_batch(p, n)
+
+    def test_duration(self):
+        p = Pbind({
+            'degree': Pseries(),
+            'dur': Pseq([1, 0.5], float('inf')),
+            'amp': Pwhite(0.1, 0.2)})
+        batch = p.render(duration=6)
+        self.assertEqual(len(batch), 8)
+        self.assertEqual(list(batch['degree']), list(range(8)))
+        self.assertEqual(batch.duration, 6)
+        self.assertEqual(len(p.render(5, 6)), 5)
+        self.assertTrue(all(0.1 <= a <= 0.2 for a in batch['amp']))
+        p = Pbind({'degree': Pseries(), 'delta': Pkey('degree') + 1})
+        self.assertEqual(list(p.render(duration=10)['onset']), [0, 1, 3, 6])
+        self.assertEqual(len(p.render(duration=10)), 4)
+
+    def test_errors(self):
+        self.assertRaises(ValueError, Pseq([1, 2]).render, 2)
+        self.assertRaises(ValueError, Pbind({'degree': 1}).render)
+        self.assertRaises(ValueError, Pmono('default', {}).render, 2)
+
+    def test_to_score(self):
+        SystemDefs.add_synthdef('default')
+        p = Pbind({
+            'degree': Pseq([0, 2, evt.Rest(), 4]),
+            'dur': Pseq([0.5, 0.25], 2),
+            'amp': Pseries(0.1, 0.1)})
+
+        def messages(score):
+            # Node ids differ between scores.
+            return [
+                (round(t, 9), m[:2] + m[3:] if m[0] == '/s_new' else m[2:])
+                for t, m in score.list if m[0] in ('/s_new', '/n_set')]
+
+        p.play()
+        played = messages(main.process())
+        main.reset()
+        p.render(10).to_score()
+        rendered = messages(main.process())
+        main.reset()
+        self.assertEqual(len(played), 6)
+        self.assertEqual(rendered, played)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+
+import unittest
+
+import sc3
+sc3.init('nrt')
+
+from sc3.base.main import main
+from sc3.base.clock import TempoClock
+from sc3.base.stream import routine
+from sc3.synth.server import Server
+from sc3.synth.systemdefs import SystemDefs
+from sc3.seq.patterns.eventpatterns import Pbind
+from sc3.seq.patterns.listpatterns import Pseq
+
+
+class LookaheadTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        SystemDefs.add_synthdef('default')
+        cls.latency = Server.default.latency
+        Server.default.latency = 0.2
+
+    @classmethod
+    def tearDownClass(cls):
+        Server.default.latency = cls.latency
+
+    def render(self, lookahead, action=None, at=None):
+        # Onset and freq of the notes played at tempo 2.
+        p = Pbind({'degree': Pseq(range(8)), 'dur': 0.5})
+        players = []
+
+        @routine
+        def test():
+            clock = TempoClock(2)
+            players.append(p.play(clock, lookahead=lookahead))
+            if action is not None:
+                clock.sched(at, lambda: action(clock, players[0]))
+
+        test.play()
+        score = main.process()
+        main.reset()
+        notes = [
+            (round(t, 9), m[6]) for t, m in score.list if m[0] == '/s_new']
+        return notes, players[0]
+
+    def test_times(self):
+        notes, player = self.render(None)
+        self.assertEqual(len(notes), 8)
+        self.assertEqual(notes[1][0], 0.45)
+        for lookahead in (0.1, 0.2, 1):
+            with self.subTest(lookahead=lookahead):
+                ahead, player = self.render(lookahead)
+                self.assertEqual(ahead, notes)
+                self.assertEqual(player.dry_count, 0)
+
+    def test_stop(self):
+        def stop(clock, player):
+            player.stop()
+
+        notes, _ = self.render(None, stop, 1.9)
+        self.assertEqual(len(notes), 4)
+        notes, _ = self.render(0.1, stop, 1.9)  # Event at 2 was sent.
+        self.assertEqual(len(notes), 5)
+
+    def test_mute(self):
+        def mute(clock, player):
+            player.mute()
+
+        notes, _ = self.render(None, mute, 2.4)
+        self.assertEqual(len(notes), 5)
+        notes, _ = self.render(0.1, mute, 2.4)  # Event at 2.5 was sent.
+        self.assertEqual(len(notes), 6)
+
+    def test_pause(self):
+        def pause(clock, player):
+            player.pause()
+            clock.sched(2.1, lambda: player.resume())  # At beat 4.
+
+        notes, _ = self.render(None, pause, 1.9)
+        ahead, _ = self.render(0.1, pause, 1.9)
+        self.assertEqual([t for t, _ in notes[4:]], [2.2, 2.45, 2.7, 2.95])
+        # Event at 2 was sent, next events resume on time.
+        self.assertEqual(ahead[4][0], 1.2)
+        self.assertEqual([t for t, _ in ahead[5:]], [2.2, 2.45, 2.7])
+
+    def test_tempo(self):
+        def tempo(clock, player):
+            clock.tempo = 4
+
+        notes, _ = self.render(0.1, tempo, 1.9)
+        self.assertEqual(len(notes), 8)
+        self.assertEqual(notes[4][0], 1.2)  # Sent before the change.
+        # In nrt the clock doesn't reschedule the wake pending at
+        # the change, next events are on time from the new tempo.
+        self.assertEqual([t for t, _ in notes[6:]], [1.425, 1.55])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+
+import unittest
+
+import sc3
+sc3.init()
+
+from sc3.base.responders import MidiFunc, MidiMessageDispatcher
+from sc3.base._midiinterface import (
+    MidiData, MidiRtInterface, decode_message, _InputQueue, _logger)
+
+
+class _Port():
+    _name = 'port'
+
+
+class _Queue(list):
+    put = list.append
+
+
+class _Rt():
+    def __init__(self):
+        self.callback = None
+
+    def set_callback(self, func):
+        self.callback = func
+
+    def cancel_callback(self):
+        self.callback = None
+
+
+class _RtPort():
+    # Port of mido's rtmidi backend.
+    def __init__(self):
+        self._rt = _Rt()
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _CallbackPort(_RtPort):
+    # Port of a backend with mido's public callback.
+    def __init__(self):
+        self._callback = None
+        self.closed = False
+
+    @property
+    def callback(self):
+        return self._callback
+
+    @callback.setter
+    def callback(self, func):
+        self._callback = func
+
+
+class _Message():
+    def bytes(self):
+        return [0x90, 60, 100]
+
+
+class MidiFuncTestCase(unittest.TestCase):
+    def test_decode(self):
+        msg = decode_message([0x91, 60, 100], 1.5)
+        self.assertEqual(
+            dict(msg),
+            {'type': 'note_on', 'channel': 1, 'note': 60,
+             'velocity': 100, 'time': 1.5})
+        self.assertEqual(msg.note, 60)
+        self.assertEqual(msg.number, 60)
+        msg = decode_message([0xE0, 0, 64])
+        self.assertEqual((msg.type, msg.pitch, msg.number), ('pitchwheel', 0, None))
+        msg = decode_message([0xF0, 1, 2, 0xF7])
+        self.assertEqual(msg['data'], (1, 2))
+        self.assertIsNone(msg.channel)
+        self.assertEqual(decode_message([0xF8]).type, 'clock')
+        self.assertIsNone(decode_message([0x40]))
+        self.assertRaises(KeyError, lambda: msg['note'])
+
+    def test_input_callbacks(self):
+        iface = MidiRtInterface()
+        queue = _Queue()
+        rt_port = _RtPort()
+        self.assertTrue(iface._set_callback(rt_port, queue))
+        rt_port._rt.callback(([0x80, 60, 0], 0.0), None)
+        port = _CallbackPort()  # Without _rt, fallback.
+        self.assertTrue(iface._set_callback(port, queue))
+        port.callback(_Message())
+        self.assertEqual(queue, [[0x80, 60, 0], [0x90, 60, 100]])
+        self.assertFalse(iface._set_callback(_Port(), queue))  # Thread.
+        iface._input_ports.update(a=rt_port, b=port)
+        iface.close_input_port('a', rt_port)
+        iface.close_input_port('b', port)
+        self.assertIsNone(rt_port._rt.callback)
+        self.assertIsNone(port.callback)
+        self.assertTrue(port.closed)
+
+    def test_dispatch(self):
+        dispatcher = MidiMessageDispatcher()
+        port = _Port()
+        received = []
+        funcs = [
+            MidiFunc(
+                lambda msg: received.append(('all', msg.note)),
+                'note_on', dispatcher=dispatcher),
+            MidiFunc(
+                lambda msg, midi_in: received.append(('ch', msg.note)),
+                'note_on', arg_template={'channel': 1}, dispatcher=dispatcher),
+            MidiFunc(
+                lambda msg: received.append(('num', msg.note)),
+                ['note_on', 'note_off'], arg_template={'note': 60},
+                dispatcher=dispatcher),
+            MidiFunc(
+                lambda msg: received.append(('vel', msg.note)),
+                'note_on', arg_template={
+                    'channel': 1, 'note': 60, 'velocity': lambda v: v > 64},
+                dispatcher=dispatcher),
+            MidiFunc(
+                lambda msg: received.append(('cc', msg.value)),
+                'control_change', arg_template={'control': 7},
+                dispatcher=dispatcher)]
+        self.assertIn(('note_on', 1, 60), dispatcher.active)
+        self.assertIn(('note_off', None, 60), dispatcher.active)
+        for data in ([0x90, 61, 10], [0x91, 60, 100], [0x81, 60, 0],
+                     [0xB0, 7, 5], [0xB0, 8, 5]):
+            dispatcher(decode_message(data), port)
+        self.assertEqual(sorted(received), sorted([
+            ('all', 61), ('all', 60), ('ch', 60), ('num', 60),
+            ('vel', 60), ('num', 60), ('cc', 5)]))
+        for func in funcs:
+            func.free()
+        self.assertEqual(dispatcher.active, {})
+
+    def test_dispatch_errors(self):
+        iface = MidiRtInterface()
+        received = []
+
+        def fail(msg, midi_in):
+            if msg.note == 60:
+                raise ValueError(msg)
+
+        iface.add_recv_func(fail)
+        iface.add_recv_func(lambda msg, _: received.append(msg))
+        queue = _InputQueue(iface, 'port')
+        messages = [decode_message([0x90, n, 100]) for n in (59, 60, 61)]
+        queue._pending = messages
+        with self.assertLogs(_logger, 'ERROR') as logs:
+            queue._drain()
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(received, messages)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+
+import unittest
+import threading
+
+import sc3
+sc3.init()
+
+from sc3.base.main import main
+from sc3.base._midiinterface import _OutputQueue
+
+
+class _Port():
+    def __init__(self):
+        self.closed = False
+        self.sent = []
+        self.done = threading.Event()
+
+    def send(self, message):
+        self.sent.append((main.elapsed_time(), message))
+        if message == 'last':
+            self.done.set()
+
+
+class _Message():
+    def __init__(self, type, velocity=64):
+        self.type = type
+        self.velocity = velocity
+
+
+class MidiOutputQueueTestCase(unittest.TestCase):
+    def test_order(self):
+        queue = _OutputQueue()
+        port = _Port()
+        closed = _Port()
+        closed.closed = True
+        now = main.elapsed_time()
+        queue.add([
+            (now + 0.05, port, 'last'),
+            (now + 0.02, port, 'off'),
+            (now, port, 'on'),
+            (now + 0.02, port, 'on2'),
+            (now, closed, 'lost')])
+        self.assertTrue(port.done.wait(2))
+        queue.stop()
+        self.assertEqual(
+            [m for _, m in port.sent], ['on', 'off', 'on2', 'last'])
+        self.assertEqual(closed.sent, [])
+        for (t, _), delta in zip(port.sent, (0, 0.02, 0.02, 0.05)):
+            self.assertGreaterEqual(t, now + delta)
+
+    def test_stop(self):
+        queue = _OutputQueue()
+        port = _Port()
+        queue.add([(main.elapsed_time() + 10, port, 'never')])
+        queue.stop()
+        self.assertIsNone(queue._thread)
+        self.assertEqual(port.sent, [])
+
+    def test_stop_note_offs(self):
+        queue = _OutputQueue()
+        port = _Port()
+        closed = _Port()
+        closed.closed = True
+        messages = [
+            _Message('note_on'), _Message('note_off'),
+            _Message('control_change'), _Message('note_on', 0)]
+        later = main.elapsed_time() + 10
+        queue.add([(later + i, port, m) for i, m in enumerate(messages)])
+        queue.add([(later, closed, messages[1])])
+        queue.stop()
+        self.assertEqual([m for _, m in port.sent], messages[1::2])
+        self.assertEqual(closed.sent, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,10 +6,20 @@ import sc3
 sc3.init()
 
 from sc3.base.main import main
-from sc3.synth.server import s
-from sc3.synth.node import Group, Synth
+from sc3.base.netaddr import NetAddr, BundleNetAddr
+from sc3.base.responders import OscFunc
+from sc3.synth.server import s, Server
+from sc3.synth.node import Group, Synth, NodeSet
 from sc3.synth.synthdef import synthdef
 from sc3.synth.ugens import Out, SinOsc
+from sc3.synth import _graphparam as gpp
+
+
+def lang_server():
+    # A server at the library's own address, it receives what it sends.
+    if 'lang' not in Server.named:
+        Server('lang', NetAddr('127.0.0.1', NetAddr.lang_port()))
+    return Server.named['lang']
 
 
 @unittest.skipIf(not shutil.which(s.options.program), 'no server available')
@@ -137,5 +147,192 @@ class NodeTestCase(unittest.TestCase):
         # s.free_nodes()
 
 
+
+class GraphParameterTestCase(unittest.TestCase):
+    def test_node_param(self):
+        args = (
+            'freq', 440, 'amp', [0.1, [0.2]], 'd', {'a': 1},
+            'b', True, 'n', None, 'bus', (2, 3))
+        self.assertEqual(
+            gpp.node_param(args)._as_osc_arg_list(),
+            ['freq', 440, 'amp', '[', 0.1, '[', 0.2, ']', ']', 'd',
+             '[', 'a', 1, ']', 'b', True, 'n', None, 'bus', '[', 2, 3, ']'])
+        self.assertEqual(
+            gpp.node_param(args)._as_control_input(),
+            ('freq', 440, 'amp', [0.1, [0.2]], 'd', ['a', 1],
+             'b', True, 'n', None, 'bus', (2, 3)))
+        self.assertIsInstance(gpp.node_param(1.0), gpp.NodeScalar)
+        self.assertIsInstance(gpp.ugen_param(True), gpp.UGenScalar)
+        self.assertEqual(gpp.ugen_param([1, 'a', (2,)])._as_ugen_rate(), 'scalar')
+
+        class Custom():
+            pass
+
+        self.assertRaises(TypeError, gpp.node_param, Custom())
+        self.assertIn(float, gpp._node_param_types)
+
+        class NodeCustom(gpp.NodeParameter):
+            @classmethod
+            def _param_type(cls):
+                return (Custom,)
+
+        self.assertEqual(gpp._node_param_types, {})
+        self.assertIsInstance(gpp.node_param(Custom()), NodeCustom)
+
+
+class NewManyTestCase(unittest.TestCase):
+    def test_bundle_content(self):
+        g = Group.basic_new(s, 1)
+        with BundleNetAddr(s, send=False) as addr:
+            synths = Synth.new_many(
+                'default', {'freq': [440, 550, 660], 'amp': 0.1}, g)
+            ids = [x.node_id for x in synths]
+            self.assertEqual(ids, list(range(ids[0], ids[0] + 3)))
+            self.assertTrue(all(x.group is g for x in synths))
+            self.assertEqual(addr.get_bundle()[1:], [
+                ['/s_new', 'default', i, 0, 1, 'freq', f, 'amp', 0.1]
+                for i, f in zip(ids, [440, 550, 660])])
+        with BundleNetAddr(s, send=False) as addr:
+            synths = g.spawn_many(
+                'default', [{'freq': 440}, ['freq', [1, 2]], None])
+            self.assertEqual(
+                [m[5:] for m in addr.get_bundle()[1:]],
+                [['freq', 440], ['freq', '[', 1, 2, ']'], []])
+            self.assertEqual(addr.get_bundle()[1][3], 1)  # addToTail
+        self.assertEqual(Synth.new_many('default', [], g), [])
+        self.assertRaises(
+            ValueError, Synth.new_many, 'default', {'a': [1], 'b': [1, 2]}, g)
+        self.assertRaises(
+            ValueError, Synth.new_many, 'default', {'a': 1}, g)
+        self.assertRaises(
+            ValueError, Synth.new_many, 'default', [{}, {}], g, 'addReplace')
+
+    def test_clumped_send(self):
+        n = 3000
+        server = lang_server()
+        bundles = 0
+        send_bundle = server.addr.send_bundle
+
+        def count_bundles(time, *elements):
+            nonlocal bundles
+            bundles += 1
+            send_bundle(time, *elements)
+
+        server.addr.send_bundle = count_bundles
+        received = []
+
+        def func(msg, *_):
+            received.append(msg[2])
+            if len(received) == n:
+                main.resume()
+
+        o = OscFunc(func, '/s_new')
+        synths = Synth.new_many(
+            'default', {'freq': [float(i) for i in range(n)]},
+            server.default_group)
+        main.wait()
+        o.free()
+        self.assertEqual(sorted(received), [x.node_id for x in synths])
+        self.assertTrue(1 < bundles < n // 100)
+        self.assertEqual(server._next_node_id(), synths[-1].node_id + 1)
+
+
+class NodeSetTestCase(unittest.TestCase):
+    def test_node_set(self):
+        g = Group.basic_new(s, 1)
+        with BundleNetAddr(s, send=False) as addr:
+            ns = NodeSet.new('default', {'freq': [440, 550, 660]}, g)
+            self.assertEqual(len(addr.get_bundle()[1:]), 3)
+        ids = list(ns.node_ids)
+        self.assertEqual(ids, list(range(ids[0], ids[0] + 3)))
+        self.assertEqual([x.node_id for x in ns], ids)
+        self.assertEqual(ns[1].def_name, 'default')
+
+        with BundleNetAddr(s, send=False) as addr:
+            ns.set('amp', 0.1)
+            ns.set_many({'freq': [1, 2, 3]})
+            ns.map('freq', 4)
+            self.assertEqual(addr.get_bundle()[1:], [
+                *(['/n_set', i, 'amp', 0.1] for i in ids),
+                *(['/n_set', i, 'freq', f] for i, f in zip(ids, [1, 2, 3])),
+                *(['/n_map', i, 'freq', 4] for i in ids)])
+        self.assertRaises(ValueError, ns.set_many, [{}, {}])
+
+        with BundleNetAddr(s, send=False) as addr:
+            ns[:1].free()
+            ns = ns[1:]
+            ns.run(False)
+            ns.release(1)
+            ns.free()
+            ns.free()
+            self.assertEqual(addr.get_bundle()[1:], [
+                ['/n_free', ids[0]], ['/n_run', ids[1], 0, ids[2], 0],
+                *(['/n_set', i, 'gate', -2] for i in ids[1:]),
+                ['/n_free', *ids[1:]]])
+        self.assertFalse(ns.is_running(1))
+        self.assertFalse(ns.is_playing(1))
+
+        synths = [Synth.basic_new(n, s) for n in ('a', 'b', 'a')]
+        ns = NodeSet.from_nodes(synths)
+        self.assertEqual([x.def_name for x in ns], ['a', 'b', 'a'])
+        self.assertEqual(ns._def_names, ['a', 'b'])
+        with BundleNetAddr(s, send=False) as addr:
+            NodeSet(range(1000, 1000 + 2500), 'x', s).free()
+            self.assertEqual(
+                [len(m) - 1 for m in addr.get_bundle()[1:]], [1024, 1024, 452])
+
+
+class NodeWatcherTestCase(unittest.TestCase):
+    def test_replies(self):
+        server = lang_server()
+        server._status_watcher._has_booted = True  # Fake running server.
+        server._status_watcher._notified = True
+        synths = [Synth.basic_new('default', server) for _ in range(1000)]
+        for synth in synths:
+            synth.register()
+        freed = []
+
+        def action(node):
+            freed.append(node)
+            main.resume()
+
+        synths[-1].on_free(action)
+        other = Synth.basic_new('default', server)  # Not registered.
+        server.addr.send_clumped_bundles(
+            None, *(['/n_off', x.node_id] for x in synths[:10]),
+            ['/n_on', synths[0].node_id], ['/n_end', other.node_id],
+            *(['/n_end', x.node_id] for x in synths[10:]))
+        main.wait()
+        self.assertEqual(freed, [synths[-1]])
+        self.assertIs(synths[0].is_running, True)
+        self.assertIs(synths[1].is_running, False)
+        self.assertIs(synths[1].is_playing, True)
+        self.assertIs(synths[10].is_playing, False)
+        self.assertIsNone(other.is_playing)
+        self.assertEqual(len(server._node_watcher.nodes), 10)
+
+    def test_packet_end(self):
+        server = lang_server()
+        server._status_watcher._has_booted = True  # Fake running server.
+        server._status_watcher._notified = True
+        watcher = server._node_watcher
+        synths = [Synth.basic_new('default', server) for _ in range(3)]
+        for synth in synths:
+            synth.register()
+        seen = []
+        synths[0].on_free(
+            lambda node: seen.extend(x.is_playing for x in synths))
+        main._osc_interface._dispatch_messages(
+            [(0, ['/n_end', x.node_id]) for x in synths], server.addr)
+        # Notified after the last message, within the same dispatch.
+        self.assertEqual(seen, [False] * 3)
+        synth = Synth.basic_new('default', server)
+        synth.register(playing=False, running=False)
+        watcher.respond('_n_go', ['/n_go', synth.node_id])
+        self.assertIs(synth.is_running, True)
+        self.assertEqual(watcher.responders, [])
+        watcher.unregister(synth)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -4,11 +4,14 @@ import logging
 import math
 import pathlib
 import shutil
+import tempfile
+from unittest import mock
 
 import sc3
 sc3.init('nrt')
 
 from sc3.base.main import main
+from sc3.base import _oscinterface as osci
 from sc3.base.stream import routine
 from sc3.base.play import play
 from sc3.base.clock import TempoClock
@@ -86,6 +89,70 @@ class NrtTestCase(unittest.TestCase):
         score = main.process()
         self.assertTrue(math.isclose(main.elapsed_time(), 2.0))
 
+    def test_stream(self):
+        @routine
+        def r1():
+            for i in range(20):
+                Server.default.addr.send_bundle(0.25, ['/n_set', 1, 'freq', i])
+                yield 0.5
+
+        def make_score(path=None):
+            main.reset()
+            if path is not None:
+                main.stream_score(path, keep_list=True)
+            r1.reset()
+            r1.play()
+            return main.process(1)
+
+        # Bundles are written while processing, not kept until finish.
+        sizes = []
+        add = osci._OscScoreStream.add
+
+        def sized_add(self, *args):
+            add(self, *args)
+            sizes.append((len(self._pending), self._file.tell()))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            file = pathlib.Path(tmp) / 'test_stream.osc'
+            expected = make_score()
+            with mock.patch.object(osci._OscScoreStream, 'add', sized_add):
+                score = make_score(file)
+            self.assertEqual(score.path, file)
+            self.assertEqual(score.list, expected.list)
+            self.assertEqual(file.read_bytes(), expected.raw)
+            self.assertEqual(score.raw, expected.raw)
+        self.assertEqual(len(sizes), len(expected.list))
+        self.assertLessEqual(max(n for n, _ in sizes), 3)
+        self.assertGreater(sizes[-1][1], len(expected.raw) // 2)
+
+    def test_stream_late(self):
+        # Out of order bundles are merged in sorted runs at finish.
+        main.reset()
+        tmp = tempfile.TemporaryDirectory()
+        file = pathlib.Path(tmp.name) / 'test_stream_late.osc'
+        score = main._osc_interface._osc_score
+        score.stream(file)
+        score._stream._RUN_SIZE = 2
+        try:
+            for seconds, times in ((1, (0.5, 1.5)), (2, (0.25, 0.75, 1.75)),
+                                   (3, (0.5, 2.5, 0.1)), (4, ())):
+                main.main_tt._m_seconds = seconds
+                for time in times:
+                    score.add([time, ['/late', time]])
+            score.finish(3)
+            data = file.read_bytes()
+            times = []
+            while data:
+                size = int.from_bytes(data[:4], 'big')
+                times.append(int.from_bytes(data[12:20], 'big'))
+                data = data[4 + size:]
+            self.assertEqual(times, sorted(times))
+            self.assertEqual(len(times), 10)  # Root node and tail included.
+            self.assertEqual(list(file.parent.glob('*.run')), [])
+        finally:
+            main.reset()
+            tmp.cleanup()
+
 
 if __name__ == '__main__':
     unittest.main()
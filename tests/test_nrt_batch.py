@@ -0,0 +1,117 @@
+import unittest
+import functools
+import pathlib
+import stat
+import sys
+import tempfile
+
+import sc3
+sc3.init('nrt')
+
+from sc3.base.main import main
+from sc3.synth.server import Server
+
+
+# Stand-in for scsynth -N, copies the score to the output file.
+# Arguments: -N osc_file input_file output_file sample_rate ...
+RENDER_PROGRAM = f'''#!{sys.executable}
+import sys, shutil
+shutil.copyfile(sys.argv[2], sys.argv[4])
+sys.exit(int(sys.argv[4].endswith('fail.aiff')))
+'''
+
+
+def make_score(freq):
+    Server.default.addr.send_bundle(1, ['/n_set', 1, 'freq', freq])
+
+
+def section_score():
+    addr = Server.default.addr
+    addr.send_bundle(0, ['/g_new', 2000, 0, 1])  # Setup, in all ranges.
+    for i, time in enumerate([0.5, 1.5, 2.5, 3.25]):
+        addr.send_bundle(time, ['/n_set', 1001 + i, 'freq', 440])
+
+
+def bundles(data):
+    # Time and first message address and int argument of each bundle.
+    ret = []
+    while data:
+        size = int.from_bytes(data[:4], 'big')
+        bundle, data = data[4:4 + size], data[4 + size:]
+        time = int.from_bytes(bundle[8:16], 'big') / 2 ** 32
+        address = bundle[20:bundle.index(b'\0', 20)].decode()
+        args = bundle[bundle.index(b',', 20):]
+        args = args[(len(args.split(b'\0')[0]) // 4 + 1) * 4:]
+        ret.append((round(time, 6), address, int.from_bytes(args[:4], 'big')))
+    return ret
+
+
+def fail_score():
+    raise ValueError('no score')
+
+
+class NrtBatchTestCase(unittest.TestCase):
+    def test_render_batch(self):
+        options = Server.default.options
+        program = options.program
+        with tempfile.TemporaryDirectory() as dir:
+            dir = pathlib.Path(dir)
+            options.program = str(dir / 'render')
+            path = pathlib.Path(options.program)
+            path.write_text(RENDER_PROGRAM)
+            path.chmod(path.stat().st_mode | stat.S_IEXEC)
+
+            funcs = [functools.partial(make_score, i) for i in range(7)]
+            funcs.append(fail_score)
+            paths = [dir / f'{i}.aiff' for i in range(6)]
+            paths += [dir / 'fail.aiff', dir / 'none.aiff']
+            try:
+                results = main.render_batch(
+                    funcs, paths, tailtime=1, workers=2, concurrency=3)
+            finally:
+                options.program = program
+
+            self.assertEqual(
+                results,
+                [(p, 0) for p in paths[:6]] + [(paths[6], 1), (paths[7], None)])
+            for i, path in enumerate(paths[:7]):
+                data = path.read_bytes()
+                self.assertIn(b'/n_set', data)
+                self.assertIn(b'/c_set', data)  # Tail command.
+            self.assertFalse(paths[7].exists())
+
+    def test_ranges(self):
+        options = Server.default.options
+        program = options.program
+        with tempfile.TemporaryDirectory() as dir:
+            dir = pathlib.Path(dir)
+            options.program = str(dir / 'render')
+            path = pathlib.Path(options.program)
+            path.write_text(RENDER_PROGRAM)
+            path.chmod(path.stat().st_mode | stat.S_IEXEC)
+            try:
+                results = main.render_batch(
+                    [section_score, fail_score],
+                    [dir / 'a.aiff', dir / 'b.aiff'], tailtime=0.5,
+                    workers=2, ranges=[(0, 1), (1, 3), (3, None)])
+            finally:
+                options.program = program
+
+            paths = [dir / f'a_{i}.aiff' for i in range(3)]
+            paths += [dir / f'b_{i}.aiff' for i in range(3)]
+            self.assertEqual(
+                results, [(p, 0) for p in paths[:3]] +
+                [(p, None) for p in paths[3:]])
+            scores = [bundles(p.read_bytes()) for p in paths[:3]]
+            setup = [(0, '/g_new', 1), (0, '/g_new', 2000)]
+            self.assertEqual(scores[0], setup + [
+                (0.5, '/n_set', 1001), (1.5, '/c_set', 0)])
+            self.assertEqual(scores[1], setup + [
+                (0.5, '/n_set', 1002), (1.5, '/n_set', 1003),
+                (2.5, '/c_set', 0)])
+            self.assertEqual(scores[2], setup + [
+                (0.25, '/n_set', 1004), (0.75, '/c_set', 0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
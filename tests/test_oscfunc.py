@@ -7,6 +7,8 @@ sc3.init()
 from sc3.base.main import main
 from sc3.base.netaddr import NetAddr
 from sc3.base.responders import OscFunc
+from sc3.base._oscmatch import osc_rematch_pattern
+from sc3.base._oscmatch import OscAddressIndex
 
 
 class OscFuncTestCase(unittest.TestCase):
@@ -122,6 +124,26 @@ class OscFuncTestCase(unittest.TestCase):
         oscf.free()
         self.assertTrue(test_ok, 'test time expired')
 
+    def test_matching_index(self):
+        addresses = [
+            '/a', '/ab', '/a/b', '/a/bc', '/a/b/c', '/b', '/b/a', '/n_go',
+            '/n_end', '/tr', '/tr/1', '/foo-bar', '/x/y/z/w']
+        patterns = [
+            '/a', '/a/b', '/a/b/c', '/b', '/n_*', '/*', '/?', '/a/*', '/*/b',
+            '/[ab]', '/[!a]', '/{a,b}/b', '/{a,n_go}', '/tr', '/foo-bar',
+            '/foo-]', '/a,/b', '/x/y/z/w', '/x/?/z', '/none', '/a/b/c/d']
+        index = OscAddressIndex(addresses)
+        for pattern in patterns:
+            with self.subTest(pattern=pattern):
+                expected = [
+                    a for a in addresses if osc_rematch_pattern(pattern, a)]
+                result = [
+                    a for a in index.candidates(pattern)
+                    if osc_rematch_pattern(pattern, a)]
+                self.assertEqual(result, expected)
+        self.assertEqual(index.candidates('/a/b/c'), ['/a/b/c'])
+        self.assertEqual(index.candidates('/b'), ['/b', '/b/a'])
+
     def test_enable_disable(self):
         osc_addr = '/enable_disable_msg'
 
@@ -0,0 +1,203 @@
+
+import unittest
+
+import sc3
+sc3.init('nrt')
+
+from sc3.base.main import main
+from sc3.base.stream import stream, StopStream
+from sc3.synth.systemdefs import SystemDefs
+from sc3.seq import event as evt
+from sc3.seq.pattern import Punop
+from sc3.seq.patterns.eventpatterns import Pbind, Pmono, Ppar, Pkey
+from sc3.seq.patterns.listpatterns import Pseq, Pser
+from sc3.seq.patterns.filterpatterns import Pn, Pdur, Pconst
+from sc3.seq.patterns.valuepatterns import Pseries, Pgeom
+from sc3.seq.patterns.funcpatterns import Pfunc
+
+
+def onsets(s, start=0.0):
+    # Onset, degree and amp of the events of an event stream.
+    ret = []
+    time = start
+    try:
+        while True:
+            e = s.next(evt.event())
+            if evt.is_rest(e):
+                ret.append((round(time, 9), None, None))
+            else:
+                ret.append((round(time, 9), e.get('degree'), e.get('amp')))
+            time += float(e('delta'))
+    except StopStream:
+        pass
+    return ret, time
+
+
+class PatternSeekTestCase(unittest.TestCase):
+    def assert_seek_values(self, p, n):
+        values = list(stream(p))
+        s = stream(p)
+        left = s.seek(n)
+        self.assertEqual(list(s), values[n:])
+        self.assertEqual(left, max(0, n - len(values)))
+
+    def assert_seek_events(self, p, beats):
+        events, total = onsets(stream(p))
+        s = stream(p)
+        left = s.seek(beats)
+        result, end = onsets(s, beats)
+        self.assertAlmostEqual(left, max(0.0, beats - total))
+        self.assertAlmostEqual(end, max(total, beats))
+        if result and result[0][0] < beats + 1e-9 and result[0][1] is None:
+            del result[0]  # Rest until the next event.
+        expected = [e for e in events if e[0] >= beats]
+        self.assertEqual(
+            [e for e in result if e[1] is not None],
+            [e for e in expected if e[1] is not None])
+
+    def test_value_patterns(self):
+        for n in (0, 1, 5, 12, 30):
+            self.assert_seek_values(Pseq([1, 2, 3], 4), n)
+            self.assert_seek_values(Pseq([1, Pseq([2, 3]), 4], 3, 1), n)
+            self.assert_seek_values(Pser([1, 2, 3], 7, 1), n)
+            self.assert_seek_values(Pseries(1, 2, 20), n)
+            self.assert_seek_values(Pseries(1, Pseq([1, 2, 3], 3)), n)
+            self.assert_seek_values(Pgeom(1, 3, 10), n)
+            self.assert_seek_values(Pseries(0, 0.1, 25), n)
+            self.assert_seek_values(Pgeom(1, 1.1, 25), n)
+            self.assert_seek_values(Pconst(Pseq([1, 2, 3], 9), 10), n)
+            self.assert_seek_values(Pn(Pseq([1, 2]), 3), n)
+            self.assert_seek_values(Pn(5, 10), n)
+            self.assert_seek_values(Pseq([1, 2, 3], 4) * Pseries(0, 1, 9), n)
+
+    def test_value_stream(self):
+        s = stream(Pseq([1, 2, 3, 4, 5]))
+        self.assertEqual(s.next(), 1)
+        self.assertEqual(s.seek(2), 0)
+        self.assertEqual(s.next(), 4)
+        self.assertEqual(s.seek(1), 0)
+        self.assertEqual(s.seek(1), 1)
+        self.assertRaises(StopStream, s.next)
+        s.reset()
+        s.seek(3)
+        s.reset()
+        self.assertEqual(s.next(), 1)
+
+    def test_event_patterns(self):
+        patterns = [
+            Pbind({
+                'degree': Pseq(range(8), 3),
+                'dur': Pseq([0.5, 0.25, 0.75], 7),
+                'amp': Pseries(0, 1)}),
+            Pbind({
+                'dur': 0.5,
+                'degree': Pseries(0, 1, 20),
+                'amp': Pkey('degree') * 2}),
+            Pseq([
+                Pbind({'degree': Pseq([1, 2, 3]), 'dur': 1}),
+                Pbind({'degree': Pn(7, 5), 'dur': 0.5})], 3),
+            Pser([
+                Pbind({'degree': Pseq([1, 2]), 'dur': 0.5}),
+                Pbind({'degree': Pseq([3]), 'dur': 1})], 7),
+            Pn(Pbind({'degree': Pseq([1, 2]), 'dur': 1.5}), 4),
+            Pn(Pdur(2.5, Pbind({'degree': Pseries(), 'dur': 1}), quant=4), 3),
+            Ppar(
+                Pbind({'degree': Pseq(range(10)), 'dur': 1}),
+                Pbind({'degree': Pseq(range(100, 110)), 'dur': 0.75})),
+            Pbind({'degree': Pgeom(1, 2), 'dur': Pconst(Pseq([1, 0.5], 9), 6)})]
+        for p in patterns:
+            for beats in (0, 0.5, 1, 2.25, 3, 5.5, 7, 11, 30):
+                with self.subTest(pattern=p, beats=beats):
+                    self.assert_seek_events(p, beats)
+
+    def test_float_deltas(self):
+        # Summed non dyadic durations land on the event at the seek point.
+        s = stream(Pbind({'dur': 0.1, 'midinote': Pseries(0, 1)}))
+        self.assertEqual(s.seek(1.0), 0)
+        e = s.next(evt.event())
+        self.assertFalse(evt.is_rest(e))
+        self.assertEqual((e['midinote'], e('delta')), (10, 0.1))
+        for p in (
+                Pbind({'dur': Pseq([0.1, 0.2], float('inf'))}),
+                Pn(Pbind({'dur': Pseq([0.1, 0.2])}), 20),
+                Pseq([Pbind({'dur': 0.1, 'degree': Pseq([1, 2, 3])})], 20)):
+            with self.subTest(pattern=p):
+                s = stream(p)
+                self.assertEqual(s.seek(3.0), 0)
+                e = s.next(evt.event())
+                self.assertFalse(evt.is_rest(e))
+                self.assertAlmostEqual(e('delta'), 0.1)
+        s = stream(Pbind({'dur': Pseq([0.1], 10), 'degree': Pseries()}))
+        self.assertEqual(s.seek(1.0), 0)
+        self.assertRaises(StopStream, s.next, evt.event())
+        s = stream(Ppar(
+            Pbind({'dur': 0.1, 'degree': Pseries()}),
+            Pbind({'dur': 0.3, 'degree': Pseries(100)})))
+        s.seek(0.9)
+        self.assertEqual(
+            sorted(s.next(evt.event())['degree'] for _ in range(2)),
+            [9, 103])
+
+    def test_delta_only(self):
+        calls = []
+
+        def count(x):
+            calls.append(x)
+            return x
+
+        p = Pbind({'dur': 0.25, 'degree': Punop(count, Pseries())})
+        s = stream(p)
+        s.seek(64)
+        self.assertEqual(calls, [])
+        self.assertEqual(s.next(evt.event())['degree'], 256)
+
+    def test_function_keys(self):
+        # Functions are evaluated, they can read other keys.
+        patterns = [
+            Pbind({
+                'degree': Pseq([0, 1, 2], 5),
+                'amp': Pfunc(lambda e: e['degree'] + 1),
+                'dur': 0.5}),
+            Pbind({
+                'dur': 0.5,
+                'degree': Pseq([0, 1, 2], 4),
+                'amp': Pfunc(lambda e: e['degree'] + 1)}),
+            Pbind({
+                'amp': Pfunc(lambda e: 0.1),
+                'dur': Pseq([0.5, 0.25], 9),
+                'degree': Pseries()})]
+        for p in patterns:
+            for beats in (0, 1, 2.25, 4, 30):
+                with self.subTest(pattern=p, beats=beats):
+                    self.assert_seek_events(p, beats)
+        s = stream(patterns[0])
+        s.seek(4)
+        e = s.next(evt.event())
+        self.assertEqual((e['degree'], e['amp']), (2, 3))
+
+    def test_play(self):
+        SystemDefs.add_synthdef('default')
+        Pbind({'degree': Pseq(range(8)), 'dur': 0.5}).play(start_beat=2.25)
+        Pmono('default', {
+            'degree': Pseq(range(8)), 'dur': 0.5}).play(start_beat=3)
+        score = main.process()
+        main.reset()
+        s_new = [(t, m[6]) for t, m in score.list if m[0] == '/s_new']
+        self.assertEqual(len(s_new), 4)
+        self.assertAlmostEqual(s_new[0][0], 0.0)  # Pmono, new node.
+        self.assertAlmostEqual(s_new[0][1], 493.8833012561241)
+        self.assertAlmostEqual(s_new[1][0], 0.25)  # After the rest.
+        self.assertAlmostEqual(s_new[1][1], 440.0)
+        Pbind({
+            'degree': Pseq(range(8)),
+            'amp': Pfunc(lambda e: e['degree'] * 0.01),
+            'dur': 0.5}).play(start_beat=3)
+        score = main.process()
+        main.reset()
+        s_new = [m for _, m in score.list if m[0] == '/s_new']
+        self.assertEqual(len(s_new), 2)
+        self.assertAlmostEqual(s_new[0][8], 0.06)  # Amp of degree 6.
+
+
+if __name__ == '__main__':
+    unittest.main()
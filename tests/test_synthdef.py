@@ -1,6 +1,14 @@
 
 import unittest
+from unittest import mock
 from typing import List
+import tempfile
+import pathlib
+import functools
+import importlib.util
+import subprocess
+import sys
+import os
 
 import sc3
 sc3.init()
@@ -8,9 +16,18 @@ sc3.init()
 from sc3.synth.synthdef import SynthDef, synthdef, _logger
 from sc3.synth.ugens.line import DC
 from sc3.synth.ugens.inout import Out
+from sc3.synth.ugens.oscillators import SinOsc
+from sc3.synth.ugen import UGen, OutputProxy
 from sc3.synth.spec import spec
-from sc3.synth.synthdesc import MdPlugin
+from sc3.synth.synthdesc import MdPlugin, SynthDesc, SynthDescLib
+from sc3.synth import _defcache
 from sc3.base.platform import Platform
+from sc3.base.model import NotificationCenter
+from sc3.base import _hooks as hks
+
+
+np = hks.import_optional_module('numpy')
+has_numpy = not isinstance(np, hks.OptionalModuleProxy)
 
 
 _logger.setLevel('ERROR')
@@ -20,6 +37,14 @@ _logger.setLevel('ERROR')
 ir, ar, kr, tr = 'ir', 'ar', 'kr', 'tr'
 
 
+# Module level for build_many worker processes.
+def parallel_a(freq=440, amp=0.1):
+    Out.ar(0, SinOsc.ar(freq) * amp)
+
+def parallel_b(freq=220, amp=0.1):
+    Out.ar(0, SinOsc.ar(freq) * amp + SinOsc.ar(freq * 2) * amp)
+
+
 class SynthDefTestCase(unittest.TestCase):
     def test_build(self):
         def graph():
@@ -277,6 +302,208 @@ class SynthDefTestCase(unittest.TestCase):
         self.assertEqual(sd._all_control_names[2].default_value, 0.0)
         self.assertEqual(sd._all_control_names[2].lag, 0.0)
 
+    def test_graph_rewrite(self):
+        def graph():
+            a, b, c, d = [SinOsc.ar(i) for i in range(4)]
+            mix = [a + b + c + d for _ in range(50)]
+            Out.ar(0, [a * b + c, a - (-b), -a + b, *mix])
+
+        sd = SynthDef('test', graph)
+        names = [type(u).__name__ for u in sd._children]
+        self.assertEqual(names.count('MulAdd'), 1)
+        self.assertEqual(names.count('Sum4'), 50)
+        self.assertEqual(names.count('UnaryOpUGen'), 0)
+        out = sd._children[-1]
+        self.assertEqual(
+            [type(u).__name__ for u in out.inputs[1:4]],
+            ['MulAdd', 'BinaryOpUGen', 'BinaryOpUGen'])
+        for i, ugen in enumerate(sd._children):
+            with self.subTest(ugen=i):
+                self.assertEqual(ugen._synth_index, i)
+                for input in ugen.inputs:
+                    if isinstance(input, OutputProxy):
+                        input = input.source_ugen
+                    if isinstance(input, UGen):
+                        self.assertIs(sd._children[input._synth_index], input)
+                        self.assertLess(input._synth_index, i)
+
+    def test_cache(self):
+        def graph(freq=440, amp=0.1):
+            Out.ar(0, SinOsc.ar(freq) * amp + CACHE_TEST_OFFSET)
+
+        def graph2(freq=220, amp=0.1):
+            Out.ar(0, SinOsc.ar(freq) * amp + CACHE_TEST_OFFSET)
+
+        global CACHE_TEST_OFFSET
+        CACHE_TEST_OFFSET = 0.5
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+                _defcache, 'cache_dir', lambda: pathlib.Path(tmp)):
+            built = SynthDef('test', graph, cache=True)
+            self.assertEqual(len(list(pathlib.Path(tmp).iterdir())), 1)
+            cached = SynthDef('test', graph, cache=True)
+            self.assertEqual(cached._children, [])
+            self.assertEqual(bytes(cached.as_bytes()), bytes(built.as_bytes()))
+            self.assertEqual(cached._callable_args, ['freq', 'amp'])
+            desc = SynthDesc.new_from(cached)
+            self.assertEqual(desc.control_names, ['freq', 'amp'])
+
+            # Invalidation.
+            self.assertNotEqual(SynthDef('test', graph2, cache=True)._children, [])
+            CACHE_TEST_OFFSET = 0.25
+            self.assertNotEqual(SynthDef('test', graph, cache=True)._children, [])
+            self.assertNotEqual(SynthDef('test2', graph, cache=True)._children, [])
+            self.assertNotEqual(SynthDef('test', graph)._children, [])
+            self.assertEqual(len(list(pathlib.Path(tmp).iterdir())), 4)
+
+            # Eviction and clear.
+            with mock.patch.object(SynthDef, 'cache_max_size', 1):
+                SynthDef('test3', graph, cache=True)
+            self.assertEqual(len(list(pathlib.Path(tmp).iterdir())), 0)
+            SynthDef('test', graph, cache=True)
+            SynthDef.clear_cache()
+            self.assertEqual(len(list(pathlib.Path(tmp).iterdir())), 0)
+
+    def test_cache_sources(self):
+        def graph(freq=440):
+            Out.ar(0, SinOsc.ar(freq) * CACHE_TEST_MODULE.amp())
+
+        def key():
+            return _defcache.make_key('test', graph, None, None, None)
+
+        def load(source):
+            path.write_text(source)
+            spec = importlib.util.spec_from_file_location('cache_test', path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module
+
+        global CACHE_TEST_MODULE
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / 'cache_test.py'
+            CACHE_TEST_MODULE = load('def amp():\n    return 0.1\n')
+            before = key()
+            self.assertEqual(key(), before)
+            CACHE_TEST_MODULE = load('def amp():\n    return 0.25\n')
+            self.assertNotEqual(key(), before)
+
+        # Callables without code are built without cache.
+        partial = functools.partial(graph, freq=220)
+        self.assertIsNone(
+            _defcache.make_key('test', partial, None, None, None))
+
+    def test_cache_values(self):
+        def graph(freq=440):
+            Out.ar(0, SinOsc.ar(freq) * CACHE_TEST_VALUE[0])
+
+        def key():
+            return _defcache.make_key('test', graph, None, None, None)
+
+        global CACHE_TEST_VALUE
+        CACHE_TEST_VALUE = [0.1, {'a': (1, 2)}, 'b']
+        self.assertIsNotNone(key())
+        self.assertEqual(key(), key())
+
+        # Other objects miss the cache.
+        for value in (object(), [object()], functools.partial(graph)):
+            CACHE_TEST_VALUE = value
+            self.assertIsNone(key())
+
+    @unittest.skipUnless(has_numpy, 'numpy is not installed')
+    def test_cache_arrays(self):
+        def graph(freq=440):
+            Out.ar(0, SinOsc.ar(freq) * CACHE_TEST_VALUE[0])
+
+        def key():
+            return _defcache.make_key('test', graph, None, None, None)
+
+        # Truncated reprs of different arrays are the same.
+        global CACHE_TEST_VALUE
+        a = np.zeros(2000)
+        b = a.copy()
+        b[1000] = 1
+        self.assertEqual(repr(a), repr(b))
+        CACHE_TEST_VALUE = a
+        key_a = key()
+        CACHE_TEST_VALUE = b
+        self.assertNotEqual(key(), key_a)
+        CACHE_TEST_VALUE = a.astype('float32')
+        self.assertNotEqual(key(), key_a)
+        CACHE_TEST_VALUE = a.reshape(2, 1000)
+        self.assertNotEqual(key(), key_a)
+        CACHE_TEST_VALUE = np.array([None])
+        self.assertIsNone(key())
+
+    def test_build_many(self):
+        defs = [parallel_a, ('other', parallel_b, {'variants': {'v': {}}})]
+        result = SynthDef.build_many(defs, workers=2)
+        expected = [
+            SynthDef('parallel_a', parallel_a),
+            SynthDef('other', parallel_b, variants={'v': {}})]
+        for sd, ex in zip(result, expected):
+            self.assertEqual(sd.name, ex.name)
+            self.assertEqual(bytes(sd.as_bytes()), bytes(ex.as_bytes()))
+            self.assertEqual(sd._callable_args, ['freq', 'amp'])
+        self.assertIs(result[0].func, parallel_a)
+        self.assertEqual(result[1].variants, {'v': {}})
+
+        source = (
+            'from sc3.synth.synthdef import synthdef\n'
+            'from sc3.synth.ugens.inout import Out\n'
+            'from sc3.synth.ugens.oscillators import SinOsc\n'
+            '@synthdef\n'
+            'def dir_def{0}(freq={0}00):\n'
+            '    Out.ar(0, SinOsc.ar(freq))\n')
+        with tempfile.TemporaryDirectory() as tmp:
+            for i in (1, 2, 3):
+                (pathlib.Path(tmp) / f'defs{i}.py').write_text(source.format(i))
+            lib = SynthDescLib('build_directory_test')
+            listener = mock.Mock()
+            added = []
+            NotificationCenter.register(
+                lib, 'sdesc_added', listener,
+                lambda obj, msg, listener, desc: added.append(desc))
+            descs = lib.build_directory(tmp, workers=2)
+            NotificationCenter.unregister(lib)
+        self.assertEqual(
+            [d.name for d in descs], ['dir_def1', 'dir_def2', 'dir_def3'])
+        self.assertEqual(set(map(id, added)), set(map(id, descs)))
+        self.assertIs(lib.at('dir_def2'), descs[1])
+        self.assertEqual(descs[2].controls[0].default_value, 300)
+
+    def test_build_many_rt_script(self):
+        # Workers import the script as __main__, its top level init()
+        # must not start RtMain in each of them.
+        source = (
+            'import sc3\n'
+            'sc3.init()\n'
+            'from sc3.synth.synthdef import SynthDef\n'
+            'from sc3.synth.ugens.inout import Out\n'
+            'from sc3.synth.ugens.oscillators import SinOsc\n'
+            'def graph(freq=440):\n'
+            '    Out.ar(0, SinOsc.ar(freq))\n'
+            'def worker_main():\n'
+            '    import sc3.base.main\n'
+            '    return sc3.base.main.main.__name__\n'
+            'if __name__ == "__main__":\n'
+            '    defs = [(f"d{i}", graph, {}) for i in range(12)]\n'
+            '    result = SynthDef.build_many(defs, workers=12)\n'
+            '    assert [d.name for d in result] == [d[0] for d in defs]\n'
+            '    with sc3._nrt_pool(2) as pool:\n'
+            '        print(set(pool.starmap(worker_main, [()] * 4)))\n')
+        with tempfile.TemporaryDirectory() as tmp:
+            script = pathlib.Path(tmp) / 'rt_script.py'
+            script.write_text(source)
+            env = dict(os.environ)
+            env['PYTHONPATH'] = os.pathsep.join(
+                [str(pathlib.Path(sc3.__file__).parents[1])]
+                + sys.path[1:])
+            ret = subprocess.run(
+                [sys.executable, str(script)], env=env, cwd=tmp,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                timeout=60)
+        self.assertEqual(ret.returncode, 0, ret.stderr.decode())
+        self.assertEqual(ret.stdout.decode().strip(), "{'NrtMain'}")
+
     # def test_optimize_graph(sef):
     #     ...  # To test empty synths.
 
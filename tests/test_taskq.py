@@ -0,0 +1,77 @@
+import unittest
+import random
+
+from sc3.base._taskq import TaskQueue
+
+
+class TaskQueueTestCase(unittest.TestCase):
+    def test_order(self):
+        q = TaskQueue()
+        prios = [random.random() for _ in range(1000)]
+        for i, p in enumerate(prios):
+            q.add(p, i)
+        self.assertEqual(len(q), 1000)
+        result = []
+        while not q.empty():
+            self.assertEqual(q.peek(), q.peek())
+            result.append(q.pop()[0])
+        self.assertEqual(result, sorted(prios))
+        self.assertRaises(KeyError, q.pop)
+        self.assertRaises(KeyError, q.peek)
+
+    def test_fifo_ties(self):
+        q = TaskQueue()
+        for i in range(10):
+            q.add(1.0, i)
+        self.assertEqual([q.pop()[1] for _ in range(10)], list(range(10)))
+
+    def test_remove_and_update(self):
+        q = TaskQueue()
+        tasks = list(range(500))
+        for t in tasks:
+            q.add(float(t), t)
+        removed = set(random.sample(tasks, 400))
+        for t in removed:
+            q.remove(t)
+        q.remove('not_there')
+        q.add(-1.0, 499)  # Update prio.
+        expected = sorted(
+            (-1.0 if t == 499 else float(t), t)
+            for t in tasks if t not in removed or t == 499)
+        self.assertEqual(list(q), expected)
+        self.assertEqual(q.peek(), expected[0])
+        self.assertEqual(q.peek(False), expected[-1])
+        self.assertLessEqual(q._removed_counter, len(q))
+        self.assertEqual([q.pop() for _ in range(len(q))], expected)
+        self.assertTrue(q.empty())
+
+    def test_peek_largest(self):
+        q = TaskQueue()
+        q.add(1, 'a')
+        q.add(3, 'b')
+        q.add(2, 'c')
+        self.assertEqual(q.peek(False), (3, 'b'))
+        q.remove('b')
+        self.assertEqual(q.peek(False), (2, 'c'))
+        q.add(3, 'd')
+        q.add(3, 'e')
+        self.assertEqual(q.peek(False), (3, 'e'))
+        q.pop()
+        q.pop()
+        q.pop()
+        self.assertEqual(q.peek(False), (3, 'e'))
+        q.pop()
+        self.assertRaises(KeyError, q.peek, False)
+        q.add(0, 'f')
+        self.assertEqual(q.peek(False), (0, 'f'))
+
+    def test_clear(self):
+        q = TaskQueue()
+        q.add(0, 'a')
+        q.clear()
+        self.assertTrue(q.empty())
+        self.assertEqual(list(q), [])
+
+
+if __name__ == '__main__':
+    unittest.main()